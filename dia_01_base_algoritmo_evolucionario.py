@@ -19,6 +19,7 @@ buscando o valor máximo de x² dentro de um intervalo [-10, 10].
 
 import random
 import matplotlib.pyplot as plt
+from ga_real_vetorizado import run_real_ga
 
 # -----------------------------------------------------------
 # 1️⃣ Parâmetros do algoritmo
@@ -37,6 +38,7 @@ def fitness(x: float) -> float:
     """
     Calcula o valor de aptidão (fitness) de um indivíduo.
     Aqui queremos maximizar f(x) = x².
+    Funciona tanto para um float quanto para um array NumPy de indivíduos.
     """
     return x ** 2
 
@@ -127,7 +129,24 @@ def evolutionary_algorithm():
 
 
 # -----------------------------------------------------------
-# 8️⃣ Execução do código
+# 8️⃣ Versão vetorizada (população inteira em arrays NumPy)
+# -----------------------------------------------------------
+def evolutionary_algorithm_vectorized(pop_size=100_000, seed=42):
+    """
+    Mesmo EA (torneio de 2, média dos pais, mutação uniforme em [-1, 1],
+    sem elitismo) executado pelo motor vetorizado de ga_real_vetorizado.
+    """
+    return run_real_ga(
+        fitness, X_MIN, X_MAX,
+        pop_size=pop_size, generations=NUM_GENERATIONS,
+        tournament_k=2, crossover="average",
+        mutation_rate=MUTATION_RATE, mutation_scale=1.0, mutation_distribution="uniform",
+        elite_size=0, seed=seed,
+    )
+
+
+# -----------------------------------------------------------
+# 9️⃣ Execução do código
 # -----------------------------------------------------------
 if __name__ == "__main__":
     evolutionary_algorithm()
@@ -27,8 +27,10 @@ O script imprime o progresso e plota a curva de convergência.
 """
 
 import random
-import math
+import numpy as np
 import matplotlib.pyplot as plt
+from ga_real_vetorizado import run_real_ga
+from populacao import Population
 
 # ----------------------------------------------------------
 # 1️⃣ Parâmetros do GA
@@ -50,8 +52,9 @@ def objective_function(x: float) -> float:
     """
     Função multimodal usada para testar GAs.
     Possui vários máximos locais.
+    Aceita um float ou um array NumPy (avaliação da população em lote).
     """
-    return x * math.sin(10 * math.pi * x) + 1.0
+    return x * np.sin(10 * np.pi * x) + 1.0
 
 
 # -----------------------------------------------------------
@@ -66,9 +69,12 @@ def initialize_population():
 # 4️⃣ Seleção (torneio de 2)
 # -----------------------------------------------------------
 def tournament_selection(population):
-    """Seleciona dois indivíduos aleatórios e retorna o melhor."""
-    a, b = random.sample(population, 2)
-    return a if objective_function(a) > objective_function(b) else b
+    """
+    Seleciona dois indivíduos aleatórios e retorna o melhor.
+    Usa o fitness já calculado em `population` (sem reavaliar).
+    """
+    a, b = random.sample(range(len(population)), 2)
+    return population[a] if population.fitness[a] > population.fitness[b] else population[b]
 
 
 # -----------------------------------------------------------
@@ -104,14 +110,15 @@ def mutate(x):
 # 7️⃣ Loop evolutivo principal
 # -----------------------------------------------------------
 def genetic_algorithm():
-    population = initialize_population()
+    # cada geração é avaliada uma única vez (fitness em cache na Population)
+    population = Population(initialize_population(), objective_function)
     best_scores = []
 
     for generation in range(NUM_GENERATIONS):
         new_population = []
 
         # Elitismo simples — mantém o melhor da geração anterior
-        best = max(population, key=objective_function)
+        best, _ = population.best()
         new_population.append(best)
 
         # Gera nova população
@@ -123,16 +130,17 @@ def genetic_algorithm():
             child = mutate(child)
             new_population.append(child)
 
-        # Atualiza população
-        population = new_population
+        # Atualiza população (avaliando cada indivíduo uma vez)
+        population = population.next_generation(new_population)
 
-        # Avalia o melhor indivíduo
-        best_individual = max(population, key=objective_function)
-        best_value = objective_function(best_individual)
+        # Melhor indivíduo (fitness em cache)
+        best_individual, best_value = population.best()
         best_scores.append(best_value)
 
         print(f"Geração {generation+1:02d} | Melhor x = {best_individual:.5f} | f(x) = {best_value:.5f}")
 
+    print(f"Avaliações da função objetivo: {population.evaluations}")
+
     # Gráfico da convergência
     plt.plot(best_scores, label="Melhor Fitness")
     plt.title("Convergência — Algoritmo Genético Clássico")
@@ -144,7 +152,24 @@ def genetic_algorithm():
 
 
 # -----------------------------------------------------------
-# 8️⃣ Execução
+# 8️⃣ Versão vetorizada (população inteira em arrays NumPy)
+# -----------------------------------------------------------
+def genetic_algorithm_vectorized(pop_size=100_000, seed=RANDOM_SEED):
+    """
+    Mesmo GA (torneio de 2, BLX-α, mutação gaussiana, elitismo de 1)
+    com a geração inteira em operações de array (ga_real_vetorizado).
+    """
+    return run_real_ga(
+        objective_function, X_MIN, X_MAX,
+        pop_size=pop_size, generations=NUM_GENERATIONS,
+        tournament_k=2, crossover="blend", crossover_rate=CROSSOVER_RATE, alpha=0.5,
+        mutation_rate=MUTATION_RATE, mutation_scale=0.1,
+        elite_size=1, seed=seed,
+    )
+
+
+# -----------------------------------------------------------
+# 9️⃣ Execução
 # -----------------------------------------------------------
 if __name__ == "__main__":
     genetic_algorithm()
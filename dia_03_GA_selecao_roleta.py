@@ -19,8 +19,10 @@ Ao final, será plotado o desempenho (melhor fitness) de cada método.
 """
 
 import random
-import math
+import numpy as np
 import matplotlib.pyplot as plt
+from ga_real_vetorizado import run_real_ga
+from populacao import Population
 
 # -----------------------------------------------------------
 # 1️⃣ Parâmetros do GA
@@ -39,8 +41,8 @@ random.seed(RANDOM_SEED)
 # 2️⃣ Função objetivo
 # -----------------------------------------------------------
 def objective_function(x: float) -> float:
-    """Função multimodal usada para testar o desempenho do GA."""
-    return x * math.sin(10 * math.pi * x) + 1.0
+    """Função multimodal usada para testar o desempenho do GA (float ou array NumPy)."""
+    return x * np.sin(10 * np.pi * x) + 1.0
 
 
 # -----------------------------------------------------------
@@ -55,9 +57,9 @@ def initialize_population():
 # 4️⃣ Seleção por Torneio
 # -----------------------------------------------------------
 def tournament_selection(population, k=2):
-    """Seleciona o melhor de k indivíduos aleatórios."""
-    candidates = random.sample(population, k)
-    return max(candidates, key=objective_function)
+    """Seleciona o melhor de k indivíduos aleatórios (fitness em cache)."""
+    candidates = random.sample(range(len(population)), k)
+    return population[max(candidates, key=population.fitness.__getitem__)]
 
 
 # -----------------------------------------------------------
@@ -66,23 +68,13 @@ def tournament_selection(population, k=2):
 def roulette_selection(population):
     """
     Seleciona um indivíduo proporcional ao seu fitness.
-    Implementa o conceito de 'roleta viciada' usado em GAs clássicos.
+    Implementa o conceito de 'roleta viciada' usado em GAs clássicos:
+    - a roda (fitness acumulado) é montada uma única vez por geração,
+      a partir do fitness já em cache na Population
+    - cada giro sorteia r ∈ [0, soma) e localiza a fatia por busca binária,
+      O(log N) em vez de normalizar e varrer a população a cada sorteio
     """
-    # Avalia fitness e soma total
-    fitness_values = [objective_function(ind) for ind in population]
-    total_fitness = sum(fitness_values)
-
-    # Normaliza fitness (probabilidade de seleção)
-    probs = [f / total_fitness for f in fitness_values]
-
-    # Seleciona aleatoriamente conforme probabilidade acumulada
-    r = random.random()
-    cumulative = 0
-    for ind, p in zip(population, probs):
-        cumulative += p
-        if r <= cumulative:
-            return ind
-    return population[-1]  # segurança
+    return population.roulette()
 
 
 # -----------------------------------------------------------
@@ -112,14 +104,14 @@ def mutate(x):
 # -----------------------------------------------------------
 def run_genetic_algorithm(selection_method, label):
     """Executa o GA completo usando o método de seleção especificado."""
-    population = initialize_population()
+    population = Population(initialize_population(), objective_function)
     best_scores = []
 
     for generation in range(NUM_GENERATIONS):
         new_population = []
 
         # elitismo simples
-        best = max(population, key=objective_function)
+        best, _ = population.best()
         new_population.append(best)
 
         while len(new_population) < POP_SIZE:
@@ -130,20 +122,39 @@ def run_genetic_algorithm(selection_method, label):
             child = mutate(child)
             new_population.append(child)
 
-        population = new_population
+        population = population.next_generation(new_population)
 
-        best_ind = max(population, key=objective_function)
-        best_val = objective_function(best_ind)
+        best_ind, best_val = population.best()
         best_scores.append(best_val)
 
         if generation % 10 == 0:
             print(f"[{label}] Geração {generation:02d} | Melhor f(x) = {best_val:.5f}")
 
+    print(f"[{label}] Avaliações da função objetivo: {population.evaluations}")
     return best_scores
 
 
 # -----------------------------------------------------------
-# 8️⃣ Execução e comparação dos métodos
+# 8️⃣ Versão vetorizada (população inteira em arrays NumPy)
+# -----------------------------------------------------------
+def run_genetic_algorithm_vectorized(selection="tournament", pop_size=100_000, seed=RANDOM_SEED):
+    """
+    GA executado pelo motor vetorizado (ga_real_vetorizado).
+    selection: "tournament", "roulette" (acumulada + busca binária)
+    ou "sus" (amostragem estocástica universal);
+    a roda é montada uma vez por geração e todos os pais saem de uma chamada.
+    """
+    return run_real_ga(
+        objective_function, X_MIN, X_MAX,
+        pop_size=pop_size, generations=NUM_GENERATIONS,
+        tournament_k=2, selection=selection, crossover="blend", crossover_rate=CROSSOVER_RATE, alpha=0.5,
+        mutation_rate=MUTATION_RATE, mutation_scale=0.1,
+        elite_size=1, seed=seed,
+    )
+
+
+# -----------------------------------------------------------
+# 9️⃣ Execução e comparação dos métodos
 # -----------------------------------------------------------
 if __name__ == "__main__":
     scores_tournament = run_genetic_algorithm(tournament_selection, "Torneio")
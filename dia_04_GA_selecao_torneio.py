@@ -21,8 +21,10 @@ Serão comparados:
 """
 
 import random
-import math
+import numpy as np
 import matplotlib.pyplot as plt
+from ga_real_vetorizado import run_real_ga
+from populacao import Population
 
 # -----------------------------------------------------------
 # 1️⃣ Parâmetros Base do GA
@@ -39,8 +41,8 @@ random.seed(42)
 # 2️⃣ Função objetivo
 # -----------------------------------------------------------
 def objective_function(x):
-    """Função multimodal de teste."""
-    return x * math.sin(10 * math.pi * x) + 1.0
+    """Função multimodal de teste (float ou array NumPy)."""
+    return x * np.sin(10 * np.pi * x) + 1.0
 
 
 # -----------------------------------------------------------
@@ -54,9 +56,9 @@ def initialize_population():
 # 4️⃣ Seleção por Torneio
 # -----------------------------------------------------------
 def tournament_selection(population, k=2):
-    """Seleciona o melhor indivíduo entre k escolhidos aleatoriamente."""
-    candidates = random.sample(population, k)
-    return max(candidates, key=objective_function)
+    """Seleciona o melhor indivíduo entre k escolhidos aleatoriamente (fitness em cache)."""
+    candidates = random.sample(range(len(population)), k)
+    return population[max(candidates, key=population.fitness.__getitem__)]
 
 
 # -----------------------------------------------------------
@@ -87,7 +89,7 @@ def mutate(x):
 # 6️⃣ Loop do GA
 # -----------------------------------------------------------
 def run_ga(k_tournament):
-    population = initialize_population()
+    population = Population(initialize_population(), objective_function)
     best_scores = []
 
     for gen in range(NUM_GENERATIONS):
@@ -95,7 +97,7 @@ def run_ga(k_tournament):
         new_population = []
 
         # Elitismo explícito: sempre preservamos o melhor
-        best = max(population, key=objective_function)
+        best, _ = population.best()
         new_population.append(best)
 
         while len(new_population) < POP_SIZE:
@@ -106,19 +108,34 @@ def run_ga(k_tournament):
             child = mutate(child)
             new_population.append(child)
 
-        population = new_population
+        population = population.next_generation(new_population)
 
-        best_gen = max(population, key=objective_function)
-        best_scores.append(objective_function(best_gen))
+        _, best_val = population.best()
+        best_scores.append(best_val)
 
         if gen % 10 == 0:
             print(f"[k={k_tournament}] Geração {gen:02d} | Melhor f(x) = {best_scores[-1]:.5f}")
 
+    print(f"[k={k_tournament}] Avaliações da função objetivo: {population.evaluations}")
     return best_scores
 
 
 # -----------------------------------------------------------
-# 7️⃣ Execução e comparação
+# 7️⃣ Versão vetorizada (população inteira em arrays NumPy)
+# -----------------------------------------------------------
+def run_ga_vectorized(k_tournament, pop_size=100_000, seed=42):
+    """Mesmo GA com torneio de tamanho k executado pelo motor vetorizado."""
+    return run_real_ga(
+        objective_function, X_MIN, X_MAX,
+        pop_size=pop_size, generations=NUM_GENERATIONS,
+        tournament_k=k_tournament, crossover="blend", crossover_rate=CROSSOVER_RATE, alpha=0.5,
+        mutation_rate=MUTATION_RATE, mutation_scale=0.1,
+        elite_size=1, seed=seed,
+    )
+
+
+# -----------------------------------------------------------
+# 8️⃣ Execução e comparação
 # -----------------------------------------------------------
 if __name__ == "__main__":
     results = {
@@ -21,6 +21,8 @@ com x codificado em 8 bits (0 a 255).
 
 import random
 import matplotlib.pyplot as plt
+from populacao import Population
+import ga_binario_empacotado as packed
 
 random.seed(42)
 
@@ -47,6 +49,11 @@ def objective_function(x: int) -> int:
     return x ** 2
 
 
+def fitness(chromosome: str) -> int:
+    """Fitness de um cromossomo: f(decode(c))."""
+    return objective_function(decode(chromosome))
+
+
 # ----------------------------------------------------------
 # 3️⃣ Inicialização da população
 # ----------------------------------------------------------
@@ -63,8 +70,9 @@ def initialize_population():
 # 4️⃣ Seleção por torneio
 # ----------------------------------------------------------
 def tournament_selection(pop, k=3):
-    candidates = random.sample(pop, k)
-    return max(candidates, key=lambda c: objective_function(decode(c)))
+    # usa o fitness em cache da Population (sem decodificar de novo)
+    candidates = random.sample(range(len(pop)), k)
+    return pop[max(candidates, key=pop.fitness.__getitem__)]
 
 
 # ----------------------------------------------------------
@@ -105,14 +113,14 @@ def mutate(chromosome):
 # 7️⃣ Execução do GA
 # ----------------------------------------------------------
 def run_ga():
-    population = initialize_population()
+    population = Population(initialize_population(), fitness)
     best_scores = []
 
     for gen in range(NUM_GENERATIONS):
         new_population = []
 
         # elitismo
-        best = max(population, key=lambda c: objective_function(decode(c)))
+        best, _ = population.best()
         new_population.append(best)
 
         # gerar novos indivíduos
@@ -127,21 +135,39 @@ def run_ga():
 
             new_population.extend([c1, c2])
 
-        population = new_population[:POP_SIZE]
+        population = population.next_generation(new_population[:POP_SIZE])
 
         # registrar melhor da geração
-        best_ind = max(population, key=lambda c: objective_function(decode(c)))
-        best_val = objective_function(decode(best_ind))
+        best_ind, best_val = population.best()
         best_scores.append(best_val)
 
         if gen % 10 == 0:
             print(f"Geração {gen:02d} | Melhor x = {decode(best_ind):3d} | f(x) = {best_val}")
 
+    print(f"Avaliações da função objetivo: {population.evaluations}")
     return best_scores
 
 
 # ----------------------------------------------------------
-# 8️⃣ Gráfico de convergência
+# 8️⃣ Versão empacotada (população como matriz de bits NumPy)
+# ----------------------------------------------------------
+def run_ga_packed(pop_size=100_000, seed=42):
+    """
+    Mesmo GA (torneio k=3, crossover de 1 ponto, bit-flip, elitismo) com os
+    cromossomos empacotados em bits: crossover, mutação e decodificação
+    viram operações bit a bit sobre a população inteira.
+    """
+    return packed.run_binary_ga(
+        packed.lookup_fitness(objective_function, CHROMOSOME_LENGTH),
+        CHROMOSOME_LENGTH,
+        pop_size=pop_size, generations=NUM_GENERATIONS, tournament_k=3,
+        crossover_rate=CROSSOVER_RATE, mutation_rate=MUTATION_RATE,
+        elite_size=1, seed=seed,
+    )
+
+
+# ----------------------------------------------------------
+# 9️⃣ Gráfico de convergência
 # ----------------------------------------------------------
 if __name__ == "__main__":
     scores = run_ga()
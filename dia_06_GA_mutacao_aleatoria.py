@@ -7,11 +7,15 @@ Algoritmos Genéticos clássicos com codificação binária.
 
 - Problema: maximizar f(x) = x²
 - Representação: 8 bits (inteiros de 0 a 255)
-- Mutação aplicada bit a bit com taxa definida.
+- Mutação aplicada bit a bit com taxa definida (posições sorteadas por
+  saltos geométricos: custo proporcional ao número de flips).
 """
 
 import random
+import math
 import matplotlib.pyplot as plt
+from populacao import Population
+import ga_binario_empacotado as packed
 
 random.seed(42)
 
@@ -33,6 +37,9 @@ def decode(binary_string):
 def objective_function(x):
     return x ** 2
 
+def fitness(chromosome):
+    return objective_function(decode(chromosome))
+
 
 # -----------------------------------------------------------
 # 3️⃣ Inicialização
@@ -49,8 +56,9 @@ def initialize_population():
 # 4️⃣ Seleção simples (torneio)
 # -----------------------------------------------------------
 def tournament_selection(population, k=3):
-    candidates = random.sample(population, k)
-    return max(candidates, key=lambda c: objective_function(decode(c)))
+    # usa o fitness em cache da Population (sem decodificar de novo)
+    candidates = random.sample(range(len(population)), k)
+    return population[max(candidates, key=population.fitness.__getitem__)]
 
 
 # -----------------------------------------------------------
@@ -58,23 +66,30 @@ def tournament_selection(population, k=3):
 # -----------------------------------------------------------
 def mutate(chromosome):
     """
-    Percorre cada bit do cromossomo e, com uma probabilidade MUTATION_RATE,
-    troca "0" por "1" ou "1" por "0".
+    Cada bit do cromossomo é trocado ("0" <-> "1") com probabilidade MUTATION_RATE.
+    Em vez de sortear um número por bit, sorteamos diretamente o salto até o
+    próximo bit mutado: com taxa p, o salto segue uma distribuição geométrica,
+    salto = floor(ln(U) / ln(1 - p)), U ~ U(0, 1]. O resultado é o mesmo
+    processo de Bernoulli, com um sorteio por flip (+1) em vez de um por bit.
     """
-    new_bits = []
-    for bit in chromosome:
-        if random.random() < MUTATION_RATE:
-            new_bits.append("1" if bit == "0" else "0")
-        else:
-            new_bits.append(bit)
-    return "".join(new_bits)
+    if MUTATION_RATE <= 0:
+        return chromosome
+    bits = list(chromosome)
+    log_q = math.log(1 - MUTATION_RATE)
+    pos = -1
+    while True:
+        pos += 1 + int(math.log(1.0 - random.random()) / log_q)
+        if pos >= len(bits):
+            break
+        bits[pos] = "1" if bits[pos] == "0" else "0"
+    return "".join(bits)
 
 
 # -----------------------------------------------------------
 # 6️⃣ Loop do GA (sem cruzamento neste dia)
 # -----------------------------------------------------------
 def run_ga():
-    population = initialize_population()
+    population = Population(initialize_population(), fitness)
     best_scores = []
 
     for gen in range(NUM_GENERATIONS):
@@ -82,7 +97,7 @@ def run_ga():
         new_population = []
 
         # elitismo
-        best = max(population, key=lambda c: objective_function(decode(c)))
+        best, _ = population.best()
         new_population.append(best)
 
         while len(new_population) < POP_SIZE:
@@ -90,20 +105,37 @@ def run_ga():
             mutated = mutate(p)
             new_population.append(mutated)
 
-        population = new_population
+        population = population.next_generation(new_population)
 
-        best_ind = max(population, key=lambda c: objective_function(decode(c)))
-        best_val = objective_function(decode(best_ind))
+        _, best_val = population.best()
         best_scores.append(best_val)
 
         if gen % 10 == 0:
             print(f"Geração {gen:02d} | Melhor f(x) = {best_val}")
 
+    print(f"Avaliações da função objetivo: {population.evaluations}")
     return best_scores
 
 
 # -----------------------------------------------------------
-# 7️⃣ Execução e plot
+# 7️⃣ Versão empacotada (população como matriz de bits NumPy)
+# -----------------------------------------------------------
+def run_ga_packed(pop_size=100_000, seed=42):
+    """
+    Mesmo GA (torneio k=3, só mutação bit-flip, elitismo) com a população
+    empacotada em bits: a mutação é uma máscara de flips + XOR.
+    """
+    return packed.run_binary_ga(
+        packed.lookup_fitness(objective_function, CHROMOSOME_LENGTH),
+        CHROMOSOME_LENGTH,
+        pop_size=pop_size, generations=NUM_GENERATIONS, tournament_k=3,
+        crossover_rate=0.0, mutation_rate=MUTATION_RATE,
+        elite_size=1, seed=seed,
+    )
+
+
+# -----------------------------------------------------------
+# 8️⃣ Execução e plot
 # -----------------------------------------------------------
 if __name__ == "__main__":
     scores = run_ga()
@@ -14,8 +14,10 @@ em x ∈ [-1, 2]
 """
 
 import random
-import math
+import numpy as np
 import matplotlib.pyplot as plt
+from ga_real_vetorizado import run_real_ga
+from populacao import Population
 
 random.seed(42)
 
@@ -34,7 +36,8 @@ LOWER_BOUND, UPPER_BOUND = -1, 2
 # 2️⃣ Função de fitness (problema contínuo)
 # -----------------------------------------------------------
 def fitness(x):
-    return x * math.sin(10 * x) + 1
+    # aceita um float ou um array NumPy (avaliação da população em lote)
+    return x * np.sin(10 * x) + 1
 
 
 # -----------------------------------------------------------
@@ -48,8 +51,9 @@ def initialize_population():
 # 4️⃣ Seleção por torneio
 # -----------------------------------------------------------
 def tournament_selection(population):
-    competitors = random.sample(population, TOURNAMENT_K)
-    return max(competitors, key=fitness)
+    # usa o fitness em cache da Population (sem reavaliar)
+    competitors = random.sample(range(len(population)), TOURNAMENT_K)
+    return population[max(competitors, key=population.fitness.__getitem__)]
 
 
 # -----------------------------------------------------------
@@ -74,7 +78,7 @@ def mutate(x):
 # 7️⃣ Loop principal do GA
 # -----------------------------------------------------------
 def run_ga():
-    population = initialize_population()
+    population = Population(initialize_population(), fitness)
     best_history = []
 
     for gen in range(NUM_GENERATIONS):
@@ -82,7 +86,7 @@ def run_ga():
         new_population = []
 
         # elitismo
-        best_individual = max(population, key=fitness)
+        best_individual, _ = population.best()
         new_population.append(best_individual)
 
         while len(new_population) < POP_SIZE:
@@ -94,18 +98,36 @@ def run_ga():
 
             new_population.append(child)
 
-        population = new_population
-        best_f = fitness(max(population, key=fitness))
+        population = population.next_generation(new_population)
+        _, best_f = population.best()
         best_history.append(best_f)
 
         if gen % 10 == 0:
             print(f"Geração {gen} | Melhor fitness = {best_f:.4f}")
 
+    print(f"Avaliações da função de fitness: {population.evaluations}")
     return best_history
 
 
 # -----------------------------------------------------------
-# 8️⃣ Execução e visualização
+# 8️⃣ Versão vetorizada (população inteira em arrays NumPy)
+# -----------------------------------------------------------
+def run_ga_vectorized(pop_size=100_000, seed=42):
+    """
+    Mesmo GA (torneio k=3, crossover aritmético, mutação gaussiana, elitismo)
+    com a geração inteira em operações de array (ga_real_vetorizado).
+    """
+    return run_real_ga(
+        fitness, LOWER_BOUND, UPPER_BOUND,
+        pop_size=pop_size, generations=NUM_GENERATIONS,
+        tournament_k=TOURNAMENT_K, crossover="arithmetic", crossover_rate=1.0,
+        mutation_rate=MUTATION_RATE, mutation_scale=MUTATION_STD,
+        elite_size=1, seed=seed,
+    )
+
+
+# -----------------------------------------------------------
+# 9️⃣ Execução e visualização
 # -----------------------------------------------------------
 if __name__ == "__main__":
     history = run_ga()
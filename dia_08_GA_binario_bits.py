@@ -13,7 +13,10 @@ com x representado em 5 bits.
 """
 
 import random
+import math
 import matplotlib.pyplot as plt
+from populacao import Population
+import ga_binario_empacotado as packed
 
 random.seed(42)
 
@@ -37,11 +40,14 @@ def decode(chromosome):
 # -----------------------------------------------------------
 # 3️⃣ Função de fitness
 # -----------------------------------------------------------
-def fitness(chromosome):
-    x = decode(chromosome)
+def objective_function(x):
     return x ** 2  # otimizar x^2
 
 
+def fitness(chromosome):
+    return objective_function(decode(chromosome))
+
+
 # -----------------------------------------------------------
 # 4️⃣ Inicialização aleatória (bitstring)
 # -----------------------------------------------------------
@@ -57,9 +63,10 @@ def initialize_population():
 # 5️⃣ Seleção por torneio
 # -----------------------------------------------------------
 def tournament_selection(population):
-    competitors = random.sample(population, TOURNAMENT_K)
-    winner = max(competitors, key=fitness)
-    return winner
+    # usa o fitness em cache da Population (sem reavaliar)
+    competitors = random.sample(range(len(population)), TOURNAMENT_K)
+    winner = max(competitors, key=population.fitness.__getitem__)
+    return population[winner]
 
 
 # -----------------------------------------------------------
@@ -75,27 +82,33 @@ def crossover(p1, p2):
 # 7️⃣ Mutação bit-flip
 # -----------------------------------------------------------
 def mutate(chromosome):
-    new_bits = []
-    for bit in chromosome:
-        if random.random() < MUTATION_RATE:
-            new_bits.append('1' if bit == '0' else '0')
-        else:
-            new_bits.append(bit)
-    return ''.join(new_bits)
+    # em vez de um sorteio por bit, sorteia o salto até o próximo bit mutado:
+    # salto ~ Geométrica(MUTATION_RATE) = floor(ln(U) / ln(1 - p))
+    if MUTATION_RATE <= 0:
+        return chromosome
+    bits = list(chromosome)
+    log_q = math.log(1 - MUTATION_RATE)
+    pos = -1
+    while True:
+        pos += 1 + int(math.log(1.0 - random.random()) / log_q)
+        if pos >= len(bits):
+            break
+        bits[pos] = '1' if bits[pos] == '0' else '0'
+    return ''.join(bits)
 
 
 # -----------------------------------------------------------
 # 8️⃣ Loop principal do GA
 # -----------------------------------------------------------
 def run_ga():
-    population = initialize_population()
+    population = Population(initialize_population(), fitness)
     best_history = []
 
     for gen in range(NUM_GENERATIONS):
         new_population = []
 
         # elitismo
-        elite = max(population, key=fitness)
+        elite, _ = population.best()
         new_population.append(elite)
 
         # reprodução
@@ -106,18 +119,36 @@ def run_ga():
             child = mutate(child)
             new_population.append(child)
 
-        population = new_population
-        best_f = fitness(max(population, key=fitness))
+        population = population.next_generation(new_population)
+        _, best_f = population.best()
         best_history.append(best_f)
 
         if gen % 5 == 0:
             print(f"Geração {gen} | Melhor fitness: {best_f}")
 
+    print(f"Avaliações da função de fitness: {population.evaluations}")
     return best_history
 
 
 # -----------------------------------------------------------
-# 9️⃣ Execução + gráfico
+# 9️⃣ Versão empacotada (população como matriz de bits NumPy)
+# -----------------------------------------------------------
+def run_ga_packed(pop_size=100_000, seed=42):
+    """
+    Mesmo GA binário (torneio, crossover de 1 ponto, bit-flip, elitismo)
+    com a população empacotada em uma matriz de bits.
+    """
+    return packed.run_binary_ga(
+        packed.lookup_fitness(objective_function, N_BITS),
+        N_BITS,
+        pop_size=pop_size, generations=NUM_GENERATIONS, tournament_k=TOURNAMENT_K,
+        crossover_rate=1.0, mutation_rate=MUTATION_RATE,
+        elite_size=1, seed=seed,
+    )
+
+
+# -----------------------------------------------------------
+# 🔟 Execução + gráfico
 # -----------------------------------------------------------
 if __name__ == "__main__":
     history = run_ga()
@@ -20,6 +20,8 @@ Função: f(x) = x^2, com x ∈ [0, 31]
 
 import random
 import matplotlib.pyplot as plt
+from populacao import Population
+import ga_binario_empacotado as packed
 
 random.seed(42)
 
@@ -42,10 +44,14 @@ def decode(chromosome):
     return int(chromosome, 2)
 
 
+def objective_function(x):
+    """Função objetivo: f(x) = x^2."""
+    return x ** 2
+
+
 def fitness(chromosome):
     """Função de aptidão."""
-    x = decode(chromosome)
-    return x ** 2
+    return objective_function(decode(chromosome))
 
 
 # -----------------------------------------------------------
@@ -64,9 +70,9 @@ def initialize_population():
 # 4️⃣ Seleção por torneio
 # -----------------------------------------------------------
 def tournament_selection(population):
-    """Seleciona o melhor de k candidatos."""
-    competitors = random.sample(population, TOURNAMENT_K)
-    return max(competitors, key=fitness)
+    """Seleciona o melhor de k candidatos (fitness em cache)."""
+    competitors = random.sample(range(len(population)), TOURNAMENT_K)
+    return population[max(competitors, key=population.fitness.__getitem__)]
 
 
 # -----------------------------------------------------------
@@ -93,15 +99,15 @@ def mutate(chromosome):
 # 6️⃣ Elitismo
 # -----------------------------------------------------------
 def get_elite(population, n):
-    """Retorna os n melhores indivíduos."""
-    return sorted(population, key=fitness, reverse=True)[:n]
+    """Retorna os n melhores indivíduos (pelo fitness em cache, sem ordenar tudo)."""
+    return population.elite(n)
 
 
 # -----------------------------------------------------------
 # 7️⃣ Loop principal
 # -----------------------------------------------------------
 def run_ga():
-    population = initialize_population()
+    population = Population(initialize_population(), fitness)
     best_history = []
 
     for gen in range(NUM_GENERATIONS):
@@ -119,21 +125,38 @@ def run_ga():
             child = mutate(child)
             new_population.append(child)
 
-        population = new_population
+        population = population.next_generation(new_population)
 
-        # 🔹 Melhor da geração
-        best_ind = max(population, key=fitness)
-        best_val = fitness(best_ind)
+        # 🔹 Melhor da geração (sem reavaliar)
+        best_ind, best_val = population.best()
         best_history.append(best_val)
 
         if gen % 10 == 0:
             print(f"Geração {gen:02d} | Melhor x = {decode(best_ind):2d} | f(x) = {best_val}")
 
+    print(f"Avaliações da função de fitness: {population.evaluations}")
     return best_history
 
 
 # -----------------------------------------------------------
-# 8️⃣ Execução
+# 8️⃣ Versão empacotada (população como matriz de bits NumPy)
+# -----------------------------------------------------------
+def run_ga_packed(pop_size=100_000, seed=42):
+    """
+    Mesmo GA com elitismo (top ELITE_SIZE preservados) usando a população
+    empacotada em uma matriz de bits.
+    """
+    return packed.run_binary_ga(
+        packed.lookup_fitness(objective_function, N_BITS),
+        N_BITS,
+        pop_size=pop_size, generations=NUM_GENERATIONS, tournament_k=TOURNAMENT_K,
+        crossover_rate=1.0, mutation_rate=MUTATION_RATE,
+        elite_size=ELITE_SIZE, seed=seed,
+    )
+
+
+# -----------------------------------------------------------
+# 9️⃣ Execução
 # -----------------------------------------------------------
 if __name__ == "__main__":
     history = run_ga()
@@ -1,14 +1,16 @@
 import random
 import math
-import copy
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import matplotlib.pyplot as plt
 from typing import Callable, Union, List, Tuple
-import sys # Import the sys module
 
 random.seed(42)
 
-# Increase the recursion limit to handle potentially deep trees
-sys.setrecursionlimit(2000)
+# Todas as travessias de árvore usam pilha explícita (sem recursão), então
+# árvores profundas não dependem do limite de recursão do interpretador.
 
 # ------------------------------------------
 # Definição do espaço de funções e terminais
@@ -55,21 +57,40 @@ class Node:
     def is_terminal(self) -> bool:
         return self.node_type == "term"
 
+    def _shallow_copy(self) -> "Node":
+        return Node(self.node_type, self.func, self.arity, self.symbol, self.value)
+
     def copy(self):
-        """Retorna uma cópia profunda do nó (subárvore)."""
-        return copy.deepcopy(self)
+        """Retorna uma cópia profunda do nó (subárvore), sem recursão."""
+        root = self._shallow_copy()
+        stack = [(self, root)]
+        while stack:
+            src, dst = stack.pop()
+            dst.children = [child._shallow_copy() for child in src.children]
+            stack.extend(zip(src.children, dst.children))
+        return root
 
     def __str__(self) -> str:
         """Representação em infix (legível) da subárvore neste nó."""
-        if self.is_terminal():
-            return str(self.value)
-        # função unária
-        if self.arity == 1:
-            return f"{self.symbol}({str(self.children[0])})"
-        # função binária (infix)
-        left = str(self.children[0])
-        right = str(self.children[1])
-        return f"({left} {self.symbol} {right})"
+        parts: List[str] = []
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node.is_terminal():
+                parts.append(str(node.value))
+            elif not expanded:
+                # filhos são processados antes do pai (pós-ordem)
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node.children))
+            elif node.arity == 1:
+                # função unária
+                parts.append(f"{node.symbol}({parts.pop()})")
+            else:
+                # função binária (infix)
+                right = parts.pop()
+                left = parts.pop()
+                parts.append(f"({left} {node.symbol} {right})")
+        return parts.pop()
 
 # -------------------------
 # Geração de árvores (crescimento randômico)
@@ -114,24 +135,116 @@ def generate_random_terminal() -> Node:
 # -------------------------
 def evaluate_tree(node: Node, x_value: float) -> float:
     """
-    Avalia recursivamente a árvore para x = x_value.
+    Avalia a árvore para x = x_value com pilha explícita (pós-ordem).
     - Para terminais 'x' retorna x_value
     - Para constantes retorna o número
     - Para funções aplica func nos valores avaliados dos filhos
     """
+    values: List[float] = []
+    stack = [(node, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if current.is_terminal():
+            values.append(x_value if current.value == "x" else float(current.value))
+        elif not expanded:
+            stack.append((current, True))
+            stack.extend((child, False) for child in reversed(current.children))
+        else:
+            # os valores dos filhos estão no topo da pilha, na ordem dos filhos
+            child_vals = values[-current.arity:]
+            del values[-current.arity:]
+            try:
+                # chama a função armazenada com unpack dos argumentos
+                values.append(current.func(*child_vals))
+            except Exception:
+                # caso algum erro numérico ocorra, penalizamos retornando grande valor
+                values.append(float("inf"))
+    return values.pop()
+
+# -------------------------
+# Compilação vetorizada (NumPy): avalia a árvore em todos os x de uma vez
+# -------------------------
+def _protected_div(a, b):
+    """Divisão protegida vetorizada: onde |b| <= 1e-6 (ou b é NaN) retorna 1.0."""
+    ok = np.abs(b) > 1e-6
+    return np.where(ok, a / np.where(ok, b, 1.0), 1.0)
+
+
+def _guarded_trig(fn):
+    """sin/cos vetorizados: math.sin(±inf) lança erro -> evaluate_tree devolve inf."""
+    return lambda a: np.where(np.isinf(a), np.inf, fn(a))
+
+
+# Equivalentes vetorizados do FUNCTION_SET, indexados pelo símbolo
+VECTOR_FUNCTIONS = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": _protected_div,
+    "sin": _guarded_trig(np.sin),
+    "cos": _guarded_trig(np.cos),
+    # mesmo clamp do escalar: a < 50 ? exp(a) : exp(50) (NaN também vira exp(50))
+    "exp": lambda a: np.exp(np.where(a < 50, a, 50.0)),
+}
+
+
+# profundidade máxima compilada em closures aninhadas (cada nível é um frame)
+_CLOSURE_DEPTH_LIMIT = 200
+
+
+def _compile_node(node: Node) -> Callable[[np.ndarray], np.ndarray]:
+    """Transforma recursivamente um nó em uma closure que recebe o vetor x."""
     if node.is_terminal():
         if node.value == "x":
-            return x_value
-        else:
-            return float(node.value)
-    # calcula valores dos filhos
-    child_vals = [evaluate_tree(child, x_value) for child in node.children]
-    try:
-        # chama a função armazenada com unpack dos argumentos
-        return node.func(*child_vals)
-    except Exception:
-        # caso algum erro numérico ocorra, penalizamos retornando grande valor
-        return float("inf")
+            return lambda xs: xs
+        const = float(node.value)
+        return lambda xs: const
+    func = VECTOR_FUNCTIONS[node.symbol]
+    if node.arity == 1:
+        arg = _compile_node(node.children[0])
+        return lambda xs: func(arg(xs))
+    left = _compile_node(node.children[0])
+    right = _compile_node(node.children[1])
+    return lambda xs: func(left(xs), right(xs))
+
+
+def compile_tree(tree: Node) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Compila a árvore uma única vez em um callable que avalia um array inteiro
+    de valores de x em uma passada (poucas operações NumPy por nó).
+    Mantém a semântica do FUNCTION_SET: divisão protegida e clamp do exp.
+    Árvores mais profundas que _CLOSURE_DEPTH_LIMIT (closures aninhadas
+    recursivas) são avaliadas pela máquina de pilha do genoma linear.
+    """
+    if tree_depth(tree) > _CLOSURE_DEPTH_LIMIT:
+        linear = tree_to_linear(tree)
+        return lambda xs: evaluate_linear(linear, xs)
+    body = _compile_node(tree)
+
+    def compiled(xs) -> np.ndarray:
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all="ignore"):
+            return np.broadcast_to(np.asarray(body(xs), dtype=float), xs.shape)
+
+    return compiled
+
+
+def dataset_to_arrays(dataset: List[Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Converte a lista de pares (x, y) em dois arrays NumPy (xs, ys)."""
+    data = np.asarray(dataset, dtype=float).reshape(-1, 2)
+    return data[:, 0].copy(), data[:, 1].copy()
+
+
+def _mse(y_pred: np.ndarray, ys: np.ndarray) -> float:
+    """MSE vetorizado; qualquer predição não finita penaliza com 1e6 (como `fitness`)."""
+    if not np.all(np.isfinite(y_pred)):
+        return 1e6
+    return float(np.mean((ys - y_pred) ** 2))
+
+
+def fitness_vectorized(tree: Node, xs: np.ndarray, ys: np.ndarray) -> float:
+    """MSE calculado com a árvore compilada (equivalente a `fitness`)."""
+    return _mse(compile_tree(tree)(xs), ys)
 
 # -------------------------
 # Geração de população inicial
@@ -166,12 +279,56 @@ def fitness(tree: Node, dataset: List[Tuple[float, float]]) -> float:
 # -------------------------
 # Seleção: torneio
 # -------------------------
-def tournament_selection(population: List[Node], dataset: List[Tuple[float, float]], k: int) -> Node:
-    """Seleciona o melhor entre k amostras aleatórias usando fitness (menor é melhor)."""
+def tournament_selection(population: List[Node],
+                         dataset: List[Tuple[float, float]],
+                         k: int,
+                         fitness_fn: Callable[[Node], float] = None) -> Node:
+    """
+    Seleciona o melhor entre k amostras aleatórias usando fitness (menor é melhor).
+    - fitness_fn: avaliação alternativa de uma árvore (ex.: versão compilada);
+      se None, usa fitness(t, dataset).
+    """
+    if fitness_fn is None:
+        fitness_fn = lambda t: fitness(t, dataset)
     candidates = random.sample(population, k)
-    candidates_sorted = sorted(candidates, key=lambda t: fitness(t, dataset))
+    candidates_sorted = sorted(candidates, key=fitness_fn)
     return candidates_sorted[0].copy()  # retorna cópia para evitar aliasing
 
+def lexicographic_tournament_selection(population: List[Node],
+                                       dataset: List[Tuple[float, float]],
+                                       k: int,
+                                       fitness_fn: Callable[[Node], float] = None) -> Node:
+    """
+    Torneio com parcimônia lexicográfica (Luke & Panait): vence o melhor
+    fitness; empates são decididos pela árvore menor (menos nós).
+    """
+    if fitness_fn is None:
+        fitness_fn = lambda t: fitness(t, dataset)
+    candidates = random.sample(population, k)
+    winner = min(candidates, key=lambda t: (fitness_fn(t), tree_size(t)))
+    return winner.copy()
+
+def double_tournament_selection(population: List[Node],
+                                dataset: List[Tuple[float, float]],
+                                k: int,
+                                fitness_fn: Callable[[Node], float] = None,
+                                parsimony_d: float = 1.4) -> Node:
+    """
+    Torneio duplo (fitness primeiro): dois torneios de fitness de tamanho k
+    produzem dois finalistas; o menor deles vence com probabilidade
+    parsimony_d / 2 (parsimony_d ∈ [1, 2]; 1 = sem pressão de tamanho).
+    """
+    a = tournament_selection(population, dataset, k, fitness_fn)
+    b = tournament_selection(population, dataset, k, fitness_fn)
+    smaller, larger = (a, b) if tree_size(a) <= tree_size(b) else (b, a)
+    return smaller if random.random() < parsimony_d / 2 else larger
+
+SELECTION_METHODS = {
+    "tournament": tournament_selection,
+    "lexicographic": lexicographic_tournament_selection,
+    "double": double_tournament_selection,
+}
+
 # -------------------------
 # Operadores genéticos: crossover (troca de subárvore) e mutação (substituição)
 # -------------------------
@@ -180,74 +337,615 @@ def get_all_nodes(node: Node) -> List[Node]:
     Retorna lista de todas as referências de nós (preorder).
     Usado para escolher um ponto de crossover ou mutação.
     """
-    nodes = [node]
-    if not node.is_terminal():
-        for child in node.children:
-            nodes.extend(get_all_nodes(child))
+    nodes = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        nodes.append(current)
+        stack.extend(reversed(current.children))
     return nodes
 
+def get_node_paths(node: Node) -> List[Tuple[Node, Tuple[int, ...]]]:
+    """
+    Como get_all_nodes, mas cada nó vem com seu caminho de índices a partir
+    da raiz (ex.: (0, 1) = segundo filho do primeiro filho). A profundidade
+    do nó é len(caminho) + 1 e replace_at_path substitui em O(profundidade).
+    """
+    entries = []
+    stack = [(node, ())]
+    while stack:
+        current, path = stack.pop()
+        entries.append((current, path))
+        for i in range(len(current.children) - 1, -1, -1):
+            stack.append((current.children[i], path + (i,)))
+    return entries
+
+def replace_at_path(root: Node, path: Tuple[int, ...], replacement: Node) -> Node:
+    """
+    Substitui a subárvore no caminho 'path' por 'replacement' descendo direto
+    até o pai (O(profundidade)). Retorna a nova raiz (replacement se path == ()).
+    """
+    if not path:
+        return replacement
+    parent = root
+    for i in path[:-1]:
+        parent = parent.children[i]
+    parent.children[path[-1]] = replacement
+    return root
+
 def replace_node(parent: Node, target: Node, replacement: Node) -> bool:
     """
     Substitui a subárvore 'target' em 'parent' por 'replacement'.
-    Retorna True se substituiu; False caso não encontrasse (usado para navegar a árvore).
+    Retorna True se substituiu; False caso não encontrasse (busca com pilha).
+    Quando o caminho do nó é conhecido, prefira replace_at_path.
     """
-    if parent.is_terminal():
-        return False
-    for i, child in enumerate(parent.children):
-        if child is target:
-            parent.children[i] = replacement
-            return True
-        else:
-            if replace_node(child, target, replacement):
+    stack = [parent]
+    while stack:
+        current = stack.pop()
+        for i, child in enumerate(current.children):
+            if child is target:
+                current.children[i] = replacement
                 return True
+        stack.extend(reversed(current.children))
     return False
 
-def subtree_crossover(parent1: Node, parent2: Node, max_depth: int) -> Tuple[Node, Node]:
+def _preorder_depths(node: Node) -> List[int]:
+    """Profundidade de cada nó, na mesma ordem (preorder) de get_all_nodes."""
+    return [len(path) + 1 for _, path in get_node_paths(node)]
+
+def tree_depth(tree: Union[Node, "LinearTree"]) -> int:
+    """Profundidade da árvore (1 = apenas folha)."""
+    if isinstance(tree, Node):
+        return max(_preorder_depths(tree))
+    return int(_prefix_depths(tree.ops).max())
+
+def tree_size(tree: Union[Node, "LinearTree"]) -> int:
+    """Número de nós da árvore."""
+    if isinstance(tree, Node):
+        return len(get_all_nodes(tree))
+    return len(tree)
+
+def within_limits(tree: Union[Node, "LinearTree"], max_depth: int, max_size: int = None) -> bool:
+    """Verifica os limites de profundidade e (opcionalmente) de tamanho."""
+    if max_size is not None and tree_size(tree) > max_size:
+        return False
+    return tree_depth(tree) <= max_depth
+
+def subtree_crossover(parent1: Node, parent2: Node, max_depth: int,
+                      max_size: int = None) -> Tuple[Node, Node]:
     """
     Seleciona um nó aleatório em cada pai e troca as subárvores.
     Retorna dois filhos (cópias dos pais modificados).
+    Controle de bloat (Koza): filho com profundidade > max_depth ou mais de
+    max_size nós é descartado e substituído por uma cópia do respectivo pai.
     """
     # cópias para não modificar pais originais
     p1_copy = parent1.copy()
     p2_copy = parent2.copy()
 
-    nodes1 = get_all_nodes(p1_copy)
-    nodes2 = get_all_nodes(p2_copy)
+    nodes1 = get_node_paths(p1_copy)
+    nodes2 = get_node_paths(p2_copy)
 
     # evitamos trocar a raiz em ambos para preservar diversidade (mas é permitido)
-    node1 = random.choice(nodes1)
-    node2 = random.choice(nodes2)
+    node1, path1 = random.choice(nodes1)
+    node2, path2 = random.choice(nodes2)
 
-    # se o nó selecionado for a raiz, simplesmente troca árvores inteiras
-    if node1 is p1_copy:
-        child1 = node2.copy()
-    else:
-        child1 = p1_copy
-        replace_node(child1, node1, node2.copy())
+    # substituição direta pelo caminho (se for a raiz, troca árvores inteiras)
+    child1 = replace_at_path(p1_copy, path1, node2.copy())
+    child2 = replace_at_path(p2_copy, path2, node1.copy())
 
-    if node2 is p2_copy:
-        child2 = node1.copy()
-    else:
-        child2 = p2_copy
-        replace_node(child2, node2, node1.copy())
-
-    # opcional: controlar profundidade - se exceder, pode cortar (não implementado rigorosamente aqui)
+    # controle de profundidade/tamanho: filhos fora dos limites voltam a ser os pais
+    if not within_limits(child1, max_depth, max_size):
+        child1 = parent1.copy()
+    if not within_limits(child2, max_depth, max_size):
+        child2 = parent2.copy()
     return child1, child2
 
-def subtree_mutation(tree: Node, max_depth: int) -> Node:
+def subtree_mutation(tree: Node, max_depth: int, max_size: int = None) -> Node:
     """
     Substitui uma subárvore aleatória por uma nova árvore gerada aleatoriamente.
+    A nova subárvore é limitada para que o resultado respeite max_depth; se
+    exceder max_size nós, a mutação é descartada (retorna cópia do original).
     """
     t_copy = tree.copy()
-    nodes = get_all_nodes(t_copy)
-    node_to_replace = random.choice(nodes)
-    new_subtree = generate_random_tree(max_depth=max_depth, grow=True)
+    _, path = random.choice(get_node_paths(t_copy))
+    depth = len(path) + 1
+    new_subtree = generate_random_tree(max_depth=max(1, max_depth - depth + 1), grow=True)
+
+    t_copy = replace_at_path(t_copy, path, new_subtree)
+    if max_size is not None and tree_size(t_copy) > max_size:
+        return tree.copy()
+    return t_copy
+
+# -------------------------
+# Genoma linear: árvore em notação prefixa armazenada em arrays NumPy
+# -------------------------
+# opcodes: índice no FUNCTION_SET para funções, valores negativos para terminais
+OP_X = -1
+OP_CONST = -2
+# aridade por opcode (deslocada em +2 para indexar OP_CONST/OP_X)
+_LINEAR_ARITY = np.array([0, 0] + [arity for _, arity, _ in FUNCTION_SET], dtype=np.int64)
+_LINEAR_SYMBOLS = [symbol for _, _, symbol in FUNCTION_SET]
+_LINEAR_VECTOR_OPS = [VECTOR_FUNCTIONS[symbol] for symbol in _LINEAR_SYMBOLS]
+
+
+def _prefix_depths(ops: np.ndarray) -> np.ndarray:
+    """Profundidade de cada posição do prefixo (raiz = 1)."""
+    arities = _LINEAR_ARITY[ops + 2].tolist()
+    depths = np.empty(len(ops), dtype=np.int64)
+    pending = []  # profundidades dos filhos ainda não visitados (pilha)
+    for i, arity in enumerate(arities):
+        depth = pending.pop() if pending else 1
+        depths[i] = depth
+        pending.extend([depth + 1] * arity)
+    return depths
+
+
+def _subtree_ends(ops: np.ndarray) -> np.ndarray:
+    """
+    Para cada posição i (prefixo), calcula ends[i] tal que a subárvore com
+    raiz em i ocupa o intervalo ops[i:ends[i]].
+    """
+    arities = _LINEAR_ARITY[ops + 2]
+    ends = np.empty(len(ops), dtype=np.int64)
+    stack = []
+    # percorre de trás para frente: os filhos já estão na pilha (1º filho no topo)
+    for i in range(len(ops) - 1, -1, -1):
+        end = i + 1
+        for _ in range(arities[i]):
+            end = stack.pop()
+        ends[i] = end
+        stack.append(end)
+    return ends
+
+
+class LinearTree:
+    """
+    Árvore de expressão como arrays planos em ordem prefixa:
+    - ops: opcodes (OP_X, OP_CONST ou índice no FUNCTION_SET)
+    - consts: valor da constante em cada posição (0.0 quando não é OP_CONST)
+    - ends: extensão pré-calculada de cada subárvore (ops[i:ends[i]])
+    Crossover e mutação viram fatiamento + concatenação desses arrays.
+    """
+
+    def __init__(self, ops: np.ndarray, consts: np.ndarray, ends: np.ndarray = None):
+        self.ops = ops
+        self.consts = consts
+        self.ends = _subtree_ends(ops) if ends is None else ends
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def is_terminal(self) -> bool:
+        return len(self.ops) == 1
+
+    def copy(self) -> "LinearTree":
+        """Cópia barata: apenas três arrays contíguos."""
+        return LinearTree(self.ops.copy(), self.consts.copy(), self.ends.copy())
+
+    def __str__(self) -> str:
+        """Representação infix (mesmo formato de Node.__str__), montada com pilha."""
+        stack = []
+        for op, const in zip(self.ops[::-1].tolist(), self.consts[::-1].tolist()):
+            if op == OP_X:
+                stack.append("x")
+            elif op == OP_CONST:
+                stack.append(str(const))
+            elif _LINEAR_ARITY[op + 2] == 1:
+                stack.append(f"{_LINEAR_SYMBOLS[op]}({stack.pop()})")
+            else:
+                left = stack.pop()
+                right = stack.pop()
+                stack.append(f"({left} {_LINEAR_SYMBOLS[op]} {right})")
+        return stack.pop()
+
 
-    if node_to_replace is t_copy:
-        return new_subtree
+def _append_random_terminal(ops: List[int], consts: List[float]) -> None:
+    """Versão linear de generate_random_terminal (mesma sequência de sorteios)."""
+    if random.random() < 0.6:
+        ops.append(OP_X)
+        consts.append(0.0)
     else:
-        replace_node(t_copy, node_to_replace, new_subtree)
-        return t_copy
+        ops.append(OP_CONST)
+        consts.append(round(random.uniform(CONST_MIN, CONST_MAX), 4))
+
+
+def _grow_linear(max_depth: int, grow: bool, ops: List[int], consts: List[float]) -> None:
+    """Gera a árvore diretamente em prefixo, espelhando generate_random_tree."""
+    if max_depth == 1 or (grow and random.random() < 0.3):
+        _append_random_terminal(ops, consts)
+        return
+    op = random.randrange(len(FUNCTION_SET))
+    ops.append(op)
+    consts.append(0.0)
+    for _ in range(FUNCTION_SET[op][1]):
+        _grow_linear(max_depth - 1, grow, ops, consts)
+
+
+def generate_random_linear_tree(max_depth: int, grow: bool = True) -> LinearTree:
+    """Gera uma LinearTree aleatória sem criar objetos Node."""
+    ops, consts = [], []
+    _grow_linear(max_depth, grow, ops, consts)
+    return LinearTree(np.array(ops, dtype=np.int16), np.array(consts, dtype=float))
+
+
+def tree_to_linear(tree: Node) -> LinearTree:
+    """Converte uma árvore de Node para o genoma linear (prefixo)."""
+    ops, consts = [], []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node.is_terminal():
+            if node.value == "x":
+                ops.append(OP_X)
+                consts.append(0.0)
+            else:
+                ops.append(OP_CONST)
+                consts.append(float(node.value))
+        else:
+            ops.append(_LINEAR_SYMBOLS.index(node.symbol))
+            consts.append(0.0)
+            stack.extend(reversed(node.children))
+    return LinearTree(np.array(ops, dtype=np.int16), np.array(consts, dtype=float))
+
+
+def linear_to_tree(tree: LinearTree) -> Node:
+    """Reconstrói a árvore de Node a partir do genoma linear."""
+    stack = []
+    for op, const in zip(tree.ops[::-1].tolist(), tree.consts[::-1].tolist()):
+        if op == OP_X:
+            stack.append(Node(node_type="term", value="x"))
+        elif op == OP_CONST:
+            stack.append(Node(node_type="term", value=const))
+        else:
+            func, arity, symbol = FUNCTION_SET[op]
+            node = Node(node_type="func", func=func, arity=arity, symbol=symbol)
+            node.children = [stack.pop() for _ in range(arity)]
+            stack.append(node)
+    return stack.pop()
+
+
+def evaluate_linear(tree: LinearTree, xs) -> np.ndarray:
+    """
+    Máquina de pilha: percorre o prefixo de trás para frente (pós-fixo) e
+    avalia a expressão sobre o array xs inteiro, com a semântica do FUNCTION_SET.
+    """
+    xs = np.asarray(xs, dtype=float)
+    stack = []
+    with np.errstate(all="ignore"):
+        for op, const in zip(tree.ops[::-1].tolist(), tree.consts[::-1].tolist()):
+            if op == OP_X:
+                stack.append(xs)
+            elif op == OP_CONST:
+                stack.append(const)
+            elif _LINEAR_ARITY[op + 2] == 1:
+                stack.append(_LINEAR_VECTOR_OPS[op](stack.pop()))
+            else:
+                left = stack.pop()
+                right = stack.pop()
+                stack.append(_LINEAR_VECTOR_OPS[op](left, right))
+    return np.broadcast_to(np.asarray(stack.pop(), dtype=float), xs.shape)
+
+
+def fitness_linear(tree: LinearTree, xs: np.ndarray, ys: np.ndarray) -> float:
+    """MSE de uma LinearTree (equivalente a `fitness`)."""
+    return _mse(evaluate_linear(tree, xs), ys)
+
+
+def _splice(host: LinearTree, i: int, donor: LinearTree, j: int) -> LinearTree:
+    """
+    Substitui a subárvore host[i:ends[i]] pela subárvore donor[j:ends[j]].
+    As extensões (ends) do filho são derivadas das dos pais, sem recálculo:
+    ancestrais de i e o sufixo deslocam de delta, o enxerto de (i - j).
+    """
+    ei, ej = host.ends[i], donor.ends[j]
+    delta = (ej - j) - (ei - i)
+    head_ends = host.ends[:i].copy()
+    head_ends[head_ends > i] += delta  # somente ancestrais de i terminam depois de i
+    return LinearTree(
+        np.concatenate((host.ops[:i], donor.ops[j:ej], host.ops[ei:])),
+        np.concatenate((host.consts[:i], donor.consts[j:ej], host.consts[ei:])),
+        np.concatenate((head_ends, donor.ends[j:ej] + (i - j), host.ends[ei:] + delta)),
+    )
+
+
+def linear_subtree_crossover(parent1: LinearTree, parent2: LinearTree,
+                             max_depth: int, max_size: int = None) -> Tuple[LinearTree, LinearTree]:
+    """
+    Crossover de subárvore no genoma linear: troca dois intervalos contíguos.
+    Mesmos limites de profundidade/tamanho de subtree_crossover.
+    """
+    i = random.randrange(len(parent1))
+    j = random.randrange(len(parent2))
+    child1 = _splice(parent1, i, parent2, j)
+    child2 = _splice(parent2, j, parent1, i)
+    if not within_limits(child1, max_depth, max_size):
+        child1 = parent1.copy()
+    if not within_limits(child2, max_depth, max_size):
+        child2 = parent2.copy()
+    return child1, child2
+
+
+def linear_subtree_mutation(tree: LinearTree, max_depth: int, max_size: int = None) -> LinearTree:
+    """
+    Mutação de subárvore no genoma linear: enxerta uma subárvore aleatória
+    limitada pela profundidade restante no ponto escolhido.
+    """
+    i = random.randrange(len(tree))
+    depth = int(_prefix_depths(tree.ops[:i + 1])[i])
+    new_subtree = generate_random_linear_tree(max_depth=max(1, max_depth - depth + 1), grow=True)
+    child = _splice(tree, i, new_subtree, 0)
+    if max_size is not None and len(child) > max_size:
+        return tree.copy()
+    return child
+
+
+class PackedPopulation(Sequence):
+    """
+    População de LinearTree empacotada em buffers contíguos (ops, consts, ends)
+    mais um vetor de offsets. Cada indivíduo é uma visão (sem cópia) dos buffers,
+    então 10k árvores ocupam poucos arrays em vez de milhões de objetos Python.
+    """
+
+    def __init__(self, trees: List[LinearTree]):
+        lengths = np.array([len(t) for t in trees], dtype=np.int64)
+        self.offsets = np.zeros(len(trees) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.ops = np.concatenate([t.ops for t in trees]).astype(np.int16, copy=False)
+        self.consts = np.concatenate([t.consts for t in trees])
+        self.ends = np.concatenate([t.ends for t in trees])  # relativos a cada árvore
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, k: int) -> LinearTree:
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("índice fora da população")
+        a, b = self.offsets[k], self.offsets[k + 1]
+        return LinearTree(self.ops[a:b], self.consts[a:b], self.ends[a:b])
+
+
+def initialize_linear_population(pop_size: int, max_depth: int) -> PackedPopulation:
+    """Versão linear de initialize_population (grow/full 50% cada)."""
+    trees = []
+    for _ in range(pop_size):
+        grow = (random.random() < 0.5)
+        trees.append(generate_random_linear_tree(max_depth=max_depth, grow=grow))
+    return PackedPopulation(trees)
+
+# -------------------------
+# Memoização de fitness (cache LRU por estrutura da árvore)
+# -------------------------
+def structural_key(tree: Union[Node, LinearTree]) -> bytes:
+    """
+    Chave estrutural da árvore: bytes dos opcodes + constantes em prefixo.
+    Árvores idênticas (mesmo que objetos distintos) geram a mesma chave.
+    """
+    if isinstance(tree, Node):
+        tree = tree_to_linear(tree)
+    return tree.ops.astype(np.int16, copy=False).tobytes() + tree.consts.tobytes()
+
+
+class FitnessCache:
+    """
+    Envolve uma função de fitness com um cache LRU limitado a maxsize entradas.
+    - hits / misses contam acertos e avaliações reais contra o dataset
+    Elites e cópias idênticas geradas por crossover/torneio não são reavaliadas.
+    """
+
+    def __init__(self, fitness_fn: Callable[[Union[Node, LinearTree]], float], maxsize: int = 10000):
+        self.fitness_fn = fitness_fn
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._store: "OrderedDict[bytes, float]" = OrderedDict()
+
+    def __call__(self, tree: Union[Node, LinearTree]) -> float:
+        key = structural_key(tree)
+        value = self._store.get(key)
+        if value is not None:
+            self.hits += 1
+            self._store.move_to_end(key)  # marca como usado recentemente
+            return value
+        self.misses += 1
+        value = self.fitness_fn(tree)
+        self._store[key] = value
+        if len(self._store) > self.maxsize:
+            self._store.popitem(last=False)  # descarta o menos usado recentemente
+        return value
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
+
+# -------------------------
+# Tabela de subárvores (hash-consing): cada subárvore distinta é avaliada uma vez
+# -------------------------
+class SubtreeTable:
+    """
+    Hash-consing de subárvores sobre um dataset fixo (xs).
+    Cada subárvore distinta recebe um id a partir de (opcode, constante ou ids
+    dos filhos); seu vetor de saída é calculado uma única vez e reutilizado por
+    todas as árvores que a contêm. O custo numérico passa a ser proporcional
+    ao número de subárvores distintas, não ao total de nós da população.
+    - max_entries: limite rígido (descarta as menos usadas recentemente)
+    - sweep(): descarta entradas não referenciadas desde o último sweep
+    Ids nunca são reutilizados, então chaves de pais com filhos descartados
+    apenas deixam de ser encontradas (nunca retornam valores errados).
+    """
+
+    def __init__(self, xs: np.ndarray, max_entries: int = 100000):
+        self.xs = np.asarray(xs, dtype=float)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._ids = {}                      # chave estrutural -> id
+        self._entries = OrderedDict()       # id -> (chave, vetor de saída)
+        self._touched = set()               # ids usados desde o último sweep
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _intern(self, key: tuple, compute: Callable[[], np.ndarray]) -> Tuple[int, np.ndarray]:
+        """Devolve (id, valor) da subárvore, calculando o valor apenas na 1ª vez."""
+        entry_id = self._ids.get(key)
+        if entry_id is not None:
+            self.hits += 1
+            self._entries.move_to_end(entry_id)
+            value = self._entries[entry_id][1]
+        else:
+            self.misses += 1
+            with np.errstate(all="ignore"):
+                value = compute()
+            entry_id = self._next_id
+            self._next_id += 1
+            self._ids[key] = entry_id
+            self._entries[entry_id] = (key, value)
+            if len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)[1]
+                del self._ids[old_key]
+        self._touched.add(entry_id)
+        return entry_id, value
+
+    def evaluate(self, tree: Union[Node, LinearTree]) -> np.ndarray:
+        """Avalia a árvore sobre xs reaproveitando os vetores de subárvores já vistas."""
+        if isinstance(tree, Node):
+            tree = tree_to_linear(tree)
+        xs = self.xs
+        stack = []  # pares (id, valor) dos filhos já avaliados
+        for op, const in zip(tree.ops[::-1].tolist(), tree.consts[::-1].tolist()):
+            if op == OP_X:
+                stack.append(self._intern((OP_X,), lambda: xs))
+            elif op == OP_CONST:
+                stack.append(self._intern((OP_CONST, const), lambda: const))
+            elif _LINEAR_ARITY[op + 2] == 1:
+                child_id, a = stack.pop()
+                f = _LINEAR_VECTOR_OPS[op]
+                stack.append(self._intern((op, child_id), lambda: f(a)))
+            else:
+                left_id, a = stack.pop()
+                right_id, b = stack.pop()
+                f = _LINEAR_VECTOR_OPS[op]
+                stack.append(self._intern((op, left_id, right_id), lambda: f(a, b)))
+        return np.broadcast_to(np.asarray(stack.pop()[1], dtype=float), xs.shape)
+
+    def sweep(self) -> int:
+        """Remove entradas não usadas desde o último sweep; retorna quantas saíram."""
+        stale = [entry_id for entry_id in self._entries if entry_id not in self._touched]
+        for entry_id in stale:
+            key, _ = self._entries.pop(entry_id)
+            del self._ids[key]
+        self._touched = set()
+        return len(stale)
+
+# -------------------------
+# Avaliação paralela da população (pool de processos)
+# -------------------------
+# dataset de cada worker: enviado uma única vez pelo initializer do pool
+_WORKER_DATA = None
+
+
+def _init_worker(xs: np.ndarray, ys: np.ndarray, fitness_fn: Callable) -> None:
+    global _WORKER_DATA
+    _WORKER_DATA = (xs, ys, fitness_fn)
+
+
+def _serialize_tree(tree: Union[Node, LinearTree]) -> Tuple[np.ndarray, np.ndarray]:
+    """Árvore -> (ops, consts): forma compacta enviada aos workers."""
+    if isinstance(tree, Node):
+        tree = tree_to_linear(tree)
+    return tree.ops, tree.consts
+
+
+def _score_batch(batch, seed, xs, ys, fitness_fn) -> np.ndarray:
+    """Avalia um lote de genomas serializados; seed fixa o RNG do lote (se houver)."""
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+    return np.array([fitness_fn(LinearTree(ops, consts), xs, ys) for ops, consts in batch],
+                    dtype=float)
+
+
+def _evaluate_batch(batch, seed) -> np.ndarray:
+    """Ponto de entrada no worker: usa o dataset recebido no initializer."""
+    xs, ys, fitness_fn = _WORKER_DATA
+    return _score_batch(batch, seed, xs, ys, fitness_fn)
+
+
+class ParallelEvaluator:
+    """
+    Avalia populações em lotes num ProcessPoolExecutor.
+    - o dataset vai para cada worker uma vez (initializer), não a cada tarefa
+    - as árvores viajam serializadas como (ops, consts) do genoma linear
+    - evaluate() devolve o array de fitness na ordem da população
+    - seed: cada lote i usa a semente seed + i; como os lotes dependem só de
+      batch_size (não do número de workers), o resultado é idêntico ao do
+      caminho serial (workers=0), inclusive para fitness estocásticos
+    fitness_fn(tree: LinearTree, xs, ys) precisa ser picklable (nível de módulo).
+    """
+
+    def __init__(self,
+                 dataset: List[Tuple[float, float]],
+                 workers: int = None,
+                 batch_size: int = 64,
+                 seed: int = None,
+                 fitness_fn: Callable[[LinearTree, np.ndarray, np.ndarray], float] = None):
+        self.xs, self.ys = dataset_to_arrays(dataset)
+        self.batch_size = batch_size
+        self.seed = seed
+        self.fitness_fn = fitness_linear if fitness_fn is None else fitness_fn
+        if workers is not None and workers < 0:
+            raise ValueError("workers deve ser >= 0 (ou None para todos os núcleos)")
+        self._pool = None
+        if workers is None or workers > 0:
+            self._pool = ProcessPoolExecutor(max_workers=workers,
+                                             initializer=_init_worker,
+                                             initargs=(self.xs, self.ys, self.fitness_fn))
+
+    def evaluate(self, population: Sequence) -> np.ndarray:
+        genomes = [_serialize_tree(t) for t in population]
+        batches = [genomes[i:i + self.batch_size] for i in range(0, len(genomes), self.batch_size)]
+        if self.seed is None:
+            seeds = [None] * len(batches)
+        else:
+            seeds = [self.seed + i for i in range(len(batches))]
+        if not batches:
+            return np.empty(0)
+        if self._pool is not None:
+            results = list(self._pool.map(_evaluate_batch, batches, seeds))
+        else:
+            # caminho serial: mesmos lotes e sementes, sem alterar o RNG do processo
+            py_state, np_state = random.getstate(), np.random.get_state()
+            try:
+                results = [_score_batch(b, sd, self.xs, self.ys, self.fitness_fn)
+                           for b, sd in zip(batches, seeds)]
+            finally:
+                random.setstate(py_state)
+                np.random.set_state(np_state)
+        return np.concatenate(results)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 # -------------------------
 # Função utilitária: imprime expressão em string limpa
@@ -266,63 +964,145 @@ def genetic_programming(
     tournament_k: int = 3,
     crossover_rate: float = 0.9,
     mutation_rate: float = 0.3,
-    elite_size: int = 1
-) -> Tuple[Node, List[float]]:
+    elite_size: int = 1,
+    vectorized: bool = False,
+    linear: bool = False,
+    cache_size: int = 0,
+    subtree_cache: int = 0,
+    workers: int = 0,
+    batch_size: int = 64,
+    max_size: int = None,
+    selection: str = "tournament",
+    size_stats: List[Tuple[float, int]] = None
+) -> Tuple[Union[Node, LinearTree], List[float]]:
     """
     Executa o loop evolutivo do GP:
     - inicializa população
     - avalia fitness
     - preserva elites
     - aplica seleção, crossover e mutação
+    Se vectorized=True, cada árvore é compilada (compile_tree) e avaliada sobre
+    todo o dataset com NumPy, em vez de uma chamada recursiva por amostra.
+    Se linear=True, usa o genoma linear (LinearTree em PackedPopulation):
+    variação por fatiamento de arrays e avaliação por máquina de pilha.
+    Se cache_size > 0, o fitness é memoizado (FitnessCache, LRU): torneios,
+    elites e a reavaliação final reutilizam valores já calculados.
+    Se subtree_cache > 0, a avaliação passa pela SubtreeTable (até subtree_cache
+    subárvores distintas); as não referenciadas pela população atual são
+    descartadas a cada geração.
+    Se workers > 0 (ou None = todos os núcleos), a população é avaliada em
+    lotes de batch_size por um ParallelEvaluator com `workers` processos; os
+    torneios consultam esse resultado em vez de reavaliar. O fitness é o mesmo
+    do genoma linear. Não combina com cache_size nem subtree_cache (os caches
+    vivem no processo principal e não veriam as avaliações dos workers).
+    Controle de bloat: crossover e mutação respeitam max_depth e max_size;
+    selection escolhe entre "tournament", "lexicographic" (parcimônia
+    lexicográfica) e "double" (torneio duplo). Se size_stats for uma lista,
+    recebe (tamanho médio, tamanho máximo) da população a cada geração.
     Retorna o melhor indivíduo e histórico (melhor fitness por geração).
     """
-    population = initialize_population(pop_size, max_depth)
+    crossover_op, mutation_op = subtree_crossover, subtree_mutation
+    if linear:
+        xs, ys = dataset_to_arrays(dataset)
+        score = lambda t: fitness_linear(t, xs, ys)
+        crossover_op, mutation_op = linear_subtree_crossover, linear_subtree_mutation
+        population = initialize_linear_population(pop_size, max_depth)
+    else:
+        if vectorized:
+            xs, ys = dataset_to_arrays(dataset)
+            score = lambda t: fitness_vectorized(t, xs, ys)
+        else:
+            score = lambda t: fitness(t, dataset)
+        population = initialize_population(pop_size, max_depth)
+    if workers is not None and workers < 0:
+        raise ValueError("workers deve ser >= 0 (ou None para todos os núcleos)")
+    parallel = workers is None or workers > 0
+    if parallel and (cache_size > 0 or subtree_cache > 0):
+        raise ValueError("workers não combina com cache_size nem subtree_cache")
+    table = None
+    if subtree_cache > 0:
+        xs, ys = dataset_to_arrays(dataset)
+        table = SubtreeTable(xs, max_entries=subtree_cache)
+        score = lambda t: _mse(table.evaluate(t), ys)
+    cache = None
+    if cache_size > 0:
+        cache = score = FitnessCache(score, maxsize=cache_size)
+    evaluator = None
+    if parallel:
+        evaluator = ParallelEvaluator(dataset, workers=workers, batch_size=batch_size)
+
+    def score_population(pop) -> List[float]:
+        if evaluator is None:
+            return [score(ind) for ind in pop]
+        return evaluator.evaluate(pop).tolist()
+
+    select = SELECTION_METHODS[selection]
     history = []
 
-    for gen in range(generations):
-        # calcula fitness de toda população
-        pop_fitness = [(ind, fitness(ind, dataset)) for ind in population]
-        pop_fitness.sort(key=lambda x: x[1])  # ordena por fitness crescente (menor é melhor)
+    try:
+        for gen in range(generations):
+            # calcula fitness de toda população
+            fits = score_population(population)
+            pop_fitness = list(zip(population, fits))
+            select_score = score
+            if evaluator is not None:
+                # torneios consultam a avaliação em lote (sem reavaliar no processo principal)
+                known = dict(zip(map(structural_key, population), fits))
+                select_score = lambda t: known[structural_key(t)]
+            pop_fitness.sort(key=lambda x: x[1])  # ordena por fitness crescente (menor é melhor)
+            if table is not None:
+                table.sweep()  # mantém apenas subárvores da população atual
 
-        # registra melhor
-        best_ind, best_fit = pop_fitness[0]
-        history.append(best_fit)
+            # registra melhor e estatísticas de tamanho
+            best_ind, best_fit = pop_fitness[0]
+            history.append(best_fit)
+            sizes = [tree_size(ind) for ind in population]
+            mean_size = sum(sizes) / len(sizes)
+            if size_stats is not None:
+                size_stats.append((mean_size, max(sizes)))
 
-        # imprime resumo
-        if gen % 5 == 0 or gen == generations - 1:
-            print(f"Geração {gen:03d} | Melhor MSE = {best_fit:.6f} | Expr = {tree_to_string(best_ind)}")
+            # imprime resumo
+            if gen % 5 == 0 or gen == generations - 1:
+                print(f"Geração {gen:03d} | Melhor MSE = {best_fit:.6f} | Tamanho médio = {mean_size:.1f} "
+                      f"| Expr = {tree_to_string(best_ind)}")
 
-        # elitismo: preserva top N
-        new_population = [ind.copy() for ind, _ in pop_fitness[:elite_size]]
+            # elitismo: preserva top N
+            new_population = [ind.copy() for ind, _ in pop_fitness[:elite_size]]
 
-        # preenche restante da população
-        while len(new_population) < pop_size:
-            # seleção
-            parent1 = tournament_selection(population, dataset, tournament_k)
-            parent2 = tournament_selection(population, dataset, tournament_k)
+            # preenche restante da população
+            while len(new_population) < pop_size:
+                # seleção
+                parent1 = select(population, dataset, tournament_k, select_score)
+                parent2 = select(population, dataset, tournament_k, select_score)
 
-            # reprodução
-            if random.random() < crossover_rate:
-                child1, child2 = subtree_crossover(parent1, parent2, max_depth)
-            else:
-                child1, child2 = parent1.copy(), parent2.copy()
+                # reprodução
+                if random.random() < crossover_rate:
+                    child1, child2 = crossover_op(parent1, parent2, max_depth, max_size)
+                else:
+                    child1, child2 = parent1.copy(), parent2.copy()
 
-            # mutação
-            if random.random() < mutation_rate:
-                child1 = subtree_mutation(child1, max_depth)
-            if random.random() < mutation_rate and len(new_population) + 1 < pop_size:
-                child2 = subtree_mutation(child2, max_depth)
+                # mutação
+                if random.random() < mutation_rate:
+                    child1 = mutation_op(child1, max_depth, max_size)
+                if random.random() < mutation_rate and len(new_population) + 1 < pop_size:
+                    child2 = mutation_op(child2, max_depth, max_size)
 
-            new_population.append(child1)
-            if len(new_population) < pop_size:
-                new_population.append(child2)
+                new_population.append(child1)
+                if len(new_population) < pop_size:
+                    new_population.append(child2)
 
-        population = new_population
+            population = PackedPopulation(new_population) if linear else new_population
 
-    # ao final, retorna melhor indivíduo (reavaliado)
-    final_pop_fitness = [(ind, fitness(ind, dataset)) for ind in population]
-    final_pop_fitness.sort(key=lambda x: x[1])
-    best_individual, best_fit = final_pop_fitness[0]
+        # ao final, retorna melhor indivíduo (reavaliado)
+        final_pop_fitness = list(zip(population, score_population(population)))
+        final_pop_fitness.sort(key=lambda x: x[1])
+        best_individual, best_fit = final_pop_fitness[0]
+    finally:
+        if evaluator is not None:
+            evaluator.close()  # libera o pool mesmo com exceção ou Ctrl-C
+    if cache is not None:
+        print(f"Cache de fitness: {cache.hits} acertos, {cache.misses} avaliações "
+              f"(taxa de acerto = {cache.hit_rate:.1%})")
     return best_individual, history
 
 # -------------------------
@@ -358,7 +1138,9 @@ if __name__ == "__main__":
         tournament_k=5,
         crossover_rate=0.9,
         mutation_rate=0.35,
-        elite_size=2
+        elite_size=2,
+        vectorized=True,
+        cache_size=5000
     )
 
     # imprime resultado final
@@ -378,7 +1160,7 @@ if __name__ == "__main__":
     # plota predição vs real
     xs = [x for x, _ in dataset]
     ys_true = [y for _, y in dataset]
-    ys_pred = [evaluate_tree(best_tree, x) for x in xs]
+    ys_pred = compile_tree(best_tree)(xs)
 
     plt.figure(figsize=(8, 5))
     plt.scatter(xs, ys_true, label="Real (target)", s=20)
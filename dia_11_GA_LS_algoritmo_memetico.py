@@ -24,10 +24,13 @@ Características:
 - Saída: imprime progresso e plota convergência (melhor fitness por geração)
 """
 import random
-import math
 import copy
+import heapq
+import numpy as np
 import matplotlib.pyplot as plt
 
+from funcoes_objetivo import rastrigin
+
 # -----------------------------
 # 1) Hiperparâmetros
 # -----------------------------
@@ -54,13 +57,8 @@ LOCAL_STEP_STD = 0.1       # escala dos passos locais (gaussiano)
 # -----------------------------
 # 2) Função Rastrigin (a minimizar)
 # -----------------------------
-def rastrigin(x):
-    """
-    Rastrigin function: multimodal com muitos ótimos locais.
-    f(x) >= 0; f(0)=0.
-    """
-    A = 10.0
-    return A * len(x) + sum([(xi ** 2 - A * math.cos(2 * math.pi * xi)) for xi in x])
+# rastrigin vem de funcoes_objetivo: multimodal, f(x) >= 0 e f(0) = 0.
+# Aceita um indivíduo (lista de DIM floats) ou a população como matriz (N, DIM).
 
 # -----------------------------
 # 3) Inicialização (população de vetores reais)
@@ -77,16 +75,20 @@ def initialize_population():
 # -----------------------------
 def evaluate(individual):
     """Avalia um indivíduo pela função objetivo (fitness = valor a minimizar)."""
-    return rastrigin(individual)
+    return float(rastrigin(individual))
+
+def evaluate_population(population):
+    """Avalia a população inteira em uma única chamada (matriz POP_SIZE x DIM)."""
+    return rastrigin(np.array(population)).tolist()
 
 # -----------------------------
 # 5) Seleção: torneio
 # -----------------------------
-def tournament_selection(population, k=TOURNAMENT_K):
-    """Retorna uma cópia do vencedor do torneio (melhor entre k amostras)."""
-    candidates = random.sample(population, k)
-    winner = min(candidates, key=evaluate)  # min, pois queremos minimizar
-    return copy.deepcopy(winner)
+def tournament_selection(population, fitness, k=TOURNAMENT_K):
+    """Retorna uma cópia do vencedor do torneio (melhor entre k amostras, fitness em cache)."""
+    candidates = random.sample(range(len(population)), k)
+    winner = min(candidates, key=fitness.__getitem__)  # min, pois queremos minimizar
+    return copy.deepcopy(population[winner])
 
 # -----------------------------
 # 6) Crossover: blend/arithmetic
@@ -148,21 +150,21 @@ def local_search_hillclimb(individual, iters=LOCAL_SEARCH_ITERS, step_std=LOCAL_
 # -----------------------------
 # 9) Geração nova com elitismo + memética
 # -----------------------------
-def create_new_generation(population):
+def create_new_generation(population, fitness):
     """
-    Gera nova população:
+    Gera nova população (fitness: valores já calculados para `population`):
       - preserva elites
       - cria filhos por seleção, crossover, mutação
       - aplica busca local em alguns filhos (memetic refinement)
     """
-    # ordena população pelo fitness (menor é melhor)
-    sorted_pop = sorted(population, key=evaluate)
-    new_pop = [copy.deepcopy(ind) for ind in sorted_pop[:ELITE_SIZE]]  # preserva elites
+    # elites: só os ELITE_SIZE menores fitness (heap de k, sem ordenar a população)
+    elite_idx = heapq.nsmallest(ELITE_SIZE, range(len(population)), key=fitness.__getitem__)
+    new_pop = [copy.deepcopy(population[i]) for i in elite_idx]  # preserva elites
 
     while len(new_pop) < POP_SIZE:
         # seleção de pais
-        parent1 = tournament_selection(population)
-        parent2 = tournament_selection(population)
+        parent1 = tournament_selection(population, fitness)
+        parent2 = tournament_selection(population, fitness)
 
         # crossover (com probabilidade)
         if random.random() < CROSSOVER_RATE:
@@ -190,19 +192,20 @@ def memetic_algorithm():
     best_history = []
 
     for gen in range(1, NUM_GENERATIONS + 1):
-        # registra melhor atual
-        best = min(population, key=evaluate)
-        best_f = evaluate(best)
+        # avalia a geração em lote e registra o melhor atual
+        fitness = evaluate_population(population)
+        best_f = min(fitness)
         best_history.append(best_f)
 
         if gen % 10 == 0 or gen == 1:
             print(f"Geração {gen:03d} | Melhor fitness (mín) = {best_f:.6f}")
 
         # gerar próxima geração
-        population = create_new_generation(population)
+        population = create_new_generation(population, fitness)
 
     # retorno do melhor e histórico
-    best = min(population, key=evaluate)
+    fitness = evaluate_population(population)
+    best = population[fitness.index(min(fitness))]
     return best, best_history
 
 # -----------------------------
@@ -25,17 +25,29 @@ Parâmetros:
 
 import random
 import math
+import numpy as np
 import matplotlib.pyplot as plt
 
+from funcoes_objetivo import shifted, sphere
+
 random.seed(42)
 
 # -------------------------------------------------------------
 # 1️⃣ Função objetivo
 # -------------------------------------------------------------
+# f(x, y) = (x - 3)^2 + (y + 2)^2: esfera com o ótimo deslocado para (3, -2),
+# vetorizada (matriz (N, 2) -> N valores)
+objective = shifted(sphere, (3, -2))
+
+
 def fitness(ind):
     """Retorna o valor da função f(x,y) a ser minimizada."""
-    x, y, _, _ = ind
-    return (x - 3)**2 + (y + 2)**2
+    return float(objective(ind[:2]))
+
+
+def fitness_batch(population):
+    """Avalia todos os indivíduos (x, y, σ_x, σ_y) em uma única chamada."""
+    return objective(np.array(population)[:, :2])
 
 
 # -------------------------------------------------------------
@@ -114,16 +126,17 @@ def evolution_strategy(mu=10, lambd=40, generations=80):
         # união μ + λ
         combined = population + children
 
-        # selecionar os μ melhores
-        combined_sorted = sorted(combined, key=lambda ind: fitness(ind))
-        population = combined_sorted[:mu]
+        # selecionar os μ melhores (avaliação em lote + ordenação estável)
+        values = fitness_batch(combined)
+        order = np.argsort(values, kind="stable")[:mu]
+        population = [combined[i] for i in order]
 
         # melhor da geração
         best = population[0]
-        best_history.append(fitness(best))
+        best_history.append(values[order[0]])
 
         if g % 10 == 0:
-            print(f"Geração {g:02d} | Melhor f = {fitness(best):.4f} | x,y = {best[0]:.3f}, {best[1]:.3f}")
+            print(f"Geração {g:02d} | Melhor f = {values[order[0]]:.4f} | x,y = {best[0]:.3f}, {best[1]:.3f}")
 
     return population[0], best_history
 
@@ -13,6 +13,12 @@ Características:
 - Crossover: binomial (CR)
 - Seleção: competição entre alvo e trial (sobrevive o melhor)
 - Minimização: fitness = função objetivo (quanto menor, melhor)
+- Modo vetorizado (síncrono): a geração inteira é feita com operações de
+  matriz (índices r1/r2/r3, mutantes, máscara binomial, limites e avaliação);
+  o modo original, assíncrono e indivíduo a indivíduo, continua disponível
+- DE adaptativo (JADE / SHADE): F e CR por indivíduo, sorteados de
+  distribuições aprendidas com os sucessos, mutação current-to-pbest/1 e
+  arquivo externo de pais substituídos
 
 Como executar:
     python dia_13_de.py
@@ -22,9 +28,10 @@ Dependências:
 """
 import numpy as np
 import random
-import math
 import matplotlib.pyplot as plt
 
+from funcoes_objetivo import rastrigin
+
 # -----------------------------
 # 0) Reprodutibilidade
 # -----------------------------
@@ -46,15 +53,9 @@ UPPER_BOUND = 5.12
 # -----------------------------
 # 2) Função objetivo: Rastrigin (multimodal)
 # -----------------------------
-def rastrigin(vec):
-    """
-    Rastrigin function: multimodal, muitas armadilhas locais.
-    f(x) = A*n + sum(x_i^2 - A*cos(2*pi*x_i)), A=10
-    Mínimo global em x = 0 -> f = 0
-    Input: 1D numpy array
-    """
-    A = 10.0
-    return A * vec.size + np.sum(vec**2 - A * np.cos(2 * math.pi * vec))
+# rastrigin vem de funcoes_objetivo:
+#   f(x) = A*n + sum(x_i^2 - A*cos(2*pi*x_i)), A=10, mínimo global em x = 0 -> f = 0
+#   vetor 1D -> escalar; matriz (N, D) -> N valores (a população em uma chamada)
 
 # -----------------------------
 # 3) Inicialização da população
@@ -112,16 +113,74 @@ def ensure_bounds(vec, lb, ub):
     return np.minimum(np.maximum(vec, lb), ub)
 
 # -----------------------------
-# 7) Loop principal do DE
+# 7) Operadores vetorizados (população inteira de uma vez)
+# -----------------------------
+def distinct_indices(pop_size, n, rng, exclude=None, size=None):
+    """
+    Para cada alvo i (uma linha por indivíduo), sorteia n índices distintos
+    entre si e diferentes de i e das colunas de `exclude`, em [0, size).
+    Cada sorteio usa um intervalo menor e "pula" os índices já usados
+    (em ordem crescente), o que dá uma amostra uniforme sem laços por alvo.
+    """
+    size = pop_size if size is None else size
+    used = [np.arange(pop_size)]
+    if exclude is not None:
+        used.extend(np.asarray(exclude).reshape(pop_size, -1).T)
+    chosen = []
+    for _ in range(n):
+        taken = np.sort(np.column_stack(used), axis=1)
+        r = rng.integers(0, size - taken.shape[1], size=pop_size)
+        for col in taken.T:
+            r += r >= col
+        chosen.append(r)
+        used.append(r)
+    return np.column_stack(chosen)
+
+
+def mutation_rand_1_batch(pop, F, rng):
+    """DE/rand/1 para todos os alvos: V = X[r1] + F * (X[r2] - X[r3])."""
+    r1, r2, r3 = distinct_indices(pop.shape[0], 3, rng).T
+    return pop[r1] + F * (pop[r2] - pop[r3])
+
+
+def crossover_binomial_batch(pop, mutants, CR, rng):
+    """
+    Crossover binomial em lote: máscara (NP x D) com prob. CR (escalar ou um
+    valor por indivíduo) + um gene jrand garantido por linha.
+    """
+    pop_size, dim = pop.shape
+    CR = np.asarray(CR)
+    if CR.ndim == 1:
+        CR = CR[:, None]
+    mask = rng.random((pop_size, dim)) < CR
+    mask[np.arange(pop_size), rng.integers(0, dim, size=pop_size)] = True
+    return np.where(mask, mutants, pop)
+
+
+# -----------------------------
+# 8) Loop principal do DE
 # -----------------------------
 def differential_evolution(
-    pop_size=POP_SIZE, dim=DIM, gens=GENS, F=F, CR=CR, lb=LOWER_BOUND, ub=UPPER_BOUND
+    pop_size=POP_SIZE, dim=DIM, gens=GENS, F=F, CR=CR, lb=LOWER_BOUND, ub=UPPER_BOUND,
+    vectorized=False, adaptive=None, seed=RANDOM_SEED,
 ):
+    """
+    vectorized=False: DE assíncrono original (cada trial substitui o alvo na
+    hora e já serve de doador para os seguintes).
+    vectorized=True: DE síncrono, a geração inteira em operações de matriz.
+    adaptive="jade" ou "shade": DE adaptativo (vetorizado; ignora F e CR).
+    """
+    if adaptive is not None:
+        return adaptive_differential_evolution(pop_size, dim, gens, lb, ub,
+                                               variant=adaptive, seed=seed)
+    if vectorized:
+        return differential_evolution_vectorized(pop_size, dim, gens, F, CR, lb, ub, seed)
+
     # inicializa população (matriz pop_size x dim)
     pop = initialize_population(pop_size, dim, lb, ub)
 
-    # avalia fitness inicial (vectorizado)
-    fitness_vals = np.array([rastrigin(ind) for ind in pop])
+    # avalia fitness inicial (uma chamada para a matriz inteira)
+    fitness_vals = rastrigin(pop)
 
     best_history = []
     best_idx = np.argmin(fitness_vals)
@@ -159,11 +218,173 @@ def differential_evolution(
 
     return best_vec, best_val, best_history, pop, fitness_vals
 
+
+def differential_evolution_vectorized(
+    pop_size=POP_SIZE, dim=DIM, gens=GENS, F=F, CR=CR, lb=LOWER_BOUND, ub=UPPER_BOUND,
+    seed=RANDOM_SEED,
+):
+    """
+    DE/rand/1/bin síncrono: todos os trials de uma geração são criados a partir
+    da mesma população e avaliados em uma única chamada a rastrigin.
+    """
+    rng = np.random.default_rng(seed)
+    pop = rng.uniform(lb, ub, size=(pop_size, dim))
+    fitness_vals = rastrigin(pop)
+
+    best_history = [fitness_vals.min()]
+
+    for g in range(1, gens + 1):
+        # mutação + crossover + limites para a população inteira
+        mutants = ensure_bounds(mutation_rand_1_batch(pop, F, rng), lb, ub)
+        trials = crossover_binomial_batch(pop, mutants, CR, rng)
+
+        # seleção: cada trial disputa com seu alvo
+        f_trials = rastrigin(trials)
+        improved = f_trials <= fitness_vals
+        pop[improved] = trials[improved]
+        fitness_vals[improved] = f_trials[improved]
+
+        best_history.append(fitness_vals.min())
+
+        if g % 10 == 0 or g == 1:
+            print(f"Geração {g:03d} | Melhor fitness = {best_history[-1]:.6f}")
+
+    best_idx = np.argmin(fitness_vals)
+    return pop[best_idx].copy(), fitness_vals[best_idx], best_history, pop, fitness_vals
+
+# -----------------------------
+# 9) DE adaptativo: JADE / SHADE
+# -----------------------------
+def mutation_current_to_pbest_1(pop, fitness_vals, F, p, archive, rng):
+    """
+    Mutação current-to-pbest/1 para todos os alvos:
+      v_i = x_i + F_i * (x_pbest - x_i) + F_i * (x_r1 - x~_r2)
+    x_pbest é sorteado entre os ceil(p * NP) melhores (p escalar ou por
+    indivíduo), x_r1 vem da população e x~_r2 da união população ∪ arquivo,
+    com i, r1 e r2 distintos.
+    """
+    pop_size = pop.shape[0]
+    union = np.vstack((pop, archive)) if len(archive) else pop
+    n_top = np.maximum(1, np.ceil(np.asarray(p) * pop_size)).astype(int)
+    order = np.argsort(fitness_vals)
+    pbest = order[(rng.random(pop_size) * n_top).astype(int)]
+    r1 = distinct_indices(pop_size, 1, rng)[:, 0]
+    r2 = distinct_indices(pop_size, 1, rng, exclude=r1, size=len(union))[:, 0]
+    F = F[:, None]
+    return pop + F * (pop[pbest] - pop) + F * (pop[r1] - union[r2])
+
+
+def repair_bounds_midpoint(mutants, pop, lb, ub):
+    """Componentes fora de [lb, ub] vão para o ponto médio entre o limite e o pai."""
+    mutants = np.where(mutants < lb, (lb + pop) / 2, mutants)
+    return np.where(mutants > ub, (ub + pop) / 2, mutants)
+
+
+def sample_cauchy_F(loc, rng):
+    """F_i ~ Cauchy(loc_i, 0.1): valores <= 0 são ressorteados e > 1 truncados em 1."""
+    F = loc + 0.1 * rng.standard_cauchy(len(loc))
+    bad = F <= 0
+    while bad.any():
+        F[bad] = loc[bad] + 0.1 * rng.standard_cauchy(bad.sum())
+        bad = F <= 0
+    return np.minimum(F, 1.0)
+
+
+def lehmer_mean(values, weights=None):
+    """Média de Lehmer sum(w*v^2) / sum(w*v): puxa F para valores maiores."""
+    weights = np.ones_like(values) if weights is None else weights
+    return np.sum(weights * values**2) / np.sum(weights * values)
+
+
+def adaptive_differential_evolution(
+    pop_size=POP_SIZE, dim=DIM, gens=GENS, lb=LOWER_BOUND, ub=UPPER_BOUND,
+    variant="jade", p=0.05, c=0.1, memory_size=10, archive_rate=1.0,
+    target=None, seed=RANDOM_SEED,
+):
+    """
+    DE adaptativo com a geração inteira vetorizada.
+    - variant="jade": mu_CR e mu_F únicos, atualizados com taxa c pela média
+      (CR) e média de Lehmer (F) dos parâmetros que geraram sucessos;
+      pbest entre os p*NP melhores
+    - variant="shade": memória histórica de memory_size pares (M_CR, M_F),
+      cada indivíduo sorteia uma posição; atualização por médias ponderadas
+      pela melhoria do fitness; p sorteado por indivíduo em [2/NP, 0.2]
+    - arquivo externo: pais substituídos (até archive_rate * NP, com descarte
+      aleatório) alimentam o vetor diferencial x_r1 - x~_r2
+    - target: para ao atingir fitness <= target
+    Imprime o total de avaliações da função objetivo.
+    """
+    rng = np.random.default_rng(seed)
+    pop = rng.uniform(lb, ub, size=(pop_size, dim))
+    fitness_vals = rastrigin(pop)
+    evaluations = pop_size
+    archive = np.empty((0, dim))
+    max_archive = int(round(archive_rate * pop_size))
+
+    mu_CR, mu_F = 0.5, 0.5                                   # JADE
+    memory_CR, memory_F = np.full(memory_size, 0.5), np.full(memory_size, 0.5)  # SHADE
+    k = 0
+
+    best_history = [fitness_vals.min()]
+
+    for g in range(1, gens + 1):
+        # 1) parâmetros por indivíduo
+        if variant == "shade":
+            slot = rng.integers(0, memory_size, size=pop_size)
+            loc_CR, loc_F = memory_CR[slot], memory_F[slot]
+            p_i = rng.uniform(2 / pop_size, 0.2, size=pop_size)
+        else:
+            loc_CR, loc_F = np.full(pop_size, mu_CR), np.full(pop_size, mu_F)
+            p_i = p
+        CR_i = np.clip(rng.normal(loc_CR, 0.1), 0.0, 1.0)
+        F_i = sample_cauchy_F(loc_F, rng)
+
+        # 2) mutação + crossover + reparo de limites (população inteira)
+        mutants = mutation_current_to_pbest_1(pop, fitness_vals, F_i, p_i, archive, rng)
+        mutants = repair_bounds_midpoint(mutants, pop, lb, ub)
+        trials = crossover_binomial_batch(pop, mutants, CR_i, rng)
+
+        # 3) seleção; pais substituídos vão para o arquivo
+        f_trials = rastrigin(trials)
+        evaluations += pop_size
+        improved = f_trials <= fitness_vals
+        success = f_trials < fitness_vals
+        gain = fitness_vals[success] - f_trials[success]
+        archive = np.vstack((archive, pop[success]))
+        if len(archive) > max_archive:
+            archive = archive[rng.choice(len(archive), max_archive, replace=False)]
+        pop[improved] = trials[improved]
+        fitness_vals[improved] = f_trials[improved]
+
+        # 4) adaptação de CR e F a partir dos sucessos
+        if success.any():
+            S_CR, S_F = CR_i[success], F_i[success]
+            if variant == "shade":
+                w = gain / gain.sum()
+                memory_CR[k] = np.sum(w * S_CR)
+                memory_F[k] = lehmer_mean(S_F, w)
+                k = (k + 1) % memory_size
+            else:
+                mu_CR = (1 - c) * mu_CR + c * S_CR.mean()
+                mu_F = (1 - c) * mu_F + c * lehmer_mean(S_F)
+
+        best_history.append(fitness_vals.min())
+
+        if g % 10 == 0 or g == 1:
+            print(f"Geração {g:03d} | Melhor fitness = {best_history[-1]:.6f}")
+
+        if target is not None and best_history[-1] <= target:
+            break
+
+    print(f"Avaliações da função objetivo: {evaluations}")
+    best_idx = np.argmin(fitness_vals)
+    return pop[best_idx].copy(), fitness_vals[best_idx], best_history, pop, fitness_vals
+
 # -----------------------------
-# 8) Execução
+# 10) Execução
 # -----------------------------
 if __name__ == "__main__":
-    best_vec, best_val, history, final_pop, final_fitness = differential_evolution()
+    best_vec, best_val, history, final_pop, final_fitness = differential_evolution(vectorized=True)
     print("\n=== Resultado final ===")
     print("Melhor fitness encontrado:", best_val)
     print("Melhor vetor (primeiras 6 componentes):", np.round(best_vec[:6], 6))
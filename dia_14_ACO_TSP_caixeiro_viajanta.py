@@ -1,5 +1,9 @@
+import math
+from collections import deque
+
 import numpy as np
-import random
+
+from tsp_instancias import distancias_pares, matriz_distancias
 
 
 # -------------------------------------------------------------
@@ -9,81 +13,564 @@ def gerar_cidades(n=10, limite=100):
     return np.random.rand(n, 2) * limite
 
 
-# --------------------------------------------------------------
-# Função de distância Euclidiana
-# --------------------------------------------------------------
-def distancia(a, b):
-    return np.linalg.norm(a - b)
+# -------------------------------------------------------------
+# Pesos de escolha: feromônio ^ alpha  *  (1 / distância) ^ beta
+# (matriz n x n, recalculada uma vez por iteração)
+# -------------------------------------------------------------
+def pesos_escolha(feromonio, distancias, alpha=1.0, beta=2.0):
+    eta = np.zeros_like(distancias, dtype=float)
+    np.divide(1.0, distancias, out=eta, where=distancias > 0)  # diagonal fica 0
+    return feromonio ** alpha * eta ** beta
 
 
 # -------------------------------------------------------------
-# Construir rota usando probabilidade baseada em
-# feromônio ^ alpha  *  (1 / distância) ^ beta
+# Construir as rotas de todas as formigas em passo sincronizado:
+# - máscara booleana de visitados (formigas x cidades)
+# - a cada passo, cada formiga usa a linha de pesos da sua cidade atual,
+#   zerada nas cidades já visitadas
+# - sorteio por CDF inversa: soma acumulada por linha e primeira posição
+#   em que ela ultrapassa u * total
 # -------------------------------------------------------------
-def construir_rota(feromonio, distancias, alpha=1.0, beta=2.0):
-    n = len(distancias)
-    visitados = [random.randint(0, n - 1)]
+def construir_rotas(pesos, num_formigas):
+    n = len(pesos)
+    formigas = np.arange(num_formigas)
+    rotas = np.empty((num_formigas, n), dtype=np.int64)
+    visitado = np.zeros((num_formigas, n), dtype=bool)
 
-    for _ in range(n - 1):
-        atual = visitados[-1]
-        nao_visitados = [i for i in range(n) if i not in visitados]
+    atual = np.random.randint(0, n, size=num_formigas)
+    rotas[:, 0] = atual
+    visitado[formigas, atual] = True
+
+    for passo in range(1, n):
+        w = np.where(visitado, 0.0, pesos[atual])
+        # sem peso disponível (ex.: distâncias nulas): sorteio uniforme entre não visitadas
+        sem_peso = w.sum(axis=1) <= 0
+        if sem_peso.any():
+            w[sem_peso] = ~visitado[sem_peso]
+
+        acumulado = np.cumsum(w, axis=1)
+        u = np.random.random(num_formigas) * acumulado[:, -1]
+        proxima = np.argmax(acumulado > u[:, None], axis=1)
+
+        rotas[:, passo] = proxima
+        visitado[formigas, proxima] = True
+        atual = proxima
+
+    return rotas
+
+
+# -------------------------------------------------------------
+# Grade espacial uniforme (~6 cidades por célula) para buscas de
+# vizinhança sem matriz n x n: as cidades de cada célula ficam em um
+# trecho contíguo de `ordem`, e células vizinhas na mesma coluna x
+# formam um único trecho
+# -------------------------------------------------------------
+# acima de tantos pares ponto x candidato (aglomerados), um bloco com
+# muitos pontos pendentes é resolvido por uma sub-grade em vez de força bruta
+LIMITE_BLOCO = 2**20
 
-        # Probabilidade proporcional ao feromônio e à heurística
-        probs = []
-        for j in nao_visitados:
-            tau = feromonio[atual][j] ** alpha
-            eta = (1 / distancias[atual][j]) ** beta
-            probs.append(tau * eta)
 
-        probs = np.array(probs)
-        probs = probs / probs.sum()
+class GradeEspacial:
+    def __init__(self, cidades, por_celula=6):
+        self.cidades = np.asarray(cidades, dtype=float)
+        self.por_celula = por_celula
+        n = len(self.cidades)
+        minimo = self.cidades.min(axis=0)
+        extensao = self.cidades.max(axis=0) - minimo
+        area = extensao[0] * extensao[1]
+        if area > 0:
+            self.lado = np.sqrt(area * por_celula / n)
+        else:
+            self.lado = max(extensao.max() * por_celula / n, 1e-12)
+        self.nx, self.ny = (extensao // self.lado).astype(int) + 1
 
-        # Escolher próxima cidade conforme distribuição de probabilidade
-        proxima = np.random.choice(nao_visitados, p=probs)
-        visitados.append(proxima)
+        self.celula = ((self.cidades - minimo) // self.lado).astype(int)
+        ids = self.celula[:, 0] * self.ny + self.celula[:, 1]
+        self.ordem = np.argsort(ids, kind="stable")
+        self.contagem = np.bincount(ids, minlength=self.nx * self.ny)
+        self.inicio = np.concatenate(([0], np.cumsum(self.contagem)))
+
+    def bloco(self, cx, cy, r):
+        # cidades nas células a até r de (cx, cy): quadrado (2r+1) x (2r+1)
+        y0, y1 = max(cy - r, 0), min(cy + r, self.ny - 1)
+        partes = [
+            self.ordem[self.inicio[x * self.ny + y0]:self.inicio[x * self.ny + y1 + 1]]
+            for x in range(max(cx - r, 0), min(cx + r, self.nx - 1) + 1)
+        ]
+        return np.concatenate(partes)
+
+    def cobre_tudo(self, cx, cy, r):
+        return cx - r <= 0 and cy - r <= 0 and cx + r >= self.nx - 1 and cy + r >= self.ny - 1
+
+    def vizinhos_proximos(self, k=10, max_elementos=2**24):
+        # k vizinhos mais próximos de cada cidade (exatos): um ponto de fora do
+        # bloco de raio r está a pelo menos r * lado de qualquer cidade da célula
+        # central; quem não cumpre isso é refeito com um bloco maior
+        n = len(self.cidades)
+        k = min(k, n - 1)
+        vizinhos = np.empty((n, k), dtype=np.int64)
+        dist = np.empty((n, k))
+
+        # 1ª passada vetorizada: blocos 3 x 3 de todas as cidades de uma vez,
+        # com as células completadas por -1 até a maior contagem, limitada a
+        # 4 x por_celula: cidades com alguma célula mais cheia no bloco
+        # (aglomerados) ficam para a passada célula a célula
+        pendentes = np.ones(n, dtype=bool)
+        m = min(self.contagem.max(), 4 * self.por_celula)
+        if (len(self.contagem) + 1) * m <= max_elementos:
+            tabela = np.full((len(self.contagem) + 1, m), -1)  # última linha: célula vazia
+            cheia = np.append(self.contagem > m, False)
+            ids = self.celula[self.ordem, 0] * self.ny + self.celula[self.ordem, 1]
+            posicao = np.arange(n) - self.inicio[ids]
+            cabe = posicao < m
+            tabela[ids[cabe], posicao[cabe]] = self.ordem[cabe]
+            passo = max(1, max_elementos // (9 * m))
+            for ini in range(0, n, passo):
+                pontos = np.arange(ini, min(ini + passo, n))
+                blocos = []
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        x = self.celula[pontos, 0] + dx
+                        y = self.celula[pontos, 1] + dy
+                        dentro = (x >= 0) & (x < self.nx) & (y >= 0) & (y < self.ny)
+                        blocos.append(np.where(dentro, x * self.ny + y, len(self.contagem)))
+                blocos = np.stack(blocos, axis=1)
+                completos = ~cheia[blocos].any(axis=1)
+                pontos, blocos = pontos[completos], blocos[completos]
+                if not len(pontos):
+                    continue
+                cand = tabela[blocos].reshape(len(pontos), -1)
+                ok = self._guardar_vizinhos(pontos, cand, k, 1, vizinhos, dist)
+                pendentes[pontos[ok]] = False
+
+        # restantes (aglomerados, células esparsas ou bordas): célula a
+        # célula, raio crescente
+        for c in np.unique(self.celula[pendentes, 0] * self.ny + self.celula[pendentes, 1]):
+            pontos = self.ordem[self.inicio[c]:self.inicio[c + 1]]
+            pontos = pontos[pendentes[pontos]]
+            cx, cy = divmod(int(c), self.ny)
+            r = 1
+            while len(pontos):
+                cand = self.bloco(cx, cy, r)
+                tudo = self.cobre_tudo(cx, cy, r)
+                if len(cand) - 1 >= k or tudo:
+                    ok = self._vizinhos_no_bloco(pontos, cand, k, np.inf if tudo else r,
+                                                 vizinhos, dist, max_elementos)
+                    pontos = pontos[~ok]
+                r += 1
+
+        return vizinhos, dist
+
+    def _vizinhos_no_bloco(self, pontos, cand, k, r, vizinhos, dist, max_elementos):
+        # k mais próximos de `pontos` entre as cidades `cand` de um bloco
+        if (len(pontos) > 64 and len(pontos) * len(cand) > LIMITE_BLOCO
+                and len(cand) < len(self.cidades)):
+            # bloco muito povoado: kNN exato dentro do bloco por uma sub-grade
+            # ajustada às suas cidades (cada nível recebe um conjunto menor)
+            sub = GradeEspacial(self.cidades[cand], self.por_celula)
+            if sub.contagem.max() < len(cand):
+                viz_sub, dist_sub = sub.vizinhos_proximos(k, max_elementos)
+                por_indice = np.argsort(cand)
+                local = por_indice[np.searchsorted(cand, pontos, sorter=por_indice)]
+                ok = dist_sub[local, -1] <= r * self.lado
+                vizinhos[pontos[ok]] = cand[viz_sub[local[ok]]]
+                dist[pontos[ok]] = dist_sub[local[ok]]
+                return ok
+
+        # força bruta contra o bloco, em fatias que limitam a memória temporária
+        ok = np.empty(len(pontos), dtype=bool)
+        passo = max(1, max_elementos // (4 * len(cand)))
+        for ini in range(0, len(pontos), passo):
+            fatia = pontos[ini:ini + passo]
+            matriz = np.broadcast_to(cand, (len(fatia), len(cand)))
+            ok[ini:ini + passo] = self._guardar_vizinhos(fatia, matriz, k, r, vizinhos, dist)
+        return ok
+
+    def _guardar_vizinhos(self, pontos, cand, k, r, vizinhos, dist):
+        # k mais próximos entre os candidatos de cada ponto (-1 = vazio);
+        # grava e devolve quem passou no critério de exatidão do raio r
+        valido = (cand >= 0) & (cand != pontos[:, None])
+        d = np.sqrt(((self.cidades[pontos][:, None] - self.cidades[cand]) ** 2).sum(-1))
+        d[~valido] = np.inf
+        if d.shape[1] < k:
+            return np.zeros(len(pontos), dtype=bool)
+        sel = np.argpartition(d, k - 1, axis=1)[:, :k]
+        dk = np.take_along_axis(d, sel, axis=1)
+        por_dist = np.argsort(dk, axis=1)
+        sel = np.take_along_axis(sel, por_dist, axis=1)
+        dk = np.take_along_axis(dk, por_dist, axis=1)
+
+        ok = dk[:, -1] <= r * self.lado
+        vizinhos[pontos[ok]] = np.take_along_axis(cand, sel, axis=1)[ok]
+        dist[pontos[ok]] = dk[ok]
+        return ok
+
+    def mais_proxima(self, cidade, visitado):
+        # cidade não visitada mais próxima: primeiro nos blocos vizinhos
+        # (raios crescentes), depois força bruta sobre as cidades livres
+        cx, cy = self.celula[cidade]
+        ponto = self.cidades[cidade]
+        for r in (1, 2, 4, 8, 16):
+            cand = self.bloco(cx, cy, r)
+            cand = cand[~visitado[cand]]
+            tudo = self.cobre_tudo(cx, cy, r)
+            if len(cand):
+                d = ((self.cidades[cand] - ponto) ** 2).sum(axis=1)
+                j = np.argmin(d)
+                if np.sqrt(d[j]) <= r * self.lado or tudo:
+                    return cand[j]
+            if tudo:
+                break
+        cand = np.flatnonzero(~visitado)
+        return cand[np.argmin(((self.cidades[cand] - ponto) ** 2).sum(axis=1))]
+
+
+# -------------------------------------------------------------
+# Construção com listas de candidatos (instâncias grandes):
+# cada formiga escolhe só entre os k vizinhos mais próximos ainda não
+# visitados; se todos já foram visitados, vai para a cidade livre mais
+# próxima. Pesos e feromônio ficam em matrizes n x k, alinhadas a
+# `candidatos` (memória linear em n·k)
+# -------------------------------------------------------------
+def construir_rotas_candidatos(pesos_cand, candidatos, grade, num_formigas):
+    n = len(candidatos)
+    formigas = np.arange(num_formigas)
+    rotas = np.empty((num_formigas, n), dtype=np.int64)
+    visitado = np.zeros((num_formigas, n), dtype=bool)
 
-    return visitados
+    atual = np.random.randint(0, n, size=num_formigas)
+    rotas[:, 0] = atual
+    visitado[formigas, atual] = True
+
+    for passo in range(1, n):
+        cand = candidatos[atual]
+        w = np.where(visitado[formigas[:, None], cand], 0.0, pesos_cand[atual])
+
+        acumulado = np.cumsum(w, axis=1)
+        u = np.random.random(num_formigas) * acumulado[:, -1]
+        proxima = cand[formigas, np.argmax(acumulado > u[:, None], axis=1)]
+
+        # candidatos esgotados: melhor cidade restante (a mais próxima)
+        for f in np.flatnonzero(acumulado[:, -1] <= 0):
+            proxima[f] = grade.mais_proxima(atual[f], visitado[f])
+
+        rotas[:, passo] = proxima
+        visitado[formigas, proxima] = True
+        atual = proxima
+
+    return rotas
 
 
 # --------------------------------------------------------------
-# Calcular o tamanho total da rota
+# Calcular o tamanho total da rota (arestas por indexação:
+# distancias[rota, roll(rota)] pega i -> i+1 e a volta ao início)
 # --------------------------------------------------------------
 def calcular_custo(rota, distancias):
-    total = 0
-    for i in range(len(rota)):
-        total += distancias[rota[i]][rota[(i + 1) % len(rota)]]
-    return total
+    rota = np.asarray(rota)
+    return distancias[rota, np.roll(rota, -1)].sum()
+
+
+def calcular_custos(rotas, distancias):
+    # custo de todas as rotas (formigas x cidades) em uma chamada
+    return distancias[rotas, np.roll(rotas, -1, axis=1)].sum(axis=1)
 
 
 # --------------------------------------------------------------
-# Atualizar feromônio com evaporação + reforço por boas rotas
+# Atualizar feromônio com evaporação + reforço por boas rotas:
+# as arestas de todas as formigas viram dois vetores de índices
+# (a -> b e b -> a) e np.add.at acumula os depósitos repetidos
 # --------------------------------------------------------------
 def atualizar_feromonio(feromonio, rotas, custos, evaporacao=0.5, Q=100):
-    n = len(feromonio)
+    rotas = np.atleast_2d(rotas)
     feromonio *= (1 - evaporacao)
 
-    for rota, custo in zip(rotas, custos):
-        deposito = Q / custo
-        for i in range(len(rota)):
-            a = rota[i]
-            b = rota[(i + 1) % len(rota)]
-            feromonio[a][b] += deposito
-            feromonio[b][a] += deposito
+    proximas = np.roll(rotas, -1, axis=1)
+    deposito = np.repeat(Q / np.asarray(custos, dtype=float), rotas.shape[1])
+    a, b = rotas.ravel(), proximas.ravel()
+    np.add.at(feromonio, (a, b), deposito)
+    np.add.at(feromonio, (b, a), deposito)
 
     return feromonio
 
 
+# --------------------------------------------------------------
+# MAX–MIN Ant System (MMAS):
+# - só a melhor formiga da iteração deposita (Δτ = 1 / custo)
+# - feromônio limitado a [tau_min, tau_max], com
+#   tau_max = 1 / (evaporação · melhor custo) e tau_min derivado de
+#   p_best (chance de a rota da melhor formiga ser reconstruída)
+# - começa em tau_max e volta a tau_max quando a busca estagna
+# --------------------------------------------------------------
+def rota_vizinho_mais_proximo(distancias, inicio=0):
+    # rota gulosa, usada para estimar tau_max inicial
+    n = len(distancias)
+    visitado = np.zeros(n, dtype=bool)
+    rota = [inicio]
+    visitado[inicio] = True
+    for _ in range(n - 1):
+        d = np.where(visitado, np.inf, distancias[rota[-1]])
+        proxima = int(np.argmin(d))
+        rota.append(proxima)
+        visitado[proxima] = True
+    return np.array(rota)
+
+
+def limites_mmas(melhor_custo, n, evaporacao, p_best=0.05):
+    tau_max = 1.0 / (evaporacao * melhor_custo)
+    raiz = p_best ** (1.0 / n)
+    media_escolhas = max(n / 2 - 1, 1)
+    tau_min = tau_max * (1 - raiz) / (media_escolhas * raiz)
+    return min(tau_min, tau_max), tau_max
+
+
+def atualizar_feromonio_mmas(feromonio, rota, custo, evaporacao, tau_min, tau_max):
+    feromonio = atualizar_feromonio(feromonio, rota, [custo], evaporacao, Q=1.0)
+    return np.clip(feromonio, tau_min, tau_max, out=feromonio)
+
+
+# --------------------------------------------------------------
+# Versões para listas de candidatos: custo pelas coordenadas e
+# feromônio esparso (só nas arestas candidatas, matriz n x k)
+# --------------------------------------------------------------
+def custo_rotas_coordenadas(rotas, cidades, tipo="EUCLIDIANA"):
+    proximas = np.roll(rotas, -1, axis=1)
+    return distancias_pares(cidades[rotas], cidades[proximas], tipo).sum(axis=1)
+
+
+def atualizar_feromonio_candidatos(feromonio_cand, candidatos, rotas, custos, evaporacao=0.5, Q=100):
+    rotas = np.atleast_2d(rotas)
+    feromonio_cand *= (1 - evaporacao)
+
+    proximas = np.roll(rotas, -1, axis=1).ravel()
+    atuais = rotas.ravel()
+    deposito = np.repeat(Q / np.asarray(custos, dtype=float), rotas.shape[1])
+    # aresta a -> b reforça a posição de b na lista de a (e vice-versa);
+    # arestas fora das listas não guardam feromônio
+    for a, b in ((atuais, proximas), (proximas, atuais)):
+        igual = candidatos[a] == b[:, None]
+        tem = igual.any(axis=1)
+        np.add.at(feromonio_cand, (a[tem], igual[tem].argmax(axis=1)), deposito[tem])
+
+    return feromonio_cand
+
+
+# --------------------------------------------------------------
+# Busca local (2-opt e Or-opt) para refinar as rotas das formigas
+# - rota em array + posição de cada cidade: sucessor/predecessor em
+#   O(1) e segmentos invertidos no próprio array (o lado mais curto)
+# - só testa arestas para os k vizinhos mais próximos de cada cidade
+# - don't-look bits: uma fila com as cidades "ativas"; uma cidade só
+#   volta à fila quando uma aresta sua é alterada
+# --------------------------------------------------------------
+class RotaArray:
+    def __init__(self, rota):
+        self.cidades = [int(c) for c in rota]
+        self.n = len(self.cidades)
+        self.pos = [0] * self.n
+        for i, c in enumerate(self.cidades):
+            self.pos[c] = i
+
+    def sucessor(self, c):
+        return self.cidades[(self.pos[c] + 1) % self.n]
+
+    def predecessor(self, c):
+        return self.cidades[self.pos[c] - 1]
+
+    def inverter(self, i, j):
+        # inverte as posições i..j (circular, inclusive); inverter o
+        # complemento dá o mesmo ciclo, então troca pelo trecho menor
+        n = self.n
+        tamanho = (j - i) % n + 1
+        if 2 * tamanho > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            tamanho = n - tamanho
+        cidades, pos = self.cidades, self.pos
+        for _ in range(tamanho // 2):
+            a, b = cidades[i], cidades[j]
+            cidades[i], cidades[j] = b, a
+            pos[b], pos[a] = i, j
+            i = (i + 1) % n
+            j = (j - 1) % n
+
+    def mover_2opt(self, a, b, c, d):
+        # troca as arestas (a, b) e (c, d) por (a, c) e (b, d), com b e d
+        # seguindo a e c no mesmo sentido (qualquer um dos dois)
+        if self.sucessor(a) == b:
+            self.inverter(self.pos[b], self.pos[c])
+        else:
+            self.inverter(self.pos[c], self.pos[b])
+
+
+def vizinhos_matriz(distancias, k=10, max_elementos=2**22):
+    # k vizinhos mais próximos de cada cidade, a partir da matriz (em blocos)
+    n = len(distancias)
+    k = min(k, n - 1)
+    vizinhos = np.empty((n, k), dtype=np.int64)
+    linhas = max(1, max_elementos // max(n, 1))
+    for ini in range(0, n, linhas):
+        fim = min(ini + linhas, n)
+        d = np.array(distancias[ini:fim], dtype=float)
+        d[np.arange(fim - ini), np.arange(ini, fim)] = np.inf
+        sel = np.argpartition(d, k - 1, axis=1)[:, :k]
+        ordem = np.argsort(np.take_along_axis(d, sel, axis=1), axis=1)
+        vizinhos[ini:fim] = np.take_along_axis(sel, ordem, axis=1)
+    return vizinhos
+
+
+def funcao_distancia(distancias=None, cidades=None, tipo="EUCLIDIANA"):
+    # distância entre duas cidades para a busca local (escalar, sem numpy
+    # no caminho rápido: matriz convertida em listas ou math.hypot);
+    # matrizes grandes (ou memmaps) são consultadas direto, sem cópia
+    if distancias is not None:
+        linhas = distancias.tolist() if len(distancias) <= 2000 else distancias
+        return lambda a, b: linhas[a][b]
+    if tipo == "EUCLIDIANA":
+        xs, ys = np.asarray(cidades, dtype=float).T.tolist()
+        return lambda a, b: math.hypot(xs[a] - xs[b], ys[a] - ys[b])
+    return lambda a, b: float(distancias_pares(cidades[a], cidades[b], tipo))
+
+
+def _tentar_2opt(rota, a, dist, vizinhos):
+    for sentido in (rota.sucessor, rota.predecessor):
+        b = sentido(a)
+        d_ab = dist(a, b)
+        for c in vizinhos[a]:
+            d_ac = dist(a, c)
+            if d_ac >= d_ab:
+                break  # vizinhos ordenados: nenhum ganho possível daqui em diante
+            d = sentido(c)
+            if c == b or d == a:
+                continue
+            if d_ac + dist(b, d) - d_ab - dist(c, d) < -1e-10:
+                rota.mover_2opt(a, b, c, d)
+                return (a, b, c, d)
+    return None
+
+
+def _tentar_oropt(rota, s1, dist, vizinhos, max_segmento=3):
+    # move o segmento s1..s2 (1 a 3 cidades) para junto de um vizinho c de s1,
+    # com s1 ligado a c e s2 ligado a d (vizinho de c na rota)
+    for proximo, anterior in ((rota.sucessor, rota.predecessor),
+                              (rota.predecessor, rota.sucessor)):
+        segmento = [s1]
+        for _ in range(max_segmento):
+            s2 = segmento[-1]
+            p, nx = anterior(s1), proximo(s2)
+            if p == nx or nx in segmento:
+                break
+            ganho = dist(p, s1) + dist(s2, nx) - dist(p, nx)
+            for c in vizinhos[s1]:
+                d_c = dist(c, s1)
+                if d_c >= ganho:
+                    break
+                if c in segmento:
+                    continue
+                for d, mesmo_sentido in ((proximo(c), True), (anterior(c), False)):
+                    if d in segmento:
+                        continue
+                    if d_c + dist(s2, d) - dist(c, d) - ganho < -1e-10:
+                        if mesmo_sentido:
+                            # p S nx .. c d  ->  p nx .. c S d
+                            rota.mover_2opt(p, s1, c, d)
+                            rota.mover_2opt(p, c, nx, s2)
+                            rota.mover_2opt(c, s2, s1, d)
+                        else:
+                            # p S nx .. d c  ->  p nx .. d S' c
+                            rota.mover_2opt(s2, nx, d, c)
+                            rota.mover_2opt(p, s1, nx, c)
+                        return (p, nx, c, d, s1, s2)
+            segmento.append(proximo(s2))
+    return None
+
+
+def busca_local(rota, dist, vizinhos, movimentos=("2opt", "oropt")):
+    # aplica os movimentos até não haver melhora (ótimo local nas listas)
+    rota = RotaArray(rota)
+    if rota.n < 5:
+        return np.array(rota.cidades)
+    tentativas = [{"2opt": _tentar_2opt, "oropt": _tentar_oropt}[m] for m in movimentos]
+
+    fila = deque(rota.cidades)
+    na_fila = [True] * rota.n
+    while fila:
+        a = fila.popleft()
+        na_fila[a] = False
+        for tentar in tentativas:
+            tocadas = tentar(rota, a, dist, vizinhos)
+            if tocadas is not None:
+                for c in tocadas:
+                    if not na_fila[c]:
+                        na_fila[c] = True
+                        fila.append(c)
+                break
+
+    return np.array(rota.cidades)
+
+
+MOVIMENTOS = {
+    "2opt": ("2opt",),
+    "oropt": ("oropt",),
+    "2opt+oropt": ("2opt", "oropt"),
+}
+
+
+def preparar_busca(busca, distancias=None, cidades=None, tipo="EUCLIDIANA", vizinhos=None, k=10):
+    # função rota -> rota melhorada (None se busca for None)
+    if busca is None:
+        return None
+    movimentos = MOVIMENTOS[busca]
+    if vizinhos is None:
+        vizinhos = vizinhos_matriz(distancias, k)
+    listas = vizinhos.tolist()
+    dist = funcao_distancia(distancias, cidades, tipo)
+    return lambda rota: busca_local(rota, dist, listas, movimentos)
+
+
+def refinar_rotas(rotas, custos, melhorar, busca_em="melhor"):
+    # busca_em: "melhor" (só a melhor formiga da iteração) ou "todas"
+    indices = range(len(rotas)) if busca_em == "todas" else [np.argmin(custos)]
+    for i in indices:
+        rotas[i] = melhorar(rotas[i])
+    return rotas
+
+
 # --------------------------------------------------------------
 # Algoritmo principal ACO
 # --------------------------------------------------------------
-def aco_tsp(num_cidades=10, num_formigas=20, iteracoes=50):
-    cidades = gerar_cidades(num_cidades)
+def aco_tsp(num_cidades=10, num_formigas=20, iteracoes=50, alpha=1.0, beta=2.0,
+            cidades=None, candidatos=None, tipo="EUCLIDIANA", distancias=None,
+            dtype=np.float64, cache_dir=None, mmas=False, busca=None, busca_em="melhor"):
+    # cidades: coordenadas (n x 2) de uma instância; se None, gera aleatórias
+    # candidatos: k da lista de vizinhos (None = considera todas as cidades)
+    # tipo: métrica da TSPLIB (EUC_2D, CEIL_2D, ATT, GEO) ou EUCLIDIANA
+    # distancias: matriz pronta (ex.: ler_tsplib(...).distancias(), inclusive
+    #             matrizes explícitas ou memmaps em cache)
+    # dtype, cache_dir: repassados a matriz_distancias quando a matriz é
+    #                   calculada aqui (float32 e/ou memmap em disco)
+    # mmas: usa o MAX–MIN Ant System (aco_tsp_mmas) em vez do Ant System
+    # busca: busca local nas rotas ("2opt", "oropt" ou "2opt+oropt")
+    # busca_em: "melhor" (melhor formiga da iteração) ou "todas"
+    if cidades is None and distancias is None:
+        cidades = gerar_cidades(num_cidades)
+
+    if candidatos is not None:
+        if distancias is not None:
+            raise ValueError("candidatos usa as coordenadas (cidades=...), não a matriz distancias")
+        if mmas:
+            raise ValueError("mmas usa a matriz completa; não combine com candidatos")
+        return aco_tsp_candidatos(cidades, num_formigas, iteracoes, alpha, beta,
+                                  k=candidatos, tipo=tipo, busca=busca, busca_em=busca_em)
 
-    # Matriz de distâncias
-    distancias = np.zeros((num_cidades, num_cidades))
-    for i in range(num_cidades):
-        for j in range(num_cidades):
-            distancias[i][j] = distancia(cidades[i], cidades[j])
+    # Matriz de distâncias (vetorizada, em blocos de linhas)
+    if distancias is None:
+        distancias = matriz_distancias(cidades, tipo, dtype, cache_dir)
+    num_cidades = len(distancias)
+
+    if mmas:
+        return aco_tsp_mmas(distancias, num_formigas, iteracoes, alpha, beta,
+                            busca=busca, busca_em=busca_em)
+
+    melhorar = preparar_busca(busca, distancias)
 
     # Feromônio inicial
     feromonio = np.ones((num_cidades, num_cidades))
@@ -92,18 +579,18 @@ def aco_tsp(num_cidades=10, num_formigas=20, iteracoes=50):
     melhor_rota = None
 
     for it in range(iteracoes):
-        rotas = []
-        custos = []
+        # todas as formigas constroem suas rotas ao mesmo tempo
+        pesos = pesos_escolha(feromonio, distancias, alpha, beta)
+        rotas = construir_rotas(pesos, num_formigas)
+        custos = calcular_custos(rotas, distancias)
+        if melhorar is not None:
+            rotas = refinar_rotas(rotas, custos, melhorar, busca_em)
+            custos = calcular_custos(rotas, distancias)
 
-        for _ in range(num_formigas):
-            rota = construir_rota(feromonio, distancias)
-            custo = calcular_custo(rota, distancias)
-            rotas.append(rota)
-            custos.append(custo)
-
-            if custo < melhor_custo:
-                melhor_custo = custo
-                melhor_rota = rota
+        i = np.argmin(custos)
+        if custos[i] < melhor_custo:
+            melhor_custo = custos[i]
+            melhor_rota = rotas[i].tolist()
 
         feromonio = atualizar_feromonio(feromonio, rotas, custos)
 
@@ -112,10 +599,111 @@ def aco_tsp(num_cidades=10, num_formigas=20, iteracoes=50):
     return melhor_rota, melhor_custo
 
 
+# --------------------------------------------------------------
+# ACO no modo MAX–MIN Ant System
+# evaporacao: os limites impedem a convergência prematura, então a
+#             taxa pode ser menor que a do Ant System (0.5)
+# estagnacao: iterações sem melhora antes de reiniciar o feromônio
+# --------------------------------------------------------------
+def aco_tsp_mmas(distancias, num_formigas=20, iteracoes=50, alpha=1.0, beta=2.0,
+                 evaporacao=0.2, p_best=0.05, estagnacao=50, busca=None, busca_em="melhor"):
+    num_cidades = len(distancias)
+    melhorar = preparar_busca(busca, distancias)
+
+    # Feromônio inicial: tau_max estimado pela rota do vizinho mais próximo
+    custo_guloso = calcular_custo(rota_vizinho_mais_proximo(distancias), distancias)
+    tau_min, tau_max = limites_mmas(custo_guloso, num_cidades, evaporacao, p_best)
+    feromonio = np.full((num_cidades, num_cidades), tau_max)
+    sem_melhora = 0
+
+    melhor_custo = float("inf")
+    melhor_rota = None
+
+    for it in range(iteracoes):
+        pesos = pesos_escolha(feromonio, distancias, alpha, beta)
+        rotas = construir_rotas(pesos, num_formigas)
+        custos = calcular_custos(rotas, distancias)
+        if melhorar is not None:
+            rotas = refinar_rotas(rotas, custos, melhorar, busca_em)
+            custos = calcular_custos(rotas, distancias)
+
+        i = np.argmin(custos)
+        if custos[i] < melhor_custo:
+            melhor_custo = custos[i]
+            melhor_rota = rotas[i].tolist()
+            tau_min, tau_max = limites_mmas(melhor_custo, num_cidades, evaporacao, p_best)
+            sem_melhora = 0
+        else:
+            sem_melhora += 1
+
+        # só a melhor formiga da iteração deposita
+        feromonio = atualizar_feromonio_mmas(feromonio, rotas[i], custos[i],
+                                             evaporacao, tau_min, tau_max)
+
+        if sem_melhora >= estagnacao:
+            feromonio.fill(tau_max)
+            sem_melhora = 0
+            print(f"Iteração {it + 1} | Estagnação: feromônio reiniciado em tau_max")
+
+        print(f"Iteração {it + 1} | Melhor custo até agora = {melhor_custo:.2f}")
+
+    return melhor_rota, melhor_custo
+
+
+# --------------------------------------------------------------
+# ACO com listas de candidatos (10k–100k cidades):
+# sem matrizes n x n, memória O(n·k)
+# --------------------------------------------------------------
+def aco_tsp_candidatos(cidades, num_formigas=20, iteracoes=50, alpha=1.0, beta=2.0, k=10,
+                       tipo="EUCLIDIANA", busca=None, busca_em="melhor"):
+    # vizinhos pela distância euclidiana das coordenadas (mesma ordem que
+    # EUC_2D, CEIL_2D e ATT; aproximada para GEO), pesos pela métrica `tipo`
+    grade = GradeEspacial(cidades)
+    candidatos, dist_cand = grade.vizinhos_proximos(k)
+    if tipo != "EUCLIDIANA":
+        dist_cand = distancias_pares(grade.cidades[:, None], grade.cidades[candidatos], tipo)
+    melhorar = preparar_busca(busca, cidades=grade.cidades, tipo=tipo, vizinhos=candidatos)
+
+    eta = np.zeros_like(dist_cand)
+    np.divide(1.0, dist_cand, out=eta, where=dist_cand > 0)
+    eta_beta = eta ** beta
+
+    # Feromônio inicial (só nas arestas candidatas)
+    feromonio = np.ones_like(dist_cand)
+
+    melhor_custo = float("inf")
+    melhor_rota = None
+
+    for it in range(iteracoes):
+        pesos = feromonio ** alpha * eta_beta
+        rotas = construir_rotas_candidatos(pesos, candidatos, grade, num_formigas)
+        custos = custo_rotas_coordenadas(rotas, grade.cidades, tipo)
+        if melhorar is not None:
+            rotas = refinar_rotas(rotas, custos, melhorar, busca_em)
+            custos = custo_rotas_coordenadas(rotas, grade.cidades, tipo)
+
+        i = np.argmin(custos)
+        if custos[i] < melhor_custo:
+            melhor_custo = custos[i]
+            melhor_rota = rotas[i].tolist()
+
+        feromonio = atualizar_feromonio_candidatos(feromonio, candidatos, rotas, custos)
+
+        print(f"Iteração {it + 1} | Melhor custo até agora = {melhor_custo:.2f}")
+
+    return melhor_rota, melhor_custo
+
+
 # --------------------------------------------------------------
 # Executar quando rodar o arquivo
 # --------------------------------------------------------------
 if __name__ == "__main__":
+    # Instância da TSPLIB (tsp_instancias.ler_tsplib):
+    #   inst = ler_tsplib("berlin52.tsp")
+    #   aco_tsp(distancias=inst.distancias())                  # matriz completa
+    #   aco_tsp(cidades=inst.coordenadas, tipo=inst.tipo, candidatos=10)
+    # MAX–MIN Ant System: aco_tsp(mmas=True)
+    # Busca local na melhor formiga: aco_tsp(busca="2opt+oropt")
     rota, custo = aco_tsp()
     print("\nMelhor rota encontrada:", rota)
     print("Custo total:", custo)
@@ -1,36 +1,37 @@
 import numpy as np
-import random
+
+from funcoes_objetivo import sphere
 
 # ----------------------------------------------
 # Função objetivo (mínimos)
-# Exemplo: esfera (x^2 + y^2 + ...)
+# Exemplo: esfera (x^2 + y^2 + ...), de funcoes_objetivo.
+# Avaliação em lote: matriz (N, dim) -> N valores
 # ----------------------------------------------
-def esfera(x):
-    return np.sum(x ** 2)
 
 # ----------------------------------------------
-# Gera uma solução aleatória dentro do intervalo
+# Gera soluções aleatórias dentro do intervalo
+# (uma linha por fonte de alimento)
 # ----------------------------------------------
-def gerar_solucao(dim, minimo, maximo):
-    return np.random.uniform(minimo, maximo, dim)
+def gerar_solucoes(n, dim, minimo, maximo):
+    return np.random.uniform(minimo, maximo, (n, dim))
 
 # ----------------------------------------------
-# Gera solução vizinha (movimento local)
-# x_new = x + phi * (x - x_k)
+# Gera soluções vizinhas (movimento local), em lote
+# x_new = x_i + phi * (x_i - x_k), k != i
 # phi in [-1, 1]
 # ----------------------------------------------
-def gerar_vizinho(x, populacao, minimo, maximo):
-    dim = len(x)
-    k = random.randint(0, len(populacao)-1)
-    while np.array_equal(populacao[k], x):
-        k = random.randint(0, len(populacao)-1)
-
-    phi = np.random.uniform(-1, 1, dim)
+def gerar_vizinhos(populacao, indices, minimo, maximo):
+    n, dim = populacao.shape
+    # parceiro k sorteado entre as outras fontes (pula o próprio índice)
+    k = np.random.randint(0, n - 1, size=len(indices))
+    k += k >= indices
+
+    phi = np.random.uniform(-1, 1, (len(indices), dim))
+    x = populacao[indices]
     x_new = x + phi * (x - populacao[k])
 
     # Limitar ao intervalo
-    x_new = np.clip(x_new, minimo, maximo)
-    return x_new
+    return np.clip(x_new, minimo, maximo)
 
 # -------------------------------------------
 # Algoritmo ABC
@@ -45,13 +46,14 @@ def ABC(
     maximo=5
 ):
 
-    # Inicialização
-    populacao = [gerar_solucao(dim, minimo, maximo) for _ in range(num_fontes)]
-    aptidoes = [funcao(s) for s in populacao]
-    contador_sem_melhora = [0] * num_fontes
+    # Inicialização (funcao avalia a matriz de fontes em uma chamada)
+    populacao = gerar_solucoes(num_fontes, dim, minimo, maximo)
+    aptidoes = funcao(populacao)
+    contador_sem_melhora = np.zeros(num_fontes, dtype=int)
+    todas = np.arange(num_fontes)
 
-    melhor_solucao = populacao[np.argmin(aptidoes)]
-    melhor_valor = min(aptidoes)
+    melhor_solucao = populacao[np.argmin(aptidoes)].copy()
+    melhor_valor = aptidoes.min()
 
     # -----------------------------
     # Loop principal
@@ -59,26 +61,25 @@ def ABC(
     for it in range(iteracoes):
 
         # --- Fase das Employed Bees ---
-        for i in range(num_fontes):
-            vizinho = gerar_vizinho(populacao[i], populacao, minimo, maximo)
-            f_vizinho = funcao(vizinho)
+        # um vizinho por fonte, todos avaliados em uma chamada
+        vizinhos = gerar_vizinhos(populacao, todas, minimo, maximo)
+        f_vizinhos = funcao(vizinhos)
 
-            if f_vizinho < aptidoes[i]:
-                populacao[i] = vizinho
-                aptidoes[i] = f_vizinho
-                contador_sem_melhora[i] = 0
-            else:
-                contador_sem_melhora[i] += 1
+        melhorou = f_vizinhos < aptidoes
+        populacao[melhorou] = vizinhos[melhorou]
+        aptidoes[melhorou] = f_vizinhos[melhorou]
+        contador_sem_melhora = np.where(melhorou, 0, contador_sem_melhora + 1)
 
         # --- Fase das Onlooker Bees ---
-        apt_inverse = 1 / (1 + np.array(aptidoes))
+        apt_inverse = 1 / (1 + aptidoes)
         probs = apt_inverse / apt_inverse.sum()
 
-        for _ in range(num_fontes):
-            i = np.random.choice(range(num_fontes), p=probs)
-            vizinho = gerar_vizinho(populacao[i], populacao, minimo, maximo)
-            f_vizinho = funcao(vizinho)
+        escolhidas = np.random.choice(num_fontes, size=num_fontes, p=probs)
+        vizinhos = gerar_vizinhos(populacao, escolhidas, minimo, maximo)
+        f_vizinhos = funcao(vizinhos)
 
+        # aceitação gulosa na ordem dos sorteios (uma fonte pode ser escolhida várias vezes)
+        for i, vizinho, f_vizinho in zip(escolhidas, vizinhos, f_vizinhos):
             if f_vizinho < aptidoes[i]:
                 populacao[i] = vizinho
                 aptidoes[i] = f_vizinho
@@ -87,17 +88,17 @@ def ABC(
                 contador_sem_melhora[i] += 1
 
         # --- Fase das Scout Bees ---
-        for i in range(num_fontes):
-            if contador_sem_melhora[i] >= limite:
-                populacao[i] = gerar_solucao(dim, minimo, maximo)
-                aptidoes[i] = funcao(populacao[i])
-                contador_sem_melhora[i] = 0
+        esgotadas = contador_sem_melhora >= limite
+        if esgotadas.any():
+            populacao[esgotadas] = gerar_solucoes(esgotadas.sum(), dim, minimo, maximo)
+            aptidoes[esgotadas] = funcao(populacao[esgotadas])
+            contador_sem_melhora[esgotadas] = 0
 
         # Atualiza melhor solução global
         idx = np.argmin(aptidoes)
         if aptidoes[idx] < melhor_valor:
             melhor_valor = aptidoes[idx]
-            melhor_solucao = populacao[idx]
+            melhor_solucao = populacao[idx].copy()
 
         print(f"Iteração {it+1} | Melhor valor: {melhor_valor:.6f}")
 
@@ -107,7 +108,7 @@ def ABC(
 # Execução do script
 # ------------------------------
 if __name__ == "__main__":
-    sol, valor = ABC(funcao=esfera)
+    sol, valor = ABC(funcao=sphere)
     print("\nMelhor solução encontrada:", sol)
     print("Valor:", valor)
 
@@ -3,12 +3,17 @@
 ---------------------------------------------
 
 Minimização da função Rastrigin.
+
+O enxame inteiro é uma matriz (N, D): velocidade, posição, limites e
+avaliação são operações de array sobre todas as partículas de uma vez.
+`pso(...)` pode ser importada (nada roda na importação) e aceita qualquer
+função objetivo em lote (matriz (N, D) -> N valores), como as de
+funcoes_objetivo.
 """
 
 import numpy as np
-import random
-import math
-import matplotlib.pyplot as plt
+
+from funcoes_objetivo import rastrigin
 
 # ---------------------------------------------------------
 # 1️⃣ Parâmetros do PSO
@@ -24,85 +29,111 @@ c2 = 1.5     # coeficiente social
 LOWER_BOUND = -5.12
 UPPER_BOUND = 5.12
 
-random.seed(42)
-np.random.seed(42)
+SEED = 42
 
 # ---------------------------------------------------------
 # 2️⃣ Função Rastrigin
 # ---------------------------------------------------------
-def rastrigin(x):
-    A = 10
-    return A * len(x) + np.sum(x**2 - A * np.cos(2 * math.pi * x))
+# rastrigin vem de funcoes_objetivo: recebe a matriz de posições
+# (NUM_PARTICLES, DIM) e devolve o fitness de todas as partículas
 
 
 # ---------------------------------------------------------
-# 3️⃣ Inicialização
+# 3️⃣ PSO (enxame inteiro vetorizado)
 # ---------------------------------------------------------
-positions = np.random.uniform(LOWER_BOUND, UPPER_BOUND, (NUM_PARTICLES, DIM))
-velocities = np.random.uniform(-1, 1, (NUM_PARTICLES, DIM))
-
-pbest_positions = positions.copy()
-pbest_values = np.array([rastrigin(p) for p in positions])
+def pso(
+    objective=rastrigin,
+    num_particles=NUM_PARTICLES,
+    dim=DIM,
+    iterations=ITERATIONS,
+    w=w,
+    c1=c1,
+    c2=c2,
+    lower_bound=LOWER_BOUND,
+    upper_bound=UPPER_BOUND,
+    v_max=None,
+    seed=SEED,
+    verbose=True,
+):
+    """
+    Minimiza `objective` com um PSO global-best.
+    - objective: função em lote, matriz (N, D) -> vetor (N,)
+    - v_max: se definido, limita cada componente da velocidade a [-v_max, v_max]
+    - seed: semente do gerador próprio (np.random.default_rng), sem estado global
+    Retorna (melhor posição, melhor fitness, histórico do gbest por iteração).
+    """
+    rng = np.random.default_rng(seed)
+
+    # Inicialização
+    positions = rng.uniform(lower_bound, upper_bound, (num_particles, dim))
+    velocities = rng.uniform(-1, 1, (num_particles, dim))
+
+    pbest_positions = positions.copy()
+    pbest_values = objective(positions)
 
-gbest_index = np.argmin(pbest_values)
-gbest_position = pbest_positions[gbest_index].copy()
-gbest_value = pbest_values[gbest_index]
+    gbest_index = np.argmin(pbest_values)
+    gbest_position = pbest_positions[gbest_index].copy()
+    gbest_value = pbest_values[gbest_index]
 
-history = [gbest_value]
+    history = [gbest_value]
 
-# ---------------------------------------------------------
-# 4️⃣ Loop principal do PSO
-# ---------------------------------------------------------
-for iteration in range(ITERATIONS):
+    for iteration in range(iterations):
 
-    for i in range(NUM_PARTICLES):
-
-        r1 = np.random.rand(DIM)
-        r2 = np.random.rand(DIM)
+        # o gbest fica fixo durante a iteração, então o enxame inteiro
+        # é atualizado de uma vez (uma linha por partícula)
+        r1 = rng.random((num_particles, dim))
+        r2 = rng.random((num_particles, dim))
 
         # Atualiza velocidade
-        velocities[i] = (
-            w * velocities[i]
-            + c1 * r1 * (pbest_positions[i] - positions[i])
-            + c2 * r2 * (gbest_position - positions[i])
+        velocities = (
+            w * velocities
+            + c1 * r1 * (pbest_positions - positions)
+            + c2 * r2 * (gbest_position - positions)
         )
+        if v_max is not None:
+            velocities = np.clip(velocities, -v_max, v_max)
 
-        # Atualiza posição
-        positions[i] = positions[i] + velocities[i]
-
-        # Mantém dentro dos limites
-        positions[i] = np.clip(positions[i], LOWER_BOUND, UPPER_BOUND)
+        # Atualiza posição e mantém dentro dos limites
+        positions = np.clip(positions + velocities, lower_bound, upper_bound)
 
-        # Avalia nova posição
-        fitness = rastrigin(positions[i])
+        # Avalia todas as novas posições em uma chamada
+        fitness = objective(positions)
 
         # Atualiza pbest
-        if fitness < pbest_values[i]:
-            pbest_values[i] = fitness
-            pbest_positions[i] = positions[i].copy()
+        improved = fitness < pbest_values
+        pbest_values[improved] = fitness[improved]
+        pbest_positions[improved] = positions[improved]
 
-    # Atualiza gbest
-    gbest_index = np.argmin(pbest_values)
-    if pbest_values[gbest_index] < gbest_value:
-        gbest_value = pbest_values[gbest_index]
-        gbest_position = pbest_positions[gbest_index].copy()
+        # Atualiza gbest
+        gbest_index = np.argmin(pbest_values)
+        if pbest_values[gbest_index] < gbest_value:
+            gbest_value = pbest_values[gbest_index]
+            gbest_position = pbest_positions[gbest_index].copy()
+
+        history.append(gbest_value)
+
+        if verbose and iteration % 10 == 0:
+            print(f"Iteração {iteration} | Melhor fitness: {gbest_value:.6f}")
 
-    history.append(gbest_value)
+    return gbest_position, gbest_value, history
 
-    if iteration % 10 == 0:
-        print(f"Iteração {iteration} | Melhor fitness: {gbest_value:.6f}")
 
 # ---------------------------------------------------------
-# 5️⃣ Resultado
+# 4️⃣ Execução + resultado
 # ---------------------------------------------------------
-print("\nMelhor solução encontrada:")
-print("Fitness:", gbest_value)
-print("Primeiras componentes:", gbest_position[:5])
-
-# Gráfico de convergência
-plt.plot(history)
-plt.title("PSO — Convergência")
-plt.xlabel("Iteração")
-plt.ylabel("Melhor Fitness")
-plt.grid(True)
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    gbest_position, gbest_value, history = pso()
+
+    print("\nMelhor solução encontrada:")
+    print("Fitness:", gbest_value)
+    print("Primeiras componentes:", gbest_position[:5])
+
+    # Gráfico de convergência
+    plt.plot(history)
+    plt.title("PSO — Convergência")
+    plt.xlabel("Iteração")
+    plt.ylabel("Melhor Fitness")
+    plt.grid(True)
+    plt.show()
@@ -0,0 +1,77 @@
+"""
+🧩 Funções objetivo vetorizadas (benchmarks de minimização)
+-----------------------------------------------------------
+
+Interface comum dos otimizadores contínuos (memético, ES, DE, ABC e PSO):
+toda função recebe um array cuja última dimensão são as D variáveis e
+reduz esse eixo:
+
+- matriz (N, D) -> vetor (N,): a população inteira em uma chamada
+- vetor (D,)    -> escalar: um único indivíduo (listas também são aceitas)
+
+Com isso cada geração faz uma única chamada NumPy em vez de N chamadas
+Python por indivíduo.
+
+Funções (mínimo global f = 0):
+- rastrigin:  A·D + Σ (x² - A·cos(2πx)),      x* = 0
+- sphere:     Σ x²,                           x* = 0
+- rosenbrock: Σ 100·(x[i+1] - x[i]²)² + (1 - x[i])²,  x* = 1
+- ackley:     -20·exp(-0.2·√(Σx²/D)) - exp(Σcos(2πx)/D) + 20 + e,  x* = 0
+- griewank:   1 + Σ x²/4000 - Π cos(x / √i),  x* = 0
+"""
+
+import numpy as np
+
+
+def _as_array(x):
+    return np.asarray(x, dtype=float)
+
+
+def rastrigin(x, A=10.0):
+    """Rastrigin: multimodal, com uma grade regular de ótimos locais."""
+    x = _as_array(x)
+    return A * x.shape[-1] + np.sum(x**2 - A * np.cos(2 * np.pi * x), axis=-1)
+
+
+def sphere(x):
+    """Esfera: convexa e separável (soma dos quadrados)."""
+    x = _as_array(x)
+    return np.sum(x**2, axis=-1)
+
+
+def rosenbrock(x):
+    """Rosenbrock: vale estreito e curvo em direção a x = (1, ..., 1)."""
+    x = _as_array(x)
+    head, tail = x[..., :-1], x[..., 1:]
+    return np.sum(100.0 * (tail - head**2) ** 2 + (1.0 - head) ** 2, axis=-1)
+
+
+def ackley(x):
+    """Ackley: quase plana longe da origem, com um poço profundo em x = 0."""
+    x = _as_array(x)
+    dim = x.shape[-1]
+    term1 = -20.0 * np.exp(-0.2 * np.sqrt(np.sum(x**2, axis=-1) / dim))
+    term2 = -np.exp(np.sum(np.cos(2 * np.pi * x), axis=-1) / dim)
+    return term1 + term2 + 20.0 + np.e
+
+
+def griewank(x):
+    """Griewank: termo quadrático + produto de cossenos (ótimos locais acoplados)."""
+    x = _as_array(x)
+    i = np.sqrt(np.arange(1, x.shape[-1] + 1))
+    return 1.0 + np.sum(x**2, axis=-1) / 4000.0 - np.prod(np.cos(x / i), axis=-1)
+
+
+def shifted(objective, center):
+    """Desloca o ótimo de `objective` para `center`: f(x - center)."""
+    center = _as_array(center)
+    return lambda x: objective(_as_array(x) - center)
+
+
+OBJECTIVES = {
+    "rastrigin": rastrigin,
+    "sphere": sphere,
+    "rosenbrock": rosenbrock,
+    "ackley": ackley,
+    "griewank": griewank,
+}
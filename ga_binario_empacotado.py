@@ -0,0 +1,388 @@
+"""
+🧩 GA binário com cromossomos empacotados em bits (NumPy)
+---------------------------------------------------------
+
+Representação compartilhada pelos GAs binários (dias 05, 06, 08 e 09).
+Em vez de uma `str` de '0'/'1' por indivíduo, a população inteira é uma
+matriz `uint8` de forma (N, ceil(n_bits / 8)): cada linha é um cromossomo e
+cada byte guarda 8 genes (o 1º caractere da string é o bit mais
+significativo do 1º byte, como em np.packbits). Bits de preenchimento no
+último byte ficam sempre em 0.
+
+- Mutação: máscara de flips empacotada + XOR; para taxas baixas, as
+  posições mutadas são sorteadas por saltos geométricos (custo ∝ nº de flips)
+- Crossover: máscaras de todos os pares de uma vez (1 ponto, k pontos ou
+  uniforme) + (a & m) | (b & ~m)
+- Decodificação: deslocamentos e OR dos bytes (sem `int(s, 2)`); para vários
+  parâmetros, BinaryDecoder divide o cromossomo em campos (binário ou Gray)
+  e escala cada um para [low, high] com um produto por campo (reshape)
+- Fitness por tabela: para genomas curtos (≲ 20–24 bits) o fitness de todos
+  os 2^n genótipos é pré-calculado e cada avaliação vira um gather
+
+Cromossomos com milhares de bits e populações de 1e5 cabem em memória
+contígua e uma geração leva milissegundos.
+"""
+
+from functools import partial
+
+import numpy as np
+
+from ga_real_vetorizado import tournament_selection, top_k
+
+
+# -----------------------------------------------------------
+# 1️⃣ Conversões e utilitários
+# -----------------------------------------------------------
+def n_bytes(n_bits):
+    """Número de bytes por cromossomo."""
+    return (n_bits + 7) // 8
+
+
+def tail_mask(n_bits):
+    """Máscara do último byte: zera os bits de preenchimento."""
+    pad = n_bytes(n_bits) * 8 - n_bits
+    return np.uint8((0xFF << pad) & 0xFF)
+
+
+def pack(bits):
+    """Matriz de bits (N, n_bits) de 0/1 -> população empacotada (N, n_bytes)."""
+    return np.packbits(np.asarray(bits, dtype=np.uint8), axis=1)
+
+
+def unpack(population, n_bits):
+    """População empacotada -> matriz de bits (N, n_bits)."""
+    return np.unpackbits(population, axis=1, count=n_bits)
+
+
+def from_strings(chromosomes):
+    """Lista de strings '0101...' (mesmo tamanho) -> população empacotada."""
+    bits = np.array([[c == "1" for c in chrom] for chrom in chromosomes], dtype=np.uint8)
+    return pack(bits)
+
+
+def to_strings(population, n_bits):
+    """População empacotada -> lista de strings '0101...' (para exibição)."""
+    return ["".join(map(str, row)) for row in unpack(population, n_bits).tolist()]
+
+
+def random_population(pop_size, n_bits, rng):
+    """Cromossomos aleatórios (bits uniformes) já empacotados."""
+    population = rng.integers(0, 256, size=(pop_size, n_bytes(n_bits)), dtype=np.uint8)
+    population[:, -1] &= tail_mask(n_bits)
+    return population
+
+
+# -----------------------------------------------------------
+# 2️⃣ Decodificação (binário -> inteiro) em lote
+# -----------------------------------------------------------
+def decode(population, n_bits):
+    """
+    Converte cada cromossomo (até 63 bits) no inteiro correspondente,
+    juntando os bytes com deslocamentos: equivale a int(s, 2) para a população toda.
+    O resultado é int64 (com sinal), para que objetivos com subtração ou
+    negação não sofram o wrap-around silencioso de uint64.
+    """
+    if n_bits > 63:
+        raise ValueError("decode suporta cromossomos de até 63 bits")
+    values = np.zeros(len(population), dtype=np.uint64)
+    for j in range(population.shape[1]):
+        values = (values << np.uint64(8)) | population[:, j].astype(np.uint64)
+    return (values >> np.uint64(n_bytes(n_bits) * 8 - n_bits)).astype(np.int64)
+
+
+class BinaryDecoder:
+    """
+    Decodificador multivariável: o cromossomo é a concatenação de campos de
+    bits (um por variável) e cada campo vira um real em [low, high].
+
+    Cada campo de L bits é lido como inteiro por um produto com os pesos
+    posicionais (2^(L-1), ..., 2, 1) apenas do próprio campo:
+    - campos iguais: bits.reshape(N, n_vars, L) @ pesos
+    - campos de tamanhos diferentes: o mesmo, uma vez por tamanho distinto,
+      sobre os campos daquele tamanho (sem matriz densa n_bits x n_vars)
+    e os reais são inteiros * (high - low) / (2^L - 1) + low.
+    Com gray=True, cada campo é lido em código Gray: o bit binário i é a
+    paridade dos bits Gray 0..i do campo (XOR acumulado).
+    Campos de até 63 bits (int64); os reais são exatos até 53 bits (float64).
+    """
+
+    def __init__(self, bits_per_var, low, high, n_vars=None, gray=False):
+        if np.ndim(bits_per_var) == 0:
+            if n_vars is None:
+                raise ValueError("informe n_vars quando bits_per_var é um inteiro")
+            bits_per_var = [bits_per_var] * n_vars
+        self.lengths = np.asarray(bits_per_var, dtype=np.int64)
+        if self.lengths.max() > 63:
+            raise ValueError("BinaryDecoder suporta campos de até 63 bits")
+        self.n_vars = len(self.lengths)
+        self.n_bits = int(self.lengths.sum())
+        self.gray = gray
+        self.low = np.broadcast_to(np.asarray(low, dtype=float), (self.n_vars,))
+        self.high = np.broadcast_to(np.asarray(high, dtype=float), (self.n_vars,))
+        self.scale = (self.high - self.low) / (2.0 ** self.lengths - 1)
+        self._starts = np.concatenate(([0], np.cumsum(self.lengths)[:-1]))
+        self._uniform = bool(np.all(self.lengths == self.lengths[0]))
+
+        # por tamanho distinto L: campos com esse tamanho e índices dos seus bits
+        self._groups = []
+        for length in np.unique(self.lengths):
+            fields = np.flatnonzero(self.lengths == length)
+            columns = self._starts[fields, None] + np.arange(length)
+            self._groups.append((fields, columns, _positional_weights(length)))
+
+    def bits(self, population):
+        """Matriz de bits binários (N, n_bits), já convertida de Gray se for o caso."""
+        bits = unpack(population, self.n_bits)
+        if not self.gray:
+            return bits
+        if self._uniform:
+            # campos iguais: um XOR acumulado sobre o eixo dos bits de cada campo
+            fields = bits.reshape(len(bits), self.n_vars, self.lengths[0])
+            return np.bitwise_xor.accumulate(fields, axis=2).reshape(bits.shape)
+        for start, end in zip(self._starts, self._starts + self.lengths):
+            bits[:, start:end] = np.bitwise_xor.accumulate(bits[:, start:end], axis=1)
+        return bits
+
+    def integers(self, population):
+        """Valor inteiro de cada campo: (N, n_vars), int64."""
+        bits = self.bits(population)
+        if self._uniform:
+            length = int(self.lengths[0])
+            return bits.reshape(len(bits), self.n_vars, length) @ _positional_weights(length)
+        values = np.empty((len(bits), self.n_vars), dtype=np.int64)
+        for fields, columns, weights in self._groups:
+            values[:, fields] = bits[:, columns] @ weights
+        return values
+
+    def __call__(self, population):
+        """Valores reais escalados para [low, high]: (N, n_vars)."""
+        return self.integers(population) * self.scale + self.low
+
+
+def _positional_weights(length):
+    """Pesos 2^(L-1), ..., 2, 1 (int64) de um campo de L bits."""
+    return np.left_shift(1, np.arange(length - 1, -1, -1, dtype=np.int64))
+
+
+# orçamento padrão da tabela de fitness (float64): 64 MiB ≈ genomas de 23 bits
+LUT_MAX_BYTES = 64 * 2**20
+
+
+def fitness_table(objective, n_bits, max_bytes=LUT_MAX_BYTES):
+    """
+    Pré-calcula objective(x) para todos os x ∈ [0, 2^n_bits) em um único lote
+    (x em int64, como em decode). Retorna None se a tabela (float64) não
+    couber em max_bytes.
+    """
+    if n_bits > 63 or (1 << n_bits) * 8 > max_bytes:
+        return None
+    values = np.arange(1 << n_bits, dtype=np.int64)
+    return np.asarray(objective(values), dtype=float)
+
+
+def lookup_fitness(objective, n_bits, max_bytes=LUT_MAX_BYTES):
+    """
+    fitness_fn para run_binary_ga a partir de uma objetivo vetorizada sobre o
+    valor decodificado. Com a tabela de fitness_table, avaliar a população é
+    table[decode(pop)]; acima do orçamento de memória, volta automaticamente
+    à avaliação direta objective(decode(pop)).
+    """
+    table = fitness_table(objective, n_bits, max_bytes)
+    if table is None:
+        return lambda population: objective(decode(population, n_bits))
+    return lambda population: table[decode(population, n_bits)]
+
+
+# -----------------------------------------------------------
+# 3️⃣ Operadores genéticos bit a bit
+# -----------------------------------------------------------
+# abaixo desta taxa a mutação sorteia os saltos entre flips (geométrica)
+SPARSE_MUTATION_RATE = 0.1
+
+
+def mutate(population, n_bits, rate, rng):
+    """
+    Bit-flip: cada gene é invertido com probabilidade `rate`.
+    Taxas baixas usam mutate_sparse; as demais, uma máscara densa + XOR.
+    """
+    if rate < SPARSE_MUTATION_RATE:
+        return mutate_sparse(population, n_bits, rate, rng)
+    flips = pack(rng.random((len(population), n_bits)) < rate)
+    return population ^ flips
+
+
+def flip_positions(total_bits, rate, rng):
+    """
+    Posições (na população achatada) dos bits mutados: em vez de um sorteio
+    por bit, sorteia os saltos entre flips consecutivos ~ Geométrica(rate),
+    o que gera exatamente o mesmo processo de Bernoulli.
+    """
+    if rate <= 0 or total_bits == 0:
+        return np.empty(0, dtype=np.int64)
+    expected = total_bits * rate
+    chunk = int(expected + 5 * np.sqrt(expected) + 16)
+    positions = np.cumsum(rng.geometric(rate, size=chunk)) - 1
+    while positions[-1] < total_bits:  # raro: sorteia mais saltos
+        more = np.cumsum(rng.geometric(rate, size=chunk)) + positions[-1]
+        positions = np.concatenate((positions, more))
+    return positions[positions < total_bits]
+
+
+def mutate_sparse(population, n_bits, rate, rng):
+    """
+    Bit-flip com custo proporcional ao número de flips (≈ N·n_bits·rate),
+    não ao número de bits: ideal para genomas longos e taxas baixas.
+    """
+    positions = flip_positions(len(population) * n_bits, rate, rng)
+    rows, cols = np.divmod(positions, n_bits)
+    mutated = population.copy()
+    # vários flips podem cair no mesmo byte: XOR acumulado com ufunc.at
+    np.bitwise_xor.at(mutated, (rows, cols // 8),
+                      (np.uint8(0x80) >> (cols % 8).astype(np.uint8)))
+    return mutated
+
+
+def _no_crossover_masks(n_pairs, n_bits):
+    """Máscaras só de 1s (filhos = cópias dos pais): sem ponto de corte possível."""
+    return np.full((n_pairs, n_bytes(n_bits)), 0xFF, dtype=np.uint8)
+
+
+def one_point_masks(n_pairs, n_bits, rng):
+    """
+    Máscaras de crossover de 1 ponto: bits [0, ponto) = 1, ponto ∈ [1, n_bits - 1].
+    Com n_bits < 2 não há ponto de corte e os pares não recombinam.
+    """
+    if n_bits < 2:
+        return _no_crossover_masks(n_pairs, n_bits)
+    points = rng.integers(1, n_bits, size=n_pairs)
+    return pack(np.arange(n_bits) < points[:, None])
+
+
+def k_point_masks(n_pairs, n_bits, rng, k=2):
+    """
+    Máscaras de crossover de k pontos: k cortes distintos em [1, n_bits - 1]
+    por par; os segmentos alternam entre p1 (bit 1) e p2 (bit 0), começando por p1.
+    Com n_bits < 2 (ou k < 1) não há cortes e os pares não recombinam.
+    """
+    k = min(k, n_bits - 1)
+    if k < 1:
+        return _no_crossover_masks(n_pairs, n_bits)
+    cuts = _distinct_cuts(n_pairs, n_bits, k, rng)
+    flips = np.zeros((n_pairs, n_bits), dtype=np.uint8)
+    np.put_along_axis(flips, cuts, 1, axis=1)
+    # paridade dos cortes até cada bit: 0 -> segmento de p1
+    return pack(np.bitwise_xor.accumulate(flips, axis=1) ^ 1)
+
+
+def _distinct_cuts(n_pairs, n_bits, k, rng):
+    """k pontos de corte distintos em [1, n_bits - 1] para cada par."""
+    if 2 * k > n_bits - 1:
+        # muitos cortes: os k menores de uma linha de aleatórios (sem repetição)
+        return np.argpartition(rng.random((n_pairs, n_bits - 1)), k - 1, axis=1)[:, :k] + 1
+    # poucos cortes: sorteia com reposição e ressorteia as linhas com repetição
+    cuts = np.empty((n_pairs, k), dtype=np.int64)
+    redo = np.arange(n_pairs)
+    while len(redo):
+        cuts[redo] = rng.integers(1, n_bits, size=(len(redo), k))
+        block = np.sort(cuts[redo], axis=1)
+        redo = redo[(np.diff(block, axis=1) == 0).any(axis=1)]
+    return cuts
+
+
+def uniform_masks(n_pairs, n_bits, rng, swap_prob=0.5):
+    """Máscaras de crossover uniforme: cada gene vem de p2 com prob. swap_prob."""
+    if swap_prob == 0.5:
+        # bytes aleatórios já são bits uniformes (o preenchimento é ignorado)
+        return rng.integers(0, 256, size=(n_pairs, n_bytes(n_bits)), dtype=np.uint8)
+    return pack(rng.random((n_pairs, n_bits)) >= swap_prob)
+
+
+CROSSOVER_MASKS = {
+    "one_point": one_point_masks,
+    "k_point": k_point_masks,
+    "uniform": uniform_masks,
+}
+
+
+def masked_crossover(parent1, parent2, masks, rng=None, crossover_rate=1.0):
+    """
+    Recombina todos os pares com suas máscaras (bit 1 = gene de p1):
+    filho1 = (p1 & m) | (p2 & ~m), filho2 = (p2 & m) | (p1 & ~m).
+    Pares sem cruzamento (prob. 1 - crossover_rate) copiam os pais.
+    """
+    if crossover_rate < 1.0:
+        masks[rng.random(len(parent1)) >= crossover_rate] = 0xFF
+    child1 = (parent1 & masks) | (parent2 & ~masks)
+    child2 = (parent2 & masks) | (parent1 & ~masks)
+    return child1, child2
+
+
+def one_point_crossover(parent1, parent2, n_bits, rng, crossover_rate=1.0):
+    """
+    Crossover de 1 ponto para todos os pares de uma vez:
+    filho1 = p1[:ponto] + p2[ponto:], filho2 = p2[:ponto] + p1[ponto:].
+    """
+    masks = one_point_masks(len(parent1), n_bits, rng)
+    return masked_crossover(parent1, parent2, masks, rng, crossover_rate)
+
+
+# -----------------------------------------------------------
+# 4️⃣ Loop evolutivo empacotado
+# -----------------------------------------------------------
+def run_binary_ga(
+    fitness_fn,
+    n_bits,
+    pop_size=100_000,
+    generations=50,
+    tournament_k=3,
+    crossover="one_point",
+    crossover_rate=0.9,
+    crossover_points=2,
+    mutation_rate=0.02,
+    elite_size=1,
+    seed=None,
+    verbose=True,
+):
+    """
+    GA binário com a população empacotada em uma matriz de bits.
+    - fitness_fn: função vetorizada (população empacotada -> fitness (N,)),
+      ex.: lambda pop: objective(decode(pop, n_bits))
+    - crossover: "one_point", "k_point" (crossover_points cortes) ou "uniform"
+    - crossover_rate=0 desliga o cruzamento (apenas mutação, como no dia 06)
+    Maximiza o fitness. Retorna (melhor cromossomo como string,
+    melhor fitness, histórico do melhor por geração).
+    """
+    rng = np.random.default_rng(seed)
+    make_masks = CROSSOVER_MASKS[crossover]
+    if crossover == "k_point":
+        make_masks = partial(make_masks, k=crossover_points)
+    population = random_population(pop_size, n_bits, rng)
+    fitness = np.asarray(fitness_fn(population), dtype=float)
+    n_children = pop_size - elite_size
+    history = []
+
+    for generation in range(generations):
+        # elitismo: top elite_size sem ordenar a população inteira
+        elites = population[top_k(fitness, elite_size)]
+
+        # seleção, cruzamento e mutação de todos os filhos de uma vez
+        idx1 = tournament_selection(fitness, n_children, tournament_k, rng)
+        if crossover_rate > 0:
+            idx2 = tournament_selection(fitness, n_children, tournament_k, rng)
+            masks = make_masks(n_children, n_bits, rng)
+            children, _ = masked_crossover(population[idx1], population[idx2],
+                                           masks, rng, crossover_rate)
+        else:
+            children = population[idx1]
+        children = mutate(children, n_bits, mutation_rate, rng)
+
+        # substituição e avaliação (uma vez por geração)
+        population = np.concatenate((elites, children))
+        fitness = np.asarray(fitness_fn(population), dtype=float)
+        history.append(float(fitness.max()))
+
+        if verbose and (generation % 10 == 0 or generation == generations - 1):
+            print(f"Geração {generation:02d} | Melhor fitness = {history[-1]}")
+
+    best = int(np.argmax(fitness))
+    return to_strings(population[best:best + 1], n_bits)[0], float(fitness[best]), history
@@ -0,0 +1,287 @@
+"""
+🧩 Motor de GA real-coded vetorizado (NumPy)
+--------------------------------------------
+
+Motor compartilhado pelos GAs de representação real (dias 01–04 e 07).
+A população e seu fitness ficam em arrays NumPy (struct-of-arrays) e cada
+geração inteira é feita com operações em lote:
+
+- Avaliação: a função objetivo recebe o array da população e devolve (N,)
+- Seleção: torneios de k competidores para todos os pais de uma vez, ou
+  roleta (RouletteWheel: acumulada + busca binária ou amostragem
+  estocástica universal), montada uma vez por geração
+- Cruzamento: BLX-α (blend), aritmético ou média, por vetor
+- Mutação: gaussiana (ou uniforme) com máscara de genes mutados
+- Clamping: np.clip nos limites do domínio
+- Elitismo: top-k com np.argpartition (O(N), sem ordenar a população) e
+  substituição steady-state dos k piores
+
+A população tem forma (N,) para problemas 1-D ou (N, D) para D variáveis;
+os operadores atuam elemento a elemento e indexam indivíduos pelo eixo 0.
+Com isso populações de 1e5–1e6 indivíduos rodam em tempo interativo.
+"""
+
+from functools import partial
+
+import numpy as np
+
+
+# -----------------------------------------------------------
+# 1️⃣ Avaliação em lote
+# -----------------------------------------------------------
+def evaluate(objective, population: np.ndarray) -> np.ndarray:
+    """
+    Avalia a população inteira com uma única chamada à função objetivo.
+    A função deve aceitar o array da população e retornar um valor por indivíduo.
+    """
+    return np.asarray(objective(population), dtype=float).reshape(len(population))
+
+
+# -----------------------------------------------------------
+# 2️⃣ Inicialização
+# -----------------------------------------------------------
+def initialize_population(pop_size, low, high, rng, dim=None) -> np.ndarray:
+    """Gera a população uniforme em [low, high], com forma (N,) ou (N, dim)."""
+    shape = pop_size if dim is None else (pop_size, dim)
+    return rng.uniform(low, high, size=shape)
+
+
+# -----------------------------------------------------------
+# 3️⃣ Seleção por torneio (todos os pais de uma vez)
+# -----------------------------------------------------------
+def tournament_selection(fitness, n_select, k, rng, maximize=True) -> np.ndarray:
+    """
+    Realiza n_select torneios de k competidores e retorna os índices dos vencedores.
+    Os competidores de cada torneio são sorteados com reposição (diferente de
+    random.sample nos scripts), o que é equivalente para populações grandes.
+    """
+    contestants = rng.integers(0, len(fitness), size=(n_select, k))
+    scores = fitness[contestants]
+    winner = np.argmax(scores, axis=1) if maximize else np.argmin(scores, axis=1)
+    return contestants[np.arange(n_select), winner]
+
+
+class RouletteWheel:
+    """
+    Seleção proporcional ao fitness montada uma única vez por geração.
+    - sample(n): soma acumulada + np.searchsorted (O(log N) por sorteio)
+    - sus(n): amostragem estocástica universal (n ponteiros igualmente
+      espaçados, menor variância)
+    Fitness negativos são deslocados para que o menor valha 0.
+    Não há tabela de alias (Walker/Vose): a roda é refeita a cada geração e
+    sorteia ~N pais, então a montagem O(N) nunca se paga frente à cumsum.
+    """
+
+    def __init__(self, fitness, rng):
+        weights = np.asarray(fitness, dtype=float)
+        low = weights.min()
+        if low < 0:
+            weights = weights - low
+        if weights.sum() <= 0:
+            weights = np.ones_like(weights)  # todos nulos: sorteio uniforme
+        self.rng = rng
+        self.cumulative = np.cumsum(weights)
+
+    def sample(self, n) -> np.ndarray:
+        """Índices de n indivíduos sorteados (com reposição)."""
+        r = self.rng.random(n) * self.cumulative[-1]
+        idx = np.searchsorted(self.cumulative, r, side="right")
+        return np.minimum(idx, len(self.cumulative) - 1)
+
+    def sus(self, n) -> np.ndarray:
+        """Stochastic Universal Sampling: um único giro com n ponteiros (ordem embaralhada)."""
+        step = self.cumulative[-1] / n
+        pointers = (self.rng.random() + np.arange(n)) * step
+        idx = np.minimum(np.searchsorted(self.cumulative, pointers, side="right"),
+                         len(self.cumulative) - 1)
+        return self.rng.permutation(idx)
+
+
+def select_parents(fitness, n_select, rng, selection="tournament", k=2, maximize=True):
+    """
+    Índices de n_select pais pelo método escolhido:
+    "tournament", "roulette" ou "sus".
+    Na minimização, os métodos proporcionais usam -fitness como peso (a roda
+    o desloca para que o pior indivíduo valha 0).
+    """
+    if selection == "tournament":
+        return tournament_selection(fitness, n_select, k, rng, maximize)
+    weights = fitness if maximize else -np.asarray(fitness, dtype=float)
+    if selection == "sus":
+        return RouletteWheel(weights, rng).sus(n_select)
+    if selection == "roulette":
+        return RouletteWheel(weights, rng).sample(n_select)
+    raise ValueError(f"seleção desconhecida: {selection}")
+
+
+# -----------------------------------------------------------
+# 4️⃣ Cruzamento
+# -----------------------------------------------------------
+def blend_crossover(parent1, parent2, rng, alpha=0.5, crossover_rate=1.0, low=None, high=None):
+    """
+    BLX-α em lote: cada filho é sorteado em
+    [min - α·|p1 - p2|, max + α·|p1 - p2|], gene a gene.
+    Pares sem cruzamento (prob. 1 - crossover_rate) copiam parent1.
+    """
+    diff = np.abs(parent1 - parent2)
+    lower = np.minimum(parent1, parent2) - alpha * diff
+    upper = np.maximum(parent1, parent2) + alpha * diff
+    child = rng.uniform(lower, upper)
+    if crossover_rate < 1.0:
+        keep = rng.random(len(parent1)) >= crossover_rate
+        child[keep] = parent1[keep]
+    return clamp(child, low, high)
+
+
+def arithmetic_crossover(parent1, parent2, rng, crossover_rate=1.0, low=None, high=None):
+    """Crossover aritmético: filho = a·p1 + (1 - a)·p2, com a ~ U(0, 1) por filho."""
+    a = rng.random(len(parent1)).reshape((-1,) + (1,) * (parent1.ndim - 1))
+    child = a * parent1 + (1 - a) * parent2
+    if crossover_rate < 1.0:
+        keep = rng.random(len(parent1)) >= crossover_rate
+        child[keep] = parent1[keep]
+    return clamp(child, low, high)
+
+
+def average_crossover(parent1, parent2, rng=None, crossover_rate=1.0, low=None, high=None):
+    """Crossover por média simples (dia 01): filho = (p1 + p2) / 2."""
+    return clamp((parent1 + parent2) / 2, low, high)
+
+
+CROSSOVERS = {
+    "blend": blend_crossover,
+    "arithmetic": arithmetic_crossover,
+    "average": average_crossover,
+}
+
+
+# -----------------------------------------------------------
+# 5️⃣ Mutação e clamping
+# -----------------------------------------------------------
+def mutate(population, rng, rate, scale, low=None, high=None, distribution="gaussian"):
+    """
+    Mutação em lote: cada gene sofre, com probabilidade `rate`, uma
+    perturbação N(0, scale) ("gaussian") ou U(-scale, scale) ("uniform").
+    """
+    mask = rng.random(population.shape) < rate
+    if distribution == "gaussian":
+        noise = rng.normal(0.0, scale, size=population.shape)
+    else:
+        noise = rng.uniform(-scale, scale, size=population.shape)
+    return clamp(population + mask * noise, low, high)
+
+
+def clamp(population, low=None, high=None):
+    """Mantém os genes dentro de [low, high] (limites None são ignorados)."""
+    if low is None and high is None:
+        return population
+    return np.clip(population, low, high)
+
+
+# -----------------------------------------------------------
+# 6️⃣ Elitismo e substituição (seleção parcial, sem ordenar tudo)
+# -----------------------------------------------------------
+def top_k(fitness, k, maximize=True) -> np.ndarray:
+    """
+    Índices dos k melhores, do melhor para o pior, em O(N + k log k):
+    np.argpartition separa os k primeiros e só eles são ordenados.
+    """
+    key = -np.asarray(fitness) if maximize else np.asarray(fitness)
+    k = min(k, len(key))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    idx = np.argpartition(key, k - 1)[:k] if k < len(key) else np.arange(len(key))
+    return idx[np.argsort(key[idx], kind="stable")]
+
+
+def worst_k(fitness, k, maximize=True) -> np.ndarray:
+    """Índices dos k piores, do pior para o melhor."""
+    return top_k(fitness, k, maximize=not maximize)
+
+
+def replace_worst(population, fitness, children, children_fitness, maximize=True):
+    """
+    Substituição steady-state (in place): os filhos ocupam o lugar dos
+    len(children) piores indivíduos. Retorna os índices substituídos.
+    """
+    idx = worst_k(fitness, len(children), maximize)
+    population[idx] = children
+    fitness[idx] = children_fitness
+    return idx
+
+
+# -----------------------------------------------------------
+# 7️⃣ Loop evolutivo vetorizado
+# -----------------------------------------------------------
+def run_real_ga(
+    objective,
+    low,
+    high,
+    pop_size=100_000,
+    generations=50,
+    dim=None,
+    tournament_k=2,
+    selection="tournament",
+    crossover="blend",
+    crossover_rate=0.9,
+    alpha=0.5,
+    mutation_rate=0.1,
+    mutation_scale=0.1,
+    mutation_distribution="gaussian",
+    elite_size=1,
+    steady_state=0,
+    maximize=True,
+    seed=None,
+    verbose=True,
+):
+    """
+    Executa um GA real-coded com a geração inteira em operações de array.
+    - objective: função vetorizada (população -> fitness (N,))
+    - selection: "tournament", "roulette" ou "sus"
+    - crossover: "blend" (BLX-α), "arithmetic" ou "average"
+    - elite_size: melhores preservados a cada geração
+    - steady_state: se > 0, cada geração cria apenas esse número de filhos,
+      que substituem os piores (apenas os filhos são avaliados)
+    Cada indivíduo é avaliado uma única vez (os elites mantêm o fitness).
+    Retorna (melhor indivíduo, melhor fitness, histórico do melhor por geração).
+    """
+    rng = np.random.default_rng(seed)
+    cross = CROSSOVERS[crossover]
+    if crossover == "blend":
+        cross = partial(cross, alpha=alpha)
+
+    population = initialize_population(pop_size, low, high, rng, dim)
+    fitness = evaluate(objective, population)
+    n_children = steady_state or pop_size - elite_size
+    history = []
+
+    for generation in range(generations):
+        # seleção de todos os pais de uma vez (2 * n_children sorteios)
+        parents = select_parents(fitness, 2 * n_children, rng, selection, tournament_k, maximize)
+        idx1, idx2 = parents[:n_children], parents[n_children:]
+
+        # cruzamento + mutação em lote
+        children = cross(population[idx1], population[idx2], rng,
+                         crossover_rate=crossover_rate, low=low, high=high)
+        children = mutate(children, rng, mutation_rate, mutation_scale, low, high,
+                          mutation_distribution)
+
+        # substituição e avaliação (uma vez por geração)
+        if steady_state:
+            replace_worst(population, fitness, children,
+                          evaluate(objective, children), maximize)
+        else:
+            # elitismo: top elite_size sem ordenar a população inteira; o
+            # fitness dos elites já é conhecido, só os filhos são avaliados
+            elite_idx = top_k(fitness, elite_size, maximize)
+            population = np.concatenate((population[elite_idx], children))
+            fitness = np.concatenate((fitness[elite_idx], evaluate(objective, children)))
+
+        best = np.argmax(fitness) if maximize else np.argmin(fitness)
+        history.append(float(fitness[best]))
+
+        if verbose and (generation % 10 == 0 or generation == generations - 1):
+            print(f"Geração {generation:02d} | Melhor f(x) = {history[-1]:.5f}")
+
+    best = np.argmax(fitness) if maximize else np.argmin(fitness)
+    return population[best], float(fitness[best]), history
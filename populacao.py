@@ -0,0 +1,101 @@
+"""
+🧩 População com fitness em cache
+---------------------------------
+
+Estrutura compartilhada pelos GAs dos dias 02–09.
+
+Nos scripts originais o fitness de um mesmo indivíduo era recalculado várias
+vezes por geração: em cada torneio, no elitismo (`max`/`sorted`) e ao
+registrar o melhor. `Population` avalia cada indivíduo exatamente uma vez
+quando a geração é criada e guarda o valor ao lado dele; seleção, elitismo e
+relatórios passam a consultar apenas o cache.
+
+- `population[i]` / `population.fitness[i]`: indivíduo e seu fitness
+- `best()` / `elite(n)`: melhor indivíduo e os n melhores (maximização);
+  `elite` usa heapq.nlargest (O(N log n)) em vez de ordenar a população
+- `replace_worst(inds)`: substituição steady-state dos len(inds) piores
+- `roulette()`: seleção proporcional ao fitness; a roda acumulada é montada
+  uma vez por geração e cada sorteio é uma busca binária (O(log N))
+- `next_generation(inds)`: avalia a nova geração e acumula o contador
+- `evaluations`: total de chamadas à função de fitness desde a 1ª geração
+  (exatamente POP_SIZE por geração)
+"""
+
+import bisect
+import heapq
+import random
+from itertools import accumulate
+
+
+class Population:
+    """Lista de indivíduos com o fitness de cada um calculado uma única vez."""
+
+    def __init__(self, individuals, fitness_fn, evaluations=0):
+        self.individuals = list(individuals)
+        self.fitness_fn = fitness_fn
+        self.fitness = [fitness_fn(ind) for ind in self.individuals]
+        self.evaluations = evaluations + len(self.individuals)
+        self._cumulative = None  # roda da roleta (montada sob demanda)
+
+    def __len__(self):
+        return len(self.individuals)
+
+    def __getitem__(self, i):
+        return self.individuals[i]
+
+    def __iter__(self):
+        return iter(self.individuals)
+
+    def best_index(self):
+        """Índice do melhor indivíduo (o primeiro, em caso de empate, como `max`)."""
+        return max(range(len(self.fitness)), key=self.fitness.__getitem__)
+
+    def best(self):
+        """Retorna (melhor indivíduo, fitness) sem reavaliar."""
+        i = self.best_index()
+        return self.individuals[i], self.fitness[i]
+
+    def elite(self, n):
+        """
+        Os n melhores indivíduos, em ordem decrescente de fitness.
+        heapq.nlargest mantém só um heap de n índices (O(N log n)) e desempata
+        como a ordenação estável: o primeiro da população vence.
+        """
+        top = heapq.nlargest(n, range(len(self.fitness)), key=self.fitness.__getitem__)
+        return [self.individuals[i] for i in top]
+
+    def worst_indices(self, n):
+        """Índices dos n piores indivíduos (heapq.nsmallest, O(N log n))."""
+        return heapq.nsmallest(n, range(len(self.fitness)), key=self.fitness.__getitem__)
+
+    def replace_worst(self, individuals):
+        """
+        Substituição steady-state (in place): avalia apenas os novos indivíduos
+        e os coloca no lugar dos len(individuals) piores da população.
+        """
+        individuals = list(individuals)
+        for i, ind in zip(self.worst_indices(len(individuals)), individuals):
+            self.individuals[i] = ind
+            self.fitness[i] = self.fitness_fn(ind)
+        self.evaluations += len(individuals)
+        self._cumulative = None  # a roda da roleta mudou
+
+    def roulette(self):
+        """
+        Sorteia um indivíduo com probabilidade proporcional ao fitness.
+        Fitness negativos são deslocados para que o menor valha 0; se todos
+        forem iguais a 0, o sorteio é uniforme.
+        """
+        if self._cumulative is None:
+            low = min(self.fitness)
+            weights = self.fitness if low >= 0 else [f - low for f in self.fitness]
+            self._cumulative = list(accumulate(weights))
+        total = self._cumulative[-1]
+        if total <= 0:
+            return self.individuals[random.randrange(len(self.individuals))]
+        i = bisect.bisect_right(self._cumulative, random.random() * total)
+        return self.individuals[min(i, len(self.individuals) - 1)]
+
+    def next_generation(self, individuals):
+        """Cria a próxima geração (avaliada uma vez), mantendo o contador acumulado."""
+        return Population(individuals, self.fitness_fn, evaluations=self.evaluations)
@@ -0,0 +1,173 @@
+import numpy as np
+import pytest
+
+import ga_binario_empacotado as packed
+
+
+def _strings(rng, n, n_bits):
+    return ["".join(rng.choice(["0", "1"], size=n_bits)) for _ in range(n)]
+
+
+# -----------------------------------------------------------
+# Conversões e decodificação
+# -----------------------------------------------------------
+@pytest.mark.parametrize("n_bits", [1, 5, 8, 13, 63, 200])
+def test_pack_unpack_ida_e_volta(n_bits):
+    rng = np.random.default_rng(n_bits)
+    bits = rng.integers(0, 2, size=(50, n_bits), dtype=np.uint8)
+    population = packed.pack(bits)
+    assert population.shape == (50, packed.n_bytes(n_bits))
+    np.testing.assert_array_equal(packed.unpack(population, n_bits), bits)
+    # bits de preenchimento sempre em 0
+    assert not (population[:, -1] & ~packed.tail_mask(n_bits)).any()
+
+
+@pytest.mark.parametrize("n_bits", [1, 5, 8, 13, 40])
+def test_strings_ida_e_volta(n_bits):
+    chromosomes = _strings(np.random.default_rng(0), 30, n_bits)
+    population = packed.from_strings(chromosomes)
+    assert packed.to_strings(population, n_bits) == chromosomes
+
+
+@pytest.mark.parametrize("n_bits", [1, 5, 8, 13, 32, 63])
+def test_decode_igual_a_int(n_bits):
+    chromosomes = _strings(np.random.default_rng(1), 40, n_bits)
+    chromosomes.append("1" * n_bits)
+    values = packed.decode(packed.from_strings(chromosomes), n_bits)
+    assert values.dtype == np.int64
+    assert values.tolist() == [int(c, 2) for c in chromosomes]
+
+
+def test_decode_rejeita_mais_de_63_bits():
+    with pytest.raises(ValueError):
+        packed.decode(packed.random_population(4, 64, np.random.default_rng(0)), 64)
+
+
+def test_random_population_zera_preenchimento():
+    population = packed.random_population(1000, 13, np.random.default_rng(0))
+    assert not (population[:, -1] & ~packed.tail_mask(13)).any()
+
+
+# -----------------------------------------------------------
+# Decodificador multivariável
+# -----------------------------------------------------------
+def _decode_escalar(chromosome, lengths, low, high, gray):
+    values, start = [], 0
+    for length, lo, hi in zip(lengths, low, high):
+        field = chromosome[start:start + length]
+        start += length
+        if gray:
+            binary, bit = [], "0"
+            for g in field:
+                bit = "1" if bit != g else "0"
+                binary.append(bit)
+            field = "".join(binary)
+        values.append(lo + int(field, 2) * (hi - lo) / (2 ** length - 1))
+    return values
+
+
+@pytest.mark.parametrize("gray", [False, True])
+@pytest.mark.parametrize("lengths", [[10, 10, 10], [3, 17, 8, 17, 1]])
+def test_binary_decoder_igual_ao_escalar(lengths, gray):
+    low = np.linspace(-5, 0, len(lengths))
+    high = np.linspace(1, 10, len(lengths))
+    chromosomes = _strings(np.random.default_rng(2), 25, sum(lengths))
+    decoder = packed.BinaryDecoder(lengths, low, high, gray=gray)
+    result = decoder(packed.from_strings(chromosomes))
+    expected = [_decode_escalar(c, lengths, low, high, gray) for c in chromosomes]
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_binary_decoder_extremos():
+    decoder = packed.BinaryDecoder(12, -1.0, 3.0, n_vars=4)
+    population = packed.from_strings(["0" * 48, "1" * 48])
+    np.testing.assert_array_equal(decoder(population), [[-1.0] * 4, [3.0] * 4])
+
+
+def test_binary_decoder_rejeita_campos_longos():
+    with pytest.raises(ValueError):
+        packed.BinaryDecoder([64, 8], 0.0, 1.0)
+
+
+# -----------------------------------------------------------
+# Fitness por tabela
+# -----------------------------------------------------------
+def test_tabela_igual_a_avaliacao_direta_com_objetivo_com_sinal():
+    n_bits = 10
+    objective = lambda x: -(x - 15) ** 2
+    population = packed.random_population(500, n_bits, np.random.default_rng(3))
+    direct = np.array([objective(int(c, 2)) for c in packed.to_strings(population, n_bits)])
+
+    by_table = packed.lookup_fitness(objective, n_bits)(population)
+    by_decode = packed.lookup_fitness(objective, n_bits, max_bytes=0)(population)
+    np.testing.assert_array_equal(by_table, direct)
+    np.testing.assert_array_equal(by_decode, direct)
+    assert direct.min() < 0
+
+
+def test_tabela_acima_do_orcamento():
+    assert packed.fitness_table(lambda x: x, 20, max_bytes=2**20) is None
+    assert packed.fitness_table(lambda x: x, 64) is None
+
+
+# -----------------------------------------------------------
+# Máscaras de crossover e mutação
+# -----------------------------------------------------------
+def _segmentos(masks, n_bits):
+    # número de trocas p1 <-> p2 ao longo de cada máscara
+    bits = packed.unpack(masks, n_bits).astype(int)
+    return np.abs(np.diff(bits, axis=1)).sum(axis=1), bits
+
+
+def test_one_point_masks():
+    n_bits = 13
+    changes, bits = _segmentos(packed.one_point_masks(2000, n_bits, np.random.default_rng(4)), n_bits)
+    np.testing.assert_array_equal(changes, 1)
+    assert (bits[:, 0] == 1).all() and (bits[:, -1] == 0).all()
+    # todos os pontos de corte em [1, n_bits - 1] aparecem
+    assert set(bits.sum(axis=1)) == set(range(1, n_bits))
+
+
+@pytest.mark.parametrize("k", [1, 2, 3, 6, 11])
+def test_k_point_masks(k):
+    n_bits = 12
+    changes, bits = _segmentos(packed.k_point_masks(1000, n_bits, np.random.default_rng(k), k=k), n_bits)
+    np.testing.assert_array_equal(changes, k)
+    assert (bits[:, 0] == 1).all()
+
+
+def test_uniform_masks_frequencia():
+    n_bits = 40
+    bits = packed.unpack(packed.uniform_masks(5000, n_bits, np.random.default_rng(5), swap_prob=0.3), n_bits)
+    assert abs(1 - bits.mean() - 0.3) < 0.01
+
+
+@pytest.mark.parametrize("make", [
+    packed.one_point_masks,
+    packed.k_point_masks,
+])
+def test_masks_sem_ponto_de_corte(make):
+    masks = make(10, 1, np.random.default_rng(0))
+    np.testing.assert_array_equal(packed.unpack(masks, 1), 1)
+
+
+def test_masked_crossover_preserva_genes():
+    n_bits = 21
+    rng = np.random.default_rng(6)
+    p1 = packed.random_population(300, n_bits, rng)
+    p2 = packed.random_population(300, n_bits, rng)
+    masks = packed.k_point_masks(300, n_bits, rng, k=3)
+    c1, c2 = packed.masked_crossover(p1, p2, masks)
+    m = packed.unpack(masks, n_bits).astype(bool)
+    b1, b2 = packed.unpack(p1, n_bits), packed.unpack(p2, n_bits)
+    np.testing.assert_array_equal(packed.unpack(c1, n_bits), np.where(m, b1, b2))
+    np.testing.assert_array_equal(packed.unpack(c2, n_bits), np.where(m, b2, b1))
+
+
+@pytest.mark.parametrize("rate", [0.01, 0.3])
+def test_mutate_taxa_e_preenchimento(rate):
+    n_bits = 37
+    population = np.zeros((4000, packed.n_bytes(n_bits)), dtype=np.uint8)
+    mutated = packed.mutate(population, n_bits, rate, np.random.default_rng(7))
+    assert not (mutated[:, -1] & ~packed.tail_mask(n_bits)).any()
+    assert abs(packed.unpack(mutated, n_bits).mean() - rate) < 0.1 * rate
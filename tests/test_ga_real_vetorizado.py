@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+import ga_real_vetorizado as real
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+@pytest.mark.parametrize("k", [0, 1, 7, 100, 150])
+def test_top_k_e_worst_k_iguais_ao_argsort(k, maximize):
+    fitness = np.random.default_rng(k).integers(0, 30, size=100).astype(float)
+    key = -fitness if maximize else fitness
+    best = real.top_k(fitness, k, maximize)
+    worst = real.worst_k(fitness, k, maximize)
+    assert len(best) == len(worst) == min(k, 100)
+    # empates podem trocar de posição: compara os valores, não os índices
+    np.testing.assert_array_equal(key[best], np.sort(key)[:k])
+    np.testing.assert_array_equal(key[worst], np.sort(key)[::-1][:k])
+    assert len(set(best.tolist())) == len(best)
+
+
+def test_replace_worst():
+    fitness = np.array([5.0, 1.0, 4.0, 0.0, 3.0])
+    population = np.arange(5.0)[:, None]
+    idx = real.replace_worst(population, fitness, np.array([[9.0], [8.0]]), np.array([9.0, 8.0]))
+    assert sorted(idx.tolist()) == [1, 3]
+    assert sorted(fitness.tolist()) == [3.0, 4.0, 5.0, 8.0, 9.0]
+
+
+@pytest.mark.parametrize("selection", ["roulette", "sus"])
+def test_roleta_minimizacao_favorece_os_menores(selection):
+    fitness = np.arange(5.0)
+    rng = np.random.default_rng(8)
+    for maximize, favorito in ((True, 4), (False, 0)):
+        chosen = real.select_parents(fitness, 20_000, rng, selection, maximize=maximize)
+        counts = np.bincount(chosen, minlength=5)
+        assert counts.argmax() == favorito
+        # o pior recebe peso 0
+        assert counts[4 - favorito] == 0
+
+
+def test_roleta_proporcional():
+    fitness = np.array([1.0, 2.0, 3.0, 4.0])
+    wheel = real.RouletteWheel(fitness, np.random.default_rng(9))
+    freq = np.bincount(wheel.sample(200_000), minlength=4) / 200_000
+    np.testing.assert_allclose(freq, fitness / fitness.sum(), atol=0.01)
+    np.testing.assert_allclose(np.bincount(wheel.sus(1000), minlength=4), [100, 200, 300, 400], atol=1)
+
+
+def test_run_real_ga_avalia_cada_individuo_uma_vez():
+    calls = []
+
+    def objective(x):
+        calls.append(len(x))
+        return -np.sum(x ** 2, axis=1)
+
+    pop_size, generations, elite = 50, 10, 4
+    real.run_real_ga(objective, dim=3, low=-5.0, high=5.0, pop_size=pop_size,
+                     generations=generations, elite_size=elite, seed=0, verbose=False)
+    assert sum(calls) == pop_size + generations * (pop_size - elite)
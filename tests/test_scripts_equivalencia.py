@@ -0,0 +1,75 @@
+import importlib
+import importlib.util
+import itertools
+import os
+
+import numpy as np
+import pytest
+
+import ga_binario_empacotado as packed
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _carregar(nome):
+    # "dia_07_GA_ fitness_continuo.py" tem espaço no nome: import pelo caminho
+    if " " not in nome:
+        return importlib.import_module(nome)
+    spec = importlib.util.spec_from_file_location(nome.replace(" ", ""), os.path.join(RAIZ, nome + ".py"))
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+BINARIOS = {
+    "dia_05_GA_cruzamento_um_ponto": "CHROMOSOME_LENGTH",
+    "dia_06_GA_mutacao_aleatoria": "CHROMOSOME_LENGTH",
+    "dia_08_GA_binario_bits": "N_BITS",
+    "dia_09_GA_elitismo": "N_BITS",
+}
+
+REAIS = {
+    "dia_01_base_algoritmo_evolucionario": ("fitness", -10, 10),
+    "dia_02_GA_classico_maximizar_funcao": ("objective_function", -1, 2),
+    "dia_03_GA_selecao_roleta": ("objective_function", -1, 2),
+    "dia_04_GA_selecao_torneio": ("objective_function", -1, 2),
+    "dia_07_GA_ fitness_continuo": ("fitness", -1, 2),
+}
+
+
+# -----------------------------------------------------------
+# GAs binários: versão empacotada x fitness escalar dos scripts
+# -----------------------------------------------------------
+@pytest.mark.parametrize("nome", sorted(BINARIOS))
+def test_fitness_empacotado_igual_ao_escalar(nome):
+    script = _carregar(nome)
+    n_bits = getattr(script, BINARIOS[nome])
+    chromosomes = ["".join(bits) for bits in itertools.product("01", repeat=n_bits)]
+    population = packed.from_strings(chromosomes)
+
+    esperado = [script.fitness(c) for c in chromosomes]
+    for max_bytes in (packed.LUT_MAX_BYTES, 0):  # tabela e avaliação direta
+        fitness_fn = packed.lookup_fitness(script.objective_function, n_bits, max_bytes)
+        assert fitness_fn(population).tolist() == esperado
+
+
+@pytest.mark.parametrize("nome", sorted(BINARIOS))
+def test_ga_empacotado_encontra_o_otimo(nome):
+    script = _carregar(nome)
+    n_bits = getattr(script, BINARIOS[nome])
+    melhor, fitness, history = script.run_ga_packed(pop_size=2000, seed=0)
+    assert melhor == "1" * n_bits
+    assert fitness == script.fitness(melhor)
+    assert history == sorted(history)  # elitismo: o melhor nunca piora
+
+
+# -----------------------------------------------------------
+# GAs reais: objetivo vetorizado x avaliação escalar
+# -----------------------------------------------------------
+@pytest.mark.parametrize("nome", sorted(REAIS))
+def test_objetivo_vetorizado_igual_ao_escalar(nome):
+    script = _carregar(nome)
+    funcao, low, high = REAIS[nome]
+    objective = getattr(script, funcao)
+    xs = np.random.default_rng(0).uniform(low, high, size=200)
+    np.testing.assert_allclose(objective(xs), [objective(float(x)) for x in xs], rtol=1e-12)
@@ -0,0 +1,164 @@
+import time
+
+import numpy as np
+import pytest
+
+import dia_14_ACO_TSP_caixeiro_viajanta as aco
+from tsp_instancias import ler_tsplib, matriz_distancias
+
+BURMA14 = """\
+NAME: burma14
+TYPE: TSP
+COMMENT: 14-Staedte in Burma (Zaw Win)
+DIMENSION: 14
+EDGE_WEIGHT_TYPE: GEO
+EDGE_WEIGHT_FORMAT: FUNCTION
+DISPLAY_DATA_TYPE: COORD_DISPLAY
+NODE_COORD_SECTION
+   1  16.47       96.10
+   2  16.47       94.44
+   3  20.09       92.54
+   4  22.39       93.37
+   5  25.23       97.24
+   6  22.00       96.05
+   7  20.47       97.02
+   8  17.20       96.29
+   9  16.30       97.38
+  10  14.05       98.12
+  11  16.53       97.38
+  12  21.52       95.59
+  13  19.41       97.13
+  14  20.09       94.55
+EOF
+"""
+
+# rota ótima publicada na TSPLIB (burma14.opt.tour), custo 3323
+BURMA14_OTIMA = [1, 2, 14, 3, 4, 5, 6, 12, 7, 13, 8, 11, 9, 10]
+
+
+def _custo(rota, distancias):
+    rota = np.asarray(rota)
+    return float(distancias[rota, np.roll(rota, -1)].sum())
+
+
+def _cidades_aglomeradas(n, seed=0):
+    # metade uniforme em [0, 1000]^2 e metade num aglomerado bem pequeno
+    rng = np.random.default_rng(seed)
+    return np.concatenate((rng.random((n - n // 2, 2)) * 1000,
+                           500 + rng.random((n // 2, 2))))
+
+
+# -----------------------------------------------------------
+# Leitor TSPLIB
+# -----------------------------------------------------------
+@pytest.fixture
+def burma14(tmp_path):
+    caminho = tmp_path / "burma14.tsp"
+    caminho.write_text(BURMA14)
+    return ler_tsplib(str(caminho))
+
+
+def test_ler_tsplib_burma14(burma14):
+    assert burma14.nome == "burma14"
+    assert burma14.tipo == "GEO"
+    assert burma14.dimensao == 14
+    assert burma14.coordenadas.shape == (14, 2)
+    np.testing.assert_array_equal(burma14.coordenadas[13], [20.09, 94.55])
+
+    distancias = burma14.distancias()
+    assert distancias[0, 1] == 153  # 1ª entrada da matriz oficial
+    np.testing.assert_array_equal(distancias, distancias.T)
+    assert _custo(np.array(BURMA14_OTIMA) - 1, distancias) == 3323
+
+
+def test_ler_tsplib_matriz_explicita(tmp_path):
+    caminho = tmp_path / "tri.tsp"
+    caminho.write_text("NAME: tri\nDIMENSION: 3\nEDGE_WEIGHT_TYPE: EXPLICIT\n"
+                       "EDGE_WEIGHT_FORMAT: UPPER_ROW\nEDGE_WEIGHT_SECTION\n1 2\n3\nEOF\n")
+    np.testing.assert_array_equal(ler_tsplib(str(caminho)).distancias(),
+                                  [[0, 1, 2], [1, 0, 3], [2, 3, 0]])
+
+
+def test_matriz_distancias_em_blocos_e_cache(tmp_path):
+    cidades = np.random.default_rng(1).random((300, 2)) * 100
+    esperado = np.sqrt(((cidades[:, None] - cidades[None]) ** 2).sum(-1))
+    np.testing.assert_allclose(matriz_distancias(cidades), esperado)
+    em_disco = matriz_distancias(cidades, dtype=np.float32, cache_dir=str(tmp_path))
+    assert em_disco.dtype == np.float32
+    np.testing.assert_allclose(em_disco, esperado, rtol=1e-6)
+
+
+# -----------------------------------------------------------
+# Vizinhos por grade espacial
+# -----------------------------------------------------------
+@pytest.mark.parametrize("cidades", [
+    np.random.default_rng(2).random((3000, 2)) * 1000,
+    _cidades_aglomeradas(6000),
+    np.repeat(np.random.default_rng(3).random((300, 2)), 4, axis=0),  # duplicadas
+], ids=["uniforme", "aglomerada", "duplicadas"])
+def test_vizinhos_proximos_igual_a_forca_bruta(cidades):
+    k = 8
+    vizinhos, dist = aco.GradeEspacial(cidades).vizinhos_proximos(k)
+    d = np.sqrt(((cidades[:, None] - cidades[None]) ** 2).sum(-1))
+    np.fill_diagonal(d, np.inf)
+    esperado = np.sort(d, axis=1)[:, :k]
+    # empates podem trocar o vizinho, não a distância
+    np.testing.assert_allclose(dist, esperado, atol=1e-9)
+    np.testing.assert_allclose(np.take_along_axis(d, vizinhos, axis=1), esperado, atol=1e-9)
+
+
+def test_vizinhos_proximos_aglomerado_rapido():
+    # metade das cidades num aglomerado: a 1ª passada não pode ser
+    # dimensionada pela célula mais cheia (antes levava ~15 s)
+    cidades = _cidades_aglomeradas(6000, seed=5)
+    inicio = time.perf_counter()
+    aco.GradeEspacial(cidades).vizinhos_proximos(10)
+    assert time.perf_counter() - inicio < 5.0
+
+
+# -----------------------------------------------------------
+# Busca local
+# -----------------------------------------------------------
+@pytest.mark.parametrize("busca", ["2opt", "oropt", "2opt+oropt"])
+def test_busca_local_nunca_piora(busca):
+    rng = np.random.default_rng(4)
+    cidades = rng.random((120, 2)) * 100
+    distancias = matriz_distancias(cidades)
+    melhorar = aco.preparar_busca(busca, distancias, k=8)
+    for _ in range(10):
+        rota = rng.permutation(len(cidades))
+        nova = melhorar(rota)
+        assert sorted(nova.tolist()) == list(range(len(cidades)))
+        assert _custo(nova, distancias) < _custo(rota, distancias)
+        # aplicar de novo (fila com todas as cidades) também nunca piora
+        assert _custo(melhorar(nova), distancias) <= _custo(nova, distancias) + 1e-9
+
+
+def test_busca_local_em_burma14(burma14):
+    distancias = burma14.distancias()
+    melhorar = aco.preparar_busca("2opt+oropt", distancias, k=13)
+    rota = melhorar(np.arange(14))
+    assert sorted(rota.tolist()) == list(range(14))
+    assert 3323 <= _custo(rota, distancias) <= _custo(np.arange(14), distancias)
+
+
+# -----------------------------------------------------------
+# ACO
+# -----------------------------------------------------------
+def test_aco_tsp_rota_valida_e_custo_coerente(burma14):
+    np.random.seed(0)
+    distancias = burma14.distancias()
+    rota, custo = aco.aco_tsp(num_formigas=10, iteracoes=5, distancias=distancias, busca="2opt")
+    assert sorted(rota) == list(range(14))
+    assert custo == pytest.approx(_custo(rota, distancias))
+
+
+def test_aco_tsp_candidatos_rejeita_matriz(burma14):
+    with pytest.raises(ValueError):
+        aco.aco_tsp(candidatos=5, distancias=burma14.distancias())
+
+
+def test_aco_tsp_candidatos_sem_cidades():
+    np.random.seed(0)
+    rota, _ = aco.aco_tsp(num_cidades=30, num_formigas=5, iteracoes=2, candidatos=5)
+    assert sorted(rota) == list(range(30))
@@ -0,0 +1,238 @@
+"""
+🧩 Instâncias do TSP: leitor TSPLIB e matriz de distâncias vetorizada
+---------------------------------------------------------------------
+
+Utilitários usados pelo ACO do dia 14 para rodar em instâncias reais.
+
+- ler_tsplib(caminho): lê arquivos `.tsp` da TSPLIB com coordenadas
+  (EUC_2D, CEIL_2D, ATT, GEO) ou matriz explícita (EDGE_WEIGHT_SECTION em
+  FULL_MATRIX, UPPER/LOWER_ROW, UPPER/LOWER_DIAG_ROW e as variantes _COL)
+- distancias_pares(a, b, tipo): distância elemento a elemento (com
+  broadcasting) pela métrica da TSPLIB; "EUCLIDIANA" é a distância real sem
+  arredondamento (cidades aleatórias)
+- matriz_distancias(coords, tipo, dtype, cache_dir): matriz n x n montada em
+  blocos de linhas (memória temporária limitada), em float64 ou float32, com
+  cache opcional em disco (.npy aberto como memmap) identificado pelo nome
+  da instância e por um hash das coordenadas
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+# constantes da definição TSPLIB da métrica GEO
+PI_TSPLIB = 3.141592
+RAIO_TERRA = 6378.388
+
+SECOES = {
+    "NODE_COORD_SECTION",
+    "EDGE_WEIGHT_SECTION",
+    "DISPLAY_DATA_SECTION",
+    "FIXED_EDGES_SECTION",
+    "TOUR_SECTION",
+    "DEPOT_SECTION",
+    "DEMAND_SECTION",
+}
+
+
+# -----------------------------------------------------------
+# 1️⃣ Métricas (vetorizadas)
+# -----------------------------------------------------------
+def _nint(x):
+    """Arredondamento da TSPLIB: (int)(x + 0.5)."""
+    return np.floor(x + 0.5)
+
+
+def _geo_radianos(coordenada):
+    """Graus.minutos (DDD.MM) -> radianos, truncando os graus como na TSPLIB."""
+    graus = np.trunc(coordenada)
+    minutos = coordenada - graus
+    return PI_TSPLIB * (graus + 5.0 * minutos / 3.0) / 180.0
+
+
+def distancias_pares(a, b, tipo="EUCLIDIANA"):
+    """
+    Distância entre a[..., :] e b[..., :] (pontos 2-D, com broadcasting).
+    tipo: "EUCLIDIANA", "EUC_2D", "CEIL_2D", "ATT" ou "GEO".
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if tipo == "GEO":
+        lat_a, lon_a = _geo_radianos(a[..., 0]), _geo_radianos(a[..., 1])
+        lat_b, lon_b = _geo_radianos(b[..., 0]), _geo_radianos(b[..., 1])
+        q1 = np.cos(lon_a - lon_b)
+        q2 = np.cos(lat_a - lat_b)
+        q3 = np.cos(lat_a + lat_b)
+        cosseno = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+        return np.floor(RAIO_TERRA * np.arccos(cosseno) + 1.0)
+
+    dx = a[..., 0] - b[..., 0]
+    dy = a[..., 1] - b[..., 1]
+    quadrado = dx * dx + dy * dy
+    if tipo == "ATT":
+        r = np.sqrt(quadrado / 10.0)
+        t = _nint(r)
+        return np.where(t < r, t + 1.0, t)
+    d = np.sqrt(quadrado)
+    if tipo == "EUC_2D":
+        return _nint(d)
+    if tipo == "CEIL_2D":
+        return np.ceil(d)
+    if tipo == "EUCLIDIANA":
+        return d
+    raise ValueError(f"métrica não suportada: {tipo}")
+
+
+# -----------------------------------------------------------
+# 2️⃣ Matriz de distâncias em blocos + cache em disco
+# -----------------------------------------------------------
+def chave_cache(coords, tipo, dtype, nome="instancia"):
+    """Nome do arquivo de cache: nome da instância + hash de coordenadas/métrica/dtype."""
+    h = hashlib.sha1(np.ascontiguousarray(coords, dtype=float).tobytes())
+    h.update(f"{tipo}|{np.dtype(dtype).str}".encode())
+    return f"{nome}_{h.hexdigest()[:16]}.npy"
+
+
+def matriz_distancias(coords, tipo="EUCLIDIANA", dtype=np.float64, cache_dir=None,
+                      nome="instancia", max_elementos=2**22):
+    """
+    Matriz n x n de distâncias, calculada por blocos de linhas com
+    broadcasting (cada bloco tem até max_elementos entradas temporárias).
+    - dtype=np.float32 reduz a memória à metade
+    - cache_dir: se definido, a matriz é gravada/lida em
+      cache_dir/<nome>_<hash>.npy e devolvida como memmap (somente leitura),
+      sem carregar tudo na RAM
+    A diagonal é sempre 0.
+    """
+    coords = np.asarray(coords, dtype=float)
+    n = len(coords)
+
+    caminho = None
+    if cache_dir is not None:
+        caminho = os.path.join(cache_dir, chave_cache(coords, tipo, dtype, nome))
+        if os.path.exists(caminho):
+            return np.load(caminho, mmap_mode="r")
+        os.makedirs(cache_dir, exist_ok=True)
+        temporario = caminho + ".tmp"
+        matriz = np.lib.format.open_memmap(temporario, mode="w+", dtype=dtype, shape=(n, n))
+    else:
+        matriz = np.empty((n, n), dtype=dtype)
+
+    linhas = max(1, max_elementos // max(n, 1))
+    for ini in range(0, n, linhas):
+        fim = min(ini + linhas, n)
+        bloco = distancias_pares(coords[ini:fim, None], coords[None], tipo)
+        bloco[np.arange(fim - ini), np.arange(ini, fim)] = 0.0
+        matriz[ini:fim] = bloco
+
+    if caminho is not None:
+        matriz.flush()
+        del matriz
+        os.replace(temporario, caminho)
+        return np.load(caminho, mmap_mode="r")
+    return matriz
+
+
+# -----------------------------------------------------------
+# 3️⃣ Leitor TSPLIB
+# -----------------------------------------------------------
+class InstanciaTSP:
+    """
+    Instância lida de um arquivo TSPLIB.
+    - coordenadas: (n, 2) ou None (matriz explícita sem coordenadas)
+    - pesos: matriz explícita (n, n) ou None
+    - tipo: EDGE_WEIGHT_TYPE (EUC_2D, CEIL_2D, ATT, GEO ou EXPLICIT)
+    """
+
+    def __init__(self, nome, tipo, coordenadas=None, pesos=None, cabecalho=None):
+        self.nome = nome
+        self.tipo = tipo
+        self.coordenadas = coordenadas
+        self.pesos = pesos
+        self.cabecalho = cabecalho or {}
+        self.dimensao = len(pesos) if pesos is not None else len(coordenadas)
+
+    def distancias(self, dtype=np.float64, cache_dir=None):
+        """Matriz de distâncias da instância (explícita ou calculada pela métrica)."""
+        if self.pesos is not None:
+            return self.pesos.astype(dtype, copy=False)
+        return matriz_distancias(self.coordenadas, self.tipo, dtype, cache_dir, self.nome)
+
+
+def _matriz_explicita(valores, n, formato):
+    """Monta a matriz simétrica a partir da sequência de pesos no formato TSPLIB."""
+    valores = np.asarray(valores, dtype=float)
+    if formato == "FULL_MATRIX":
+        return valores[:n * n].reshape(n, n)
+    # formatos por coluna percorrem o triângulo oposto na mesma ordem
+    equivalente = {
+        "UPPER_COL": "LOWER_ROW",
+        "LOWER_COL": "UPPER_ROW",
+        "UPPER_DIAG_COL": "LOWER_DIAG_ROW",
+        "LOWER_DIAG_COL": "UPPER_DIAG_ROW",
+    }.get(formato, formato)
+    indices = {
+        "UPPER_ROW": lambda: np.triu_indices(n, 1),
+        "LOWER_ROW": lambda: np.tril_indices(n, -1),
+        "UPPER_DIAG_ROW": lambda: np.triu_indices(n, 0),
+        "LOWER_DIAG_ROW": lambda: np.tril_indices(n, 0),
+    }
+    if equivalente not in indices:
+        raise ValueError(f"EDGE_WEIGHT_FORMAT não suportado: {formato}")
+    i, j = indices[equivalente]()
+    matriz = np.zeros((n, n))
+    matriz[i, j] = valores[:len(i)]
+    matriz[j, i] = valores[:len(i)]
+    return matriz
+
+
+def ler_tsplib(caminho):
+    """Lê um arquivo .tsp da TSPLIB e devolve uma InstanciaTSP."""
+    cabecalho = {}
+    secao = None
+    nos, coords, pesos, exibicao = [], [], [], []
+
+    with open(caminho) as arquivo:
+        for linha in arquivo:
+            linha = linha.strip()
+            if not linha:
+                continue
+            chave = linha.split(":")[0].strip().upper()
+            if chave == "EOF":
+                break
+            if chave in SECOES:
+                secao = chave
+                continue
+            if ":" in linha:
+                cabecalho[chave] = linha.split(":", 1)[1].strip()
+                secao = None
+                continue
+
+            partes = linha.split()
+            if secao == "NODE_COORD_SECTION":
+                nos.append(int(partes[0]))
+                coords.append([float(partes[1]), float(partes[2])])
+            elif secao == "DISPLAY_DATA_SECTION":
+                exibicao.append([float(partes[1]), float(partes[2])])
+            elif secao == "EDGE_WEIGHT_SECTION":
+                pesos.extend(float(p) for p in partes)
+
+    n = int(cabecalho["DIMENSION"])
+    tipo = cabecalho.get("EDGE_WEIGHT_TYPE", "EUC_2D").upper()
+    nome = cabecalho.get("NAME", os.path.splitext(os.path.basename(caminho))[0])
+
+    coordenadas = None
+    if coords:
+        coordenadas = np.array(coords)[np.argsort(nos, kind="stable")]
+    elif exibicao:
+        coordenadas = np.array(exibicao)
+
+    matriz = None
+    if tipo == "EXPLICIT":
+        formato = cabecalho.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX").upper()
+        matriz = _matriz_explicita(pesos, n, formato)
+    elif coordenadas is None:
+        raise ValueError(f"{caminho}: instância sem coordenadas nem matriz explícita")
+
+    return InstanciaTSP(nome, tipo, coordenadas, matriz, cabecalho)